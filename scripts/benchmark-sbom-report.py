@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+SBOM Report Generator Benchmarks
+Renders deterministic synthetic SPDX, CycloneDX and lockfile inputs at several
+sizes and records wall time, peak memory and output size as JSON.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from datetime import datetime
+
+from sbom_report.benchmark import DEFAULT_SIZES, compare, run_benchmarks
+from sbom_report.synthetic import FORMATS
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the SBOM report generator")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated component counts")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated input formats")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the synthetic inventories")
+    parser.add_argument("--work-dir", help="where inputs and PDFs are written (default: a temporary directory)")
+    parser.add_argument("-o", "--output", help="results JSON path (default: sbom-benchmark-<timestamp>.json)")
+    parser.add_argument("--baseline", help="earlier results JSON to compare against")
+    parser.add_argument("--compact", action="store_true", help="render the size-optimized PDF output")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    formats = [fmt for fmt in args.formats.split(",") if fmt]
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="sbom-benchmark-")
+    output = args.output or f"sbom-benchmark-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+
+    print(f"Benchmarking {', '.join(formats)} at {', '.join(map(str, sizes))} components (work dir: {work_dir})")
+    results = run_benchmarks(formats, sizes, work_dir, seed=args.seed, compact=args.compact)
+    with open(output, "w", encoding="utf-8") as fp:
+        json.dump(results, fp, indent=2)
+    print(f"✓ Results written to {os.path.abspath(output)}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fp:
+            compare(json.load(fp), results)
@@ -0,0 +1,6 @@
+"""
+Support modules for the SBOM report generator (scripts/generate-sbom-report.py)
+"""
+
+# Bump when a change alters the rendered output; part of the report cache key
+__version__ = "1.6.1"
@@ -0,0 +1,327 @@
+"""
+Offline vulnerability matching against a local OSV / GHSA advisory dump
+The dump (a directory or zip of OSV JSON files, or an NDJSON file) is loaded
+once into an SQLite index of affected version intervals keyed by ecosystem
+and package name. Matching loads the inventory into a temporary table and
+resolves every component with a single indexed join, so nothing but the
+SQLite page cache is held in memory.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import zipfile
+from collections import namedtuple
+
+from .sbomdoc import normalize_name
+
+SCHEMA_VERSION = 2
+BATCH_SIZE = 5000
+
+# OSV ecosystem -> purl type used in the component store
+OSV_ECOSYSTEMS = {
+    "npm": "npm",
+    "pypi": "pypi",
+    "maven": "maven",
+    "go": "golang",
+    "crates.io": "cargo",
+    "rubygems": "gem",
+    "nuget": "nuget",
+    "packagist": "composer",
+    "pub": "pub",
+    "hex": "hex",
+    "swifturl": "swift",
+}
+
+SEVERITY_ORDER = ("CRITICAL", "HIGH", "MODERATE", "LOW", "UNKNOWN")
+_SEVERITY_ALIASES = {"MEDIUM": "MODERATE"}
+
+Finding = namedtuple("Finding", "name version ecosystem advisory_id severity summary fixed")
+
+_VERSION_PART_RE = re.compile(r'\d+|[A-Za-z]+')
+
+# Release phases; every marker sorts below the "." that starts another release part,
+# so 1.0.0 (any phase) < 1.0.0.1
+_PRE, _RELEASE, _POST = "!", "#", "%"
+# Pre-release labels in precedence order (1.0.dev1 < 1.0a1 < 1.0b1 < 1.0rc1)
+_PRE_LABELS = {"dev": "a0", "a": "a1", "alpha": "a1", "b": "a2", "beta": "a2",
+               "c": "a3", "rc": "a3", "pre": "a3", "preview": "a3"}
+_POST_LABELS = frozenset(("post", "rev", "r", "p", "patch", "sp"))
+_RELEASE_LABELS = frozenset(("final", "ga", "release"))
+
+
+def _version_part(part):
+    part = part.lower()
+    return part.zfill(10) if part.isdigit() else _PRE_LABELS.get(part, part)
+
+
+def version_key(version):
+    """
+    Sortable string for a version so that ranges can be compared in SQL.
+    The numeric release parts compare first, as a tuple of any length with
+    trailing zeros ignored (1.0 == 1.0.0 < 1.0.0.1); then the phase, a
+    pre-release (1.0.0-rc.1, 1.0.0rc1) before the release before a
+    post-release (1.0.0.post1); then the rest of the version. Build metadata
+    is ignored.
+    """
+    version = (version or "").strip().lstrip("vV=")
+    version = version.split("+", 1)[0]
+    release, dash, suffix = version.partition("-")
+    tokens = _VERSION_PART_RE.findall(release)
+    numbers = 0
+    while numbers < len(tokens) and tokens[numbers].isdigit():
+        numbers += 1
+    parts = [part.zfill(10) for part in tokens[:numbers]]
+    while parts and parts[-1] == "0".zfill(10):
+        parts.pop()
+    rest = tokens[numbers:] + _VERSION_PART_RE.findall(suffix)
+    if rest and rest[0].lower() in _RELEASE_LABELS:
+        rest = rest[1:]
+    if not rest and not dash:
+        phase = _RELEASE
+    elif rest and rest[0].lower() in _POST_LABELS:
+        phase, rest = _POST, rest[1:]
+    else:
+        phase = _PRE
+    return ".".join(parts) + phase + ".".join(_version_part(part) for part in rest)
+
+
+def normalize_ecosystem(ecosystem):
+    """OSV ecosystem names (optionally 'Debian:11' style) -> purl type"""
+    base = (ecosystem or "").split(":", 1)[0].strip().lower()
+    return OSV_ECOSYSTEMS.get(base, base)
+
+
+def _severity(advisory):
+    for holder in (advisory.get("database_specific") or {}, *(
+            (affected.get("ecosystem_specific") or {}) for affected in advisory.get("affected") or ())):
+        label = holder.get("severity")
+        if isinstance(label, str) and label:
+            label = label.upper()
+            return _SEVERITY_ALIASES.get(label, label)
+    return "UNKNOWN"
+
+
+def _intervals(range_entry):
+    """Yield (introduced, fixed, last_affected) from an OSV range's events"""
+    introduced = None
+    for event in range_entry.get("events") or ():
+        if "introduced" in event:
+            introduced = event["introduced"]
+        elif introduced is not None and ("fixed" in event or "limit" in event):
+            yield introduced, event.get("fixed") or event.get("limit"), None
+            introduced = None
+        elif introduced is not None and "last_affected" in event:
+            yield introduced, None, event["last_affected"]
+            introduced = None
+    if introduced is not None:
+        yield introduced, None, None
+
+
+def iter_dump(path):
+    """Yield advisories from a directory or zip of OSV JSON files, or an NDJSON file"""
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.endswith(".json"):
+                    with open(os.path.join(root, name), encoding="utf-8") as fp:
+                        yield json.load(fp)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.endswith(".json"):
+                    with archive.open(name) as fp:
+                        yield json.load(fp)
+    else:
+        with open(path, encoding="utf-8") as fp:
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _create_schema(conn):
+    conn.executescript("""
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE advisories (
+            id TEXT PRIMARY KEY, severity TEXT, summary TEXT, aliases TEXT, modified TEXT
+        );
+        CREATE TABLE ranges (
+            ecosystem TEXT, name TEXT, advisory_id TEXT,
+            introduced_key TEXT, fixed_key TEXT, last_key TEXT, fixed TEXT
+        );
+        CREATE TABLE versions (ecosystem TEXT, name TEXT, version TEXT, advisory_id TEXT);
+    """)
+
+
+def _create_indexes(conn):
+    conn.executescript("""
+        CREATE INDEX ranges_package ON ranges (ecosystem, name, introduced_key);
+        CREATE INDEX versions_package ON versions (ecosystem, name, version);
+    """)
+
+
+def build_index(dump_path, index_path):
+    """(Re)build the SQLite index from an advisory dump; returns the advisory count"""
+    tmp_path = index_path + ".building"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        _create_schema(conn)
+        advisories, ranges, versions = [], [], []
+        count = 0
+
+        def flush():
+            conn.executemany("INSERT OR REPLACE INTO advisories VALUES (?, ?, ?, ?, ?)", advisories)
+            conn.executemany("INSERT INTO ranges VALUES (?, ?, ?, ?, ?, ?, ?)", ranges)
+            conn.executemany("INSERT INTO versions VALUES (?, ?, ?, ?)", versions)
+            advisories.clear()
+            ranges.clear()
+            versions.clear()
+
+        for advisory in iter_dump(dump_path):
+            advisory_id = advisory.get("id")
+            if not advisory_id or advisory.get("withdrawn"):
+                continue
+            count += 1
+            advisories.append((
+                advisory_id,
+                _severity(advisory),
+                (advisory.get("summary") or advisory.get("details") or "")[:300],
+                ",".join(advisory.get("aliases") or ()),
+                advisory.get("modified", ""),
+            ))
+            for affected in advisory.get("affected") or ():
+                package = affected.get("package") or {}
+                ecosystem = normalize_ecosystem(package.get("ecosystem"))
+                name = normalize_name(ecosystem, package.get("name", ""))
+                if not name:
+                    continue
+                for range_entry in affected.get("ranges") or ():
+                    if range_entry.get("type") == "GIT":
+                        continue
+                    for introduced, fixed, last in _intervals(range_entry):
+                        ranges.append((
+                            ecosystem, name, advisory_id,
+                            "" if introduced in ("0", "") else version_key(introduced),
+                            version_key(fixed) if fixed else None,
+                            version_key(last) if last else None,
+                            fixed,
+                        ))
+                for version in affected.get("versions") or ():
+                    versions.append((ecosystem, name, version, advisory_id))
+            if len(ranges) + len(versions) >= BATCH_SIZE:
+                flush()
+        flush()
+        _create_indexes(conn)
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("schema_version", str(SCHEMA_VERSION)),
+            ("source", os.path.abspath(dump_path)),
+            ("advisories", str(count)),
+        ])
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, index_path)
+    return count
+
+
+def _schema_version(index_path):
+    conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def ensure_index(index_path, dump_path=None):
+    """Build the index when it is missing, older than the dump or from an older schema"""
+    if dump_path and (not os.path.exists(index_path)
+                      or os.path.getmtime(index_path) < os.path.getmtime(dump_path)
+                      or _schema_version(index_path) != str(SCHEMA_VERSION)):
+        build_index(dump_path, index_path)
+    if not os.path.exists(index_path):
+        raise FileNotFoundError(f"Advisory index not found: {index_path} (build it with --advisory-dump)")
+    return index_path
+
+
+class AdvisoryIndex:
+    """Read-only handle on the SQLite advisory index"""
+
+    def __init__(self, index_path):
+        self.path = index_path
+        self._conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+        self._conn.execute("PRAGMA mmap_size = 268435456")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self.meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        if self.meta.get("schema_version") != str(SCHEMA_VERSION):
+            self._conn.close()
+            raise ValueError(f"Advisory index {index_path} has an older schema; rebuild it with --advisory-dump")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def match(self, dependencies, default_ecosystem="npm"):
+        """
+        Return the findings for every component, sorted by severity then name.
+        Components without an ecosystem are looked up under default_ecosystem.
+        """
+        conn = self._conn
+        conn.execute("DROP TABLE IF EXISTS temp.inventory")
+        conn.execute("CREATE TEMP TABLE inventory (ecosystem TEXT, name TEXT, version TEXT, version_key TEXT, "
+                     "display_name TEXT)")
+        rows = []
+        for deps in dependencies.values():
+            for dep in deps:
+                ecosystem = dep.get('ecosystem') or default_ecosystem
+                version = dep['version']
+                rows.append((ecosystem, normalize_name(ecosystem, dep['name']), version,
+                             version_key(version), dep['name']))
+                if len(rows) >= BATCH_SIZE:
+                    conn.executemany("INSERT INTO inventory VALUES (?, ?, ?, ?, ?)", rows)
+                    rows.clear()
+        conn.executemany("INSERT INTO inventory VALUES (?, ?, ?, ?, ?)", rows)
+
+        query = """
+            SELECT DISTINCT i.display_name, i.version, i.ecosystem, a.id, a.severity, a.summary, r.fixed
+            FROM inventory i
+            JOIN ranges r ON r.ecosystem = i.ecosystem AND r.name = i.name
+                AND r.introduced_key <= i.version_key
+                AND (r.fixed_key IS NULL OR i.version_key < r.fixed_key)
+                AND (r.last_key IS NULL OR i.version_key <= r.last_key)
+            JOIN advisories a ON a.id = r.advisory_id
+            UNION
+            SELECT i.display_name, i.version, i.ecosystem, a.id, a.severity, a.summary, NULL
+            FROM inventory i
+            JOIN versions v ON v.ecosystem = i.ecosystem AND v.name = i.name AND v.version = i.version
+            JOIN advisories a ON a.id = v.advisory_id
+        """
+        found = {}
+        for row in conn.execute(query):
+            finding = Finding(*row)
+            key = (finding.name, finding.version, finding.advisory_id)
+            # Keep the range that names a fixed version when both forms match
+            if key not in found or (finding.fixed and not found[key].fixed):
+                found[key] = finding
+        conn.execute("DROP TABLE temp.inventory")
+        rank = {severity: index for index, severity in enumerate(SEVERITY_ORDER)}
+        return sorted(found.values(), key=lambda f: (rank.get(f.severity, len(rank)), f.name, f.version, f.advisory_id))
+
+
+def severity_counts(findings):
+    counts = {severity: 0 for severity in SEVERITY_ORDER}
+    for finding in findings:
+        counts[finding.severity] = counts.get(finding.severity, 0) + 1
+    return counts
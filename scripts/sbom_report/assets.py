@@ -0,0 +1,182 @@
+"""
+Vendor and asset-name normalization for asset inventory CSVs
+Each distinct value is reduced to a canonical key (case-folded, split on
+punctuation, legal suffixes such as Inc or GmbH dropped), which joins
+variants like "ACME CLOUD" / "Acme Cloud" or "HealthData Inc" /
+"HealthData-Inc" with a dict lookup. The remaining distinct keys are
+matched fuzzily on character trigrams: keys are visited shortest first and
+only probe an inverted index with the rarest trigrams of their prefix, so a
+pair is compared only when it can still reach the Jaccard threshold, and
+matches are joined with union-find. Every group is renamed to its most
+used spelling, and the merge map records each rewrite.
+"""
+
+import csv
+import math
+import re
+from collections import Counter
+
+NORMALIZED_COLUMNS = ("vendor_name", "asset_name")
+DEFAULT_THRESHOLD = 0.8
+
+LEGAL_SUFFIXES = frozenset((
+    "inc", "incorporated", "llc", "llp", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "ag", "sa", "sas", "srl", "spa", "bv", "nv", "plc", "pty", "oy", "ab", "as", "kk",
+))
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def canonical_key(value):
+    """Case-folded alphanumeric tokens without trailing legal suffixes"""
+    tokens = _TOKEN_RE.findall(value.casefold())
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def asset_key(asset_id):
+    """Join key for asset ids: case-folded, any run of separators read as '-'"""
+    return "-".join(_TOKEN_RE.findall(asset_id.casefold()))
+
+
+def trigrams(key):
+    """Character trigrams of a key with its spaces removed and its ends marked"""
+    padded = f"#{key.replace(' ', '')}#"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2)) or frozenset((padded,))
+
+
+def fuzzy_groups(keys, threshold=DEFAULT_THRESHOLD):
+    """
+    Union-find roots for keys: keys whose trigram sets reach the Jaccard
+    threshold, and carry the same numbers, end up under one root. Uses prefix filtering, so the work
+    grows with the candidate pairs rather than with len(keys) squared.
+    """
+    grams = [trigrams(key) for key in keys]
+    # Blocks: "Server 01" and "Server 02" are different things however similar they look
+    numbers = [tuple(_NUMBER_RE.findall(key)) for key in keys]
+    frequency = Counter(gram for key_grams in grams for gram in key_grams)
+    parent = list(range(len(keys)))
+
+    def find(item):
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    index = {}
+    for item in sorted(range(len(keys)), key=lambda item: len(grams[item])):
+        own = grams[item]
+        size = len(own)
+        ordered = sorted(own, key=lambda gram: (frequency[gram], gram))
+        prefix = ordered[:size - math.ceil(threshold * size) + 1]
+        seen = set()
+        block = numbers[item]
+        for gram in prefix:
+            for other in index.get((block, gram), ()):
+                if other in seen:
+                    continue
+                seen.add(other)
+                other_grams = grams[other]
+                # Visited shortest first, so only the length filter against this key applies
+                if len(other_grams) < threshold * size:
+                    continue
+                shared = len(own & other_grams)
+                if shared >= threshold * (size + len(other_grams) - shared):
+                    root, other_root = find(item), find(other)
+                    if root != other_root:
+                        parent[max(root, other_root)] = min(root, other_root)
+        for gram in prefix:
+            index.setdefault((block, gram), []).append(item)
+    return [find(item) for item in range(len(keys))]
+
+
+class MergeMap:
+    """Per column: original value -> (canonical value, rows that carried the original)"""
+
+    def __init__(self):
+        self.columns = {}
+
+    def canonical(self, column, value):
+        entry = self.columns.get(column, {}).get(value)
+        return value if entry is None else entry[0]
+
+    def merges(self):
+        """(column, original, canonical, rows) for every value that was rewritten"""
+        for column, values in self.columns.items():
+            for original, (canonical, rows) in values.items():
+                if original != canonical:
+                    yield column, original, canonical, rows
+
+    def __len__(self):
+        return sum(1 for _ in self.merges())
+
+    def merged_asset_ids(self):
+        """
+        (asset_id, kept asset_id, rows dropped) for every asset id with rows
+        folded into another row: variants such as "app_1" of "App-1" lose
+        all their rows, repeats of the kept id all but the first
+        """
+        for original, (kept, rows) in self.columns.get('asset_id', {}).items():
+            dropped = rows if original != kept else rows - 1
+            if dropped:
+                yield original, kept, dropped
+
+    def write_csv(self, fp):
+        writer = csv.writer(fp)
+        writer.writerow(("column", "original", "canonical", "rows"))
+        writer.writerows(self.merges())
+
+
+def normalize_column(counts, threshold=DEFAULT_THRESHOLD):
+    """
+    Map each original value (counts: value -> rows, in first-seen order)
+    to its group's canonical spelling: the most used one, the first seen on ties
+    """
+    key_of = {value: canonical_key(value) for value in counts}
+    keys = list(dict.fromkeys(key for key in key_of.values() if key))
+    root_of = dict(zip(keys, fuzzy_groups(keys, threshold)))
+    best = {}
+    for value, rows in counts.items():
+        key = key_of[value]
+        if not key:
+            continue
+        root = root_of[key]
+        if root not in best or rows > counts[best[root]]:
+            best[root] = value
+    return {value: (best[root_of[key_of[value]]] if key_of[value] else value, rows) for value, rows in counts.items()}
+
+
+def normalize_assets(assets, columns=NORMALIZED_COLUMNS, threshold=DEFAULT_THRESHOLD):
+    """
+    Reconcile asset rows (dicts from batch.read_assets); returns (rows, MergeMap).
+    Rows whose asset ids only differ in case or separators are one asset and
+    the first row is kept (MergeMap.merged_asset_ids lists the rest); the given columns are rewritten to their
+    canonical spellings.
+    """
+    merge_map = MergeMap()
+    unique = {}
+    ids = {}
+    for asset in assets:
+        key = asset_key(asset['asset_id'])
+        first = unique.setdefault(key, asset)
+        counts = ids.setdefault(asset['asset_id'], [first['asset_id'], 0])
+        counts[1] += 1
+    merge_map.columns['asset_id'] = {original: tuple(entry) for original, entry in ids.items()}
+
+    rows = list(unique.values())
+    for column in columns:
+        counts = Counter(value for value in (row.get(column) for row in rows) if value)
+        merge_map.columns[column] = normalize_column(counts, threshold)
+        for row in rows:
+            value = row.get(column)
+            if value:
+                row[column] = merge_map.canonical(column, value)
+    return rows, merge_map
+
+
+def write_assets(fp, rows, fieldnames):
+    writer = csv.DictWriter(fp, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(rows)
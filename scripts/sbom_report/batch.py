@@ -0,0 +1,386 @@
+"""
+Batch report generation for an asset inventory CSV or the asset database
+The asset rows are first reconciled (assets.normalize_assets: duplicate ids
+joined, vendor and asset names merged to one spelling), then each asset_id
+is matched to an SBOM file, ignoring case and separators, and rendered in a
+pool of worker processes. Every worker builds the stylesheet and loads the fonts once
+and reuses them for all reports it renders, and lays the fixed text of sections
+5-8 and the title page out once to stamp it into every report
+(templates.ReportTemplates); with a history database each
+worker also records a snapshot per asset, keyed by asset_id. With a
+database source (database.AssetDatabase) the assets are paged in from
+Postgres as workers free up, and every worker reads its SBOM documents
+through a pooled connection of its own.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# <id>.json, sbom-<id>.json, sbom-<id>-v2.json, <id>.spdx.json, <id>.cdx.json ...
+SBOM_FILE_RE = re.compile(
+    r'^(?:sbom-)?(?P<asset_id>.+?)(?:-v(?P<version>\d+))?(?:\.(?P<kind>spdx|cdx|cyclonedx|bom))?\.json$',
+    re.IGNORECASE,
+)
+
+# Top-level keys only SPDX and CycloneDX documents start with; plain <id>.json files are sniffed for them
+SBOM_MARKER_RE = re.compile(rb'"(?:spdxVersion|SPDXID|bomFormat)"\s*:')
+SNIFF_BYTES = 8192
+SUMMARY_FILE = 'batch-summary.json'
+# JSON files an SBOM directory may hold that are never SBOMs
+NOT_SBOM_FILES = frozenset((SUMMARY_FILE, 'package.json', 'package-lock.json', 'npm-shrinkwrap.json',
+                            'composer.json', 'tsconfig.json'))
+
+# Failures listed on the console; the summary file always has all of them
+MAX_REPORTED_FAILURES = 20
+
+_worker_styles = None
+_worker_templates = None
+_worker_compact = False
+_worker_advisories = None
+_worker_history = None
+_worker_database = None
+
+
+def read_assets(csv_path):
+    """Yield asset rows (dicts) that carry an asset_id"""
+    with open(csv_path, newline='', encoding='utf-8-sig') as fp:
+        for row in csv.DictReader(fp):
+            asset_id = (row.get('asset_id') or '').strip()
+            if asset_id:
+                row['asset_id'] = asset_id
+                yield row
+
+
+def is_sbom_file(path):
+    """Whether a JSON file starts like an SPDX or CycloneDX document"""
+    try:
+        with open(path, 'rb') as fp:
+            head = fp.read(SNIFF_BYTES)
+    except OSError:
+        return False
+    return SBOM_MARKER_RE.search(head) is not None
+
+
+def index_sbom_files(sbom_dir):
+    """
+    Map asset_id -> path of its newest SBOM file (highest -vN suffix)
+    Files named *.spdx.json, *.cdx.json, *.cyclonedx.json or *.bom.json are
+    taken as SBOMs; other JSON files only when they look like one, so the
+    batch summary, package.json files and lockfiles in the directory are skipped.
+    """
+    best = {}
+    for entry in os.scandir(sbom_dir):
+        if not entry.is_file() or entry.name.lower() in NOT_SBOM_FILES:
+            continue
+        match = SBOM_FILE_RE.match(entry.name)
+        if match is None:
+            continue
+        if match.group('kind') is None and not is_sbom_file(entry.path):
+            continue
+        asset_id = match.group('asset_id')
+        version = int(match.group('version') or 0)
+        current = best.get(asset_id)
+        if current is None or version > current[0]:
+            best[asset_id] = (version, entry.path)
+    return {asset_id: path for asset_id, (version, path) in best.items()}
+
+
+def _safe_filename(value):
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', value).strip('_') or 'asset'
+
+
+class ReportPaths:
+    """
+    Report file names for asset ids. Ids that sanitize to the same name (or
+    differ only in case, for case-insensitive file systems) get a short hash
+    of the asset id appended, so no report overwrites another.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.used = set()
+
+    def __call__(self, asset_id):
+        stem = _safe_filename(asset_id)
+        if stem.lower() in self.used:
+            stem = f"{stem}_{hashlib.sha1(asset_id.encode('utf-8')).hexdigest()[:8]}"
+        self.used.add(stem.lower())
+        return os.path.join(self.output_dir, f"SBOM_Report_{stem}.pdf")
+
+
+def asset_project(asset, base_project):
+    """Project metadata for an asset report, falling back to the base project"""
+    return {
+        'name': asset.get('asset_name') or asset['asset_id'],
+        'version': 'N/A',
+        'vendor': asset.get('vendor_name') or base_project['vendor'],
+        'description': ', '.join(
+            value for value in (asset.get('asset_type'), asset.get('environment'), asset.get('owner_team')) if value
+        ) or base_project['description'],
+        'license': 'NOASSERTION',
+        'report_date': base_project['report_date'],
+        'report_version': base_project['report_version'],
+    }
+
+
+def plan_jobs(csv_path, sbom_dir, output_dir, base_project, cache=None):
+    """
+    Normalize the assets and match them to SBOM files; returns (jobs, asset_ids
+    without an SBOM, MergeMap). cache is an optional (directory, max_bytes)
+    pair handed to the workers.
+    """
+    from .assets import asset_key, normalize_assets
+
+    sbom_files = index_sbom_files(sbom_dir)
+    by_key = {}
+    for asset_id, path in sbom_files.items():
+        by_key.setdefault(asset_key(asset_id), path)
+    assets, merge_map = normalize_assets(read_assets(csv_path))
+    report_path = ReportPaths(output_dir)
+    jobs = []
+    missing = []
+    for asset in assets:
+        asset_id = asset['asset_id']
+        sbom_path = sbom_files.get(asset_id) or by_key.get(asset_key(asset_id))
+        if sbom_path is None:
+            missing.append(asset_id)
+            continue
+        jobs.append((asset_id, sbom_path, report_path(asset_id), asset_project(asset, base_project),
+                     cache))
+    return jobs, missing, merge_map
+
+
+def log_merged_asset_ids(merge_map, log):
+    """Log every asset row dropped as a duplicate id; returns them as summary records"""
+    merged = []
+    for asset_id, kept, rows in merge_map.merged_asset_ids():
+        merge = 'repeated' if asset_id == kept else f"merged into {kept!r}"
+        log(f"  Asset id {asset_id!r} {merge}: {rows} row{'s' if rows != 1 else ''} dropped")
+        merged.append({'asset_id': asset_id, 'kept': kept, 'rows': rows})
+    return merged
+
+
+def init_worker(advisory_index=None, history=None, database=None, boilerplate=None, compact=False):
+    """
+    Build the stylesheet, the report templates (with the organization's
+    boilerplate wording, if any) and load the standard fonts once per worker
+    process, and open the advisory index, history database and asset database
+    (a dict of AssetDatabase arguments) when they are enabled. compact
+    workers write size-optimized PDFs.
+    """
+    global _worker_styles, _worker_templates, _worker_compact, _worker_advisories, _worker_history, _worker_database
+    from reportlab.pdfbase import pdfmetrics
+
+    from .report import create_custom_styles
+    from .templates import ReportTemplates
+
+    for font in ('Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique'):
+        pdfmetrics.getFont(font)
+    _worker_styles = create_custom_styles()
+    _worker_templates = ReportTemplates(boilerplate)
+    _worker_compact = compact
+    if advisory_index:
+        from .advisories import AdvisoryIndex
+        _worker_advisories = AdvisoryIndex(advisory_index)
+    if history:
+        from .history import HistoryStore
+        _worker_history = HistoryStore(history)
+    if database:
+        from .database import AssetDatabase
+        _worker_database = AssetDatabase(min_size=1, max_size=1, **database)
+
+
+def render_store(store, project, output, cache=None):
+    """
+    Render one report with this worker's stylesheet, templates and advisory
+    index. Returns True when the report was served from the cache.
+    """
+    from .cache import ReportCache
+    from .report import generate_sbom_report
+
+    if store.project.get('version'):
+        project = dict(project, version=store.project['version'])
+    findings = _worker_advisories.match(store) if _worker_advisories is not None else None
+
+    def render(path):
+        generate_sbom_report(path, store, project, styles=_worker_styles, findings=findings,
+                             templates=_worker_templates, compact=_worker_compact)
+
+    if cache is None:
+        render(output)
+        return False
+    extra = [findings, _worker_templates.overrides] if _worker_templates.overrides else findings
+    if _worker_compact:
+        extra = [extra, "compact"]
+    return ReportCache(*cache).render(output, store, project, render, extra=extra)
+
+
+def render_job(job):
+    """Render one asset report; runs inside a worker process"""
+    from .ingest import load_components
+
+    asset_id, sbom_path, output, project, cache = job
+    started = time.perf_counter()
+    if _worker_database is not None:
+        store = _worker_database.load_components(asset_id)
+    else:
+        store = load_components(sbom_path)
+    cached = render_store(store, project, output, cache)
+    if _worker_history is not None:
+        _worker_history.record(asset_id, store, source=sbom_path)
+    return asset_id, output, store.size, cached, time.perf_counter() - started
+
+
+def _cache_config(cache_dir, cache_max_bytes):
+    if not cache_dir:
+        return None
+    from .cache import DEFAULT_MAX_BYTES
+    return (cache_dir, cache_max_bytes or DEFAULT_MAX_BYTES)
+
+
+def run_batch(csv_path, sbom_dir, output_dir, base_project, workers=None, log=print,
+              cache_dir=None, cache_max_bytes=None, advisory_index=None, history=None, merge_map_path=None,
+              boilerplate=None, compact=False):
+    """
+    Render a report for every asset in the CSV that has an SBOM file.
+    At most 2 x workers jobs are in flight, progress is logged at roughly 5%
+    steps, and a JSON summary is written to output_dir/batch-summary.json.
+    With cache_dir set, assets whose inventory is unchanged reuse their
+    cached report. With advisory_index set, section 5 lists the advisories
+    matched from that offline vulnerability index. With history set, every
+    rendered asset records a snapshot in that database for trend reports.
+    With merge_map_path set, the vendor/asset-name rewrites are written there
+    as CSV. boilerplate replaces fixed report wording (templates.load_boilerplate),
+    and compact writes size-optimized PDFs.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache = _cache_config(cache_dir, cache_max_bytes)
+    jobs, missing, merge_map = plan_jobs(csv_path, sbom_dir, output_dir, base_project, cache)
+    if merge_map_path:
+        with open(merge_map_path, 'w', newline='', encoding='utf-8') as fp:
+            merge_map.write_csv(fp)
+    merged_ids = log_merged_asset_ids(merge_map, log)
+    workers = workers or os.cpu_count() or 1
+    log(f"Batch: {len(jobs)} assets with SBOMs, {len(missing)} without, {len(merge_map)} names merged, "
+        f"{workers} workers")
+    summary = {'assets_csv': csv_path}
+    summary.update(_run_jobs(jobs, len(jobs), workers, log, (advisory_index, history, None, boilerplate, compact)))
+    summary['missing_sbom'] = missing
+    summary['merged_names'] = len(merge_map)
+    summary['merged_asset_ids'] = merged_ids
+    return _finish(summary, output_dir, log)
+
+
+def database_jobs(database, output_dir, base_project, cache=None, page_size=None):
+    """Jobs for every asset with an SBOM in the asset database, paged in lazily"""
+    from .database import DEFAULT_PAGE_SIZE
+
+    source = database.sbom_table
+    report_path = ReportPaths(output_dir)
+    for asset in database.iter_assets(page_size or DEFAULT_PAGE_SIZE):
+        asset_id = asset['asset_id']
+        yield (asset_id, f"{source}:{asset_id}", report_path(asset_id),
+               asset_project(asset, base_project), cache)
+
+
+def run_database_batch(dsn, output_dir, base_project, workers=None, log=print, cache_dir=None,
+                       cache_max_bytes=None, advisory_index=None, history=None, page_size=None,
+                       assets_table=None, sbom_table=None, boilerplate=None, compact=False):
+    """
+    Render a report for every asset of the asset database with an SBOM, as
+    run_batch does for a CSV. Asset pages are read only as fast as the
+    workers take jobs, so memory does not grow with the number of assets.
+    """
+    from .database import DEFAULT_ASSETS_TABLE, DEFAULT_SBOM_TABLE, AssetDatabase
+
+    os.makedirs(output_dir, exist_ok=True)
+    cache = _cache_config(cache_dir, cache_max_bytes)
+    workers = workers or os.cpu_count() or 1
+    tables = {'assets_table': assets_table or DEFAULT_ASSETS_TABLE, 'sbom_table': sbom_table or DEFAULT_SBOM_TABLE}
+    with AssetDatabase(dsn, min_size=1, max_size=2, **tables) as database:
+        total = database.count_assets()
+        log(f"Batch: {total} assets with SBOMs in {tables['sbom_table']}, {workers} workers")
+        jobs = database_jobs(database, output_dir, base_project, cache, page_size)
+        summary = {'database': tables}
+        summary.update(_run_jobs(jobs, total, workers, log,
+                                 (advisory_index, history, dict(tables, dsn=dsn), boilerplate, compact)))
+    return _finish(summary, output_dir, log)
+
+
+def run_jobs(jobs, total, workers, log, work, on_result, initializer, initargs=()):
+    """
+    Run work(job) for every job (any iterable of tuples led by asset_id and
+    SBOM source) on a process pool. At most 2 x workers jobs are in flight,
+    so jobs are consumed only as workers free up; on_result(job, result) is
+    called in this process as each job completes, and progress is logged at
+    roughly 5% steps. Returns the failure records of the jobs that raised.
+    """
+    started = time.perf_counter()
+    finished = 0
+    failed = []
+    step = max(1, total // 20)
+    pending = {}
+    queue = iter(jobs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        def submit_next():
+            job = next(queue, None)
+            if job is not None:
+                pending[pool.submit(work, job)] = job
+
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = pending.pop(future)
+                try:
+                    on_result(job, future.result())
+                except Exception as e:
+                    failed.append({'asset_id': job[0], 'sbom': job[1], 'error': f"{type(e).__name__}: {e}"})
+                finished += 1
+                if finished % step == 0 or finished == total:
+                    log(f"  [{finished}/{total}] {len(failed)} failed, {time.perf_counter() - started:.1f}s elapsed")
+                submit_next()
+    return failed
+
+
+def _run_jobs(jobs, total, workers, log, initargs):
+    """Render jobs on a process pool; returns the summary counts and records"""
+    started = time.perf_counter()
+    succeeded = []
+
+    def rendered(job, result):
+        asset_id, output, components, cached, elapsed = result
+        succeeded.append({'asset_id': asset_id, 'output': output, 'components': components,
+                          'cached': cached, 'seconds': round(elapsed, 3)})
+
+    failed = run_jobs(jobs, total, workers, log, render_job, rendered, init_worker, initargs)
+    return {
+        'total': len(succeeded) + len(failed),
+        'succeeded': len(succeeded),
+        'failed': len(failed),
+        'cached': sum(1 for item in succeeded if item['cached']),
+        'seconds': round(time.perf_counter() - started, 3),
+        'reports': succeeded,
+        'failures': failed,
+    }
+
+
+def _finish(summary, output_dir, log):
+    """Write batch-summary.json and log the outcome"""
+    failed = summary['failures']
+    with open(os.path.join(output_dir, SUMMARY_FILE), 'w', encoding='utf-8') as fp:
+        json.dump(summary, fp, indent=2)
+
+    log(f"✓ {summary['succeeded']} reports generated in {summary['seconds']}s "
+        f"({summary['cached']} from cache), {len(failed)} failed")
+    for failure in failed[:MAX_REPORTED_FAILURES]:
+        log(f"  ✗ {failure['asset_id']}: {failure['error']}")
+    if len(failed) > MAX_REPORTED_FAILURES:
+        log(f"  ... {len(failed) - MAX_REPORTED_FAILURES} more in batch-summary.json")
+    return summary
@@ -0,0 +1,134 @@
+"""
+Benchmark harness for the report generator
+Each (format, size) case runs in a fresh worker process so that peak RSS
+belongs to that case alone. A case measures the full ingest + render path
+with the phase profiler, and each section builder on its own for wall time
+and traced allocation peak. Output size is also recorded per component, the
+figure the size-optimized (compact) output is judged by.
+"""
+
+import os
+import platform
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from . import __version__
+from .profiling import PhaseProfiler, peak_rss_mb
+from .synthetic import write_synthetic
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+BENCHMARK_PROJECT = {
+    "name": "Synthetic Benchmark Application",
+    "version": "1.0.0",
+    "vendor": "ERMITS Corporation",
+    "description": "Synthetic inventory for generator benchmarks",
+    "license": "MIT",
+    "report_date": "2000-01-01 00:00:00",
+    "report_version": "1.0",
+}
+
+
+def _section_builders(store, compact=False):
+    from .graph import analyze_graph
+    from .report import create_component_table, create_license_summary, create_summary_table
+    from .stats import compute_stats
+
+    stats = compute_stats(store)
+    return (
+        ("compute_stats", lambda: compute_stats(store)),
+        ("analyze_graph", lambda: analyze_graph(store)),
+        ("create_summary_table", lambda: create_summary_table(stats)),
+        ("create_license_summary", lambda: create_license_summary(stats)),
+        ("create_component_table",
+         lambda: [create_component_table(deps, compact) for deps in store.values()]),
+    )
+
+
+def run_case(fmt, path, size, output_dir, compact=False):
+    """Benchmark one input; runs in its own worker process"""
+    from .ingest import load_components
+    from .report import generate_sbom_report
+
+    output = os.path.join(output_dir, f"benchmark-{fmt}-{size}.pdf")
+    profiler = PhaseProfiler()
+    started = time.perf_counter()
+    with profiler.phase("ingest"):
+        store = load_components(path)
+    generate_sbom_report(output, store, BENCHMARK_PROJECT, profiler=profiler, compact=compact)
+    wall = time.perf_counter() - started
+    profile = profiler.report()
+    rss = peak_rss_mb()
+
+    sections = {}
+    for name, build in _section_builders(store, compact):
+        section_started = time.perf_counter()
+        build()
+        sections[name] = {"seconds": round(time.perf_counter() - section_started, 4)}
+    tracemalloc.start()
+    for name, build in _section_builders(store, compact):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = build()
+        sections[name]["peak_alloc_mb"] = round((tracemalloc.get_traced_memory()[1] - baseline) / 2**20, 2)
+        del result
+    tracemalloc.stop()
+
+    output_bytes = os.path.getsize(output)
+    return {
+        "format": fmt,
+        "size": size,
+        "components": store.size,
+        "input_bytes": os.path.getsize(path),
+        "wall_seconds": round(wall, 4),
+        "phases": profile["phases"],
+        "pages": profile["counters"].get("pages"),
+        "output_bytes": output_bytes,
+        "bytes_per_component": round(output_bytes / store.size, 1) if store.size else None,
+        "peak_rss_mb": rss,
+        "sections": sections,
+    }
+
+
+def run_benchmarks(formats, sizes, work_dir, seed=1, log=print, compact=False):
+    """Generate inputs and benchmark every (format, size) case, optionally with compact output"""
+    import reportlab
+
+    os.makedirs(work_dir, exist_ok=True)
+    results = {
+        "generator_version": __version__,
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "reportlab": reportlab.Version,
+        "seed": seed,
+        "compact": compact,
+        "cases": [],
+    }
+    for size in sizes:
+        for fmt in formats:
+            path = write_synthetic(fmt, work_dir, size, seed)
+            # A fresh process per case keeps peak RSS and warm caches separate
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                case = pool.submit(run_case, fmt, path, size, work_dir, compact).result()
+            results["cases"].append(case)
+            log(f"  {fmt:<10} {size:>7}  {case['wall_seconds']:>8.2f}s  "
+                f"{case['peak_rss_mb'] or 0:>7.1f} MB  {case['output_bytes'] / 1024:>9.0f} KB  "
+                f"{case['bytes_per_component'] or 0:>7.1f} B/component  {case['pages']} pages")
+    return results
+
+
+def compare(baseline, current, log=print):
+    """Log wall time, peak RSS and output size ratios of current against a baseline run"""
+    previous = {(case["format"], case["size"]): case for case in baseline["cases"]}
+    log(f"Compared with {baseline.get('generator_version')} ({baseline.get('started')}):")
+    for case in current["cases"]:
+        old = previous.get((case["format"], case["size"]))
+        if old is None:
+            continue
+        wall = case["wall_seconds"] / old["wall_seconds"] if old["wall_seconds"] else float("nan")
+        rss = (case["peak_rss_mb"] or 0) / old["peak_rss_mb"] if old.get("peak_rss_mb") else float("nan")
+        size = case["output_bytes"] / old["output_bytes"] if old.get("output_bytes") else float("nan")
+        log(f"  {case['format']:<10} {case['size']:>7}  wall x{wall:.2f}  rss x{rss:.2f}  bytes x{size:.2f}")
@@ -0,0 +1,136 @@
+"""
+Content-addressed report cache
+A report is keyed by a hash of the normalized component list, the project
+metadata (without the report date) and the generator version/sources. When
+the key is already cached the stored PDF is copied out instead of running
+doc.build again; the copy keeps the report date of its original render.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from . import __version__
+from .options import DEFAULT_CACHE_MAX_BYTES as DEFAULT_MAX_BYTES
+
+# Project fields that change on every run without changing the report content
+VOLATILE_PROJECT_FIELDS = ("report_date",)
+
+_fingerprint = None
+
+
+def generator_fingerprint():
+    """Version plus a hash of this package's sources, computed once per process"""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(__version__.encode())
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(package_dir)):
+            if name.endswith(".py"):
+                with open(os.path.join(package_dir, name), "rb") as fp:
+                    digest.update(name.encode())
+                    digest.update(fp.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def report_key(dependencies, project, extra=None):
+    """Hash of the normalized inventory, stable project fields and generator"""
+    digest = hashlib.sha256(generator_fingerprint().encode())
+    stable = {key: value for key, value in project.items() if key not in VOLATILE_PROJECT_FIELDS}
+    digest.update(json.dumps(stable, sort_keys=True, default=str).encode())
+    if extra is not None:
+        digest.update(json.dumps(extra, sort_keys=True, default=str).encode())
+    for scope in sorted(dependencies):
+        digest.update(f"\x1e{scope}\n".encode())
+        rows = sorted((dep['name'], dep['version'], dep['license'], dep['type']) for dep in dependencies[scope])
+        for row in rows:
+            digest.update("\x1f".join(row).encode())
+            digest.update(b"\n")
+    # Relationships feed the transitive dependency section
+    edge_sources = getattr(dependencies, "edge_sources", ())
+    if edge_sources:
+        names, versions = dependencies.names, dependencies.versions
+        edges = sorted({(names[source], versions[source], names[target], versions[target])
+                        for source, target in zip(edge_sources, dependencies.edge_targets)})
+        digest.update(b"\x1e")
+        for edge in edges:
+            digest.update("\x1f".join(edge).encode())
+            digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class ReportCache:
+    """Directory of cached PDFs named by key, evicted oldest-first by total size"""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def fetch(self, key, output):
+        """Copy the cached report to output; False on a miss"""
+        path = self._path(key)
+        try:
+            shutil.copyfile(path, output)
+        except FileNotFoundError:
+            return False
+        # Refresh the mtime so eviction treats the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return True
+
+    def put(self, key, source):
+        """Store a rendered report atomically, then enforce the size limit"""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".pdf"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        entries.sort()
+        for mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def render(self, output, dependencies, project, render, extra=None):
+        """
+        Produce output from the cache or by calling render(output).
+        Returns True when the report was served from the cache.
+        """
+        key = report_key(dependencies, project, extra)
+        if self.fetch(key, output):
+            return True
+        render(output)
+        self.put(key, output)
+        return False
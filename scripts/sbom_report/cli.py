@@ -0,0 +1,802 @@
+"""
+Command line interface
+    render    PDF report for one lockfile / SBOM (the default command)
+    watch     re-render the report whenever the lockfile, package.json or SBOM changes
+    summary   component and license counts as text or JSON
+    export    component inventory as CSV, NDJSON, JSON, CycloneDX or SPDX
+    validate  inventory checks; exit 1 on errors
+    policy    license verdicts against an allow/deny/review policy; exit 3 on deny
+    normalize reconciled asset CSV and vendor/asset-name merge map
+    diff      changes between two SBOM versions
+    batch     one report per asset of an asset inventory CSV or the asset database
+    portfolio roll-up report across a directory of SBOMs
+    serve     local report service
+    trend     dependency count, license mix and churn over recorded runs
+Exit codes (EXIT_*): 0 success, 1 failed report or check, 2 unreadable input
+or usage error, 3 license policy deny (render --policy and policy).
+Only render, watch, diff, batch, portfolio and serve import ReportLab, and only once they run,
+so summary, export, validate, policy, normalize and trend start without loading the PDF toolkit.
+render and export also take repeated --export FORMAT[=PATH] options that
+write further formats from the same ingest pass.
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+from functools import partial
+
+from .options import DEFAULT_CACHE_MAX_BYTES, EXPORT_SUFFIXES, PERIODS
+
+DEFAULT_OUTPUT = "SBOM_Report_CyberSoluce_AssetManager.pdf"
+DEFAULT_DIFF_OUTPUT = "SBOM_Diff_Report.pdf"
+DEFAULT_PORTFOLIO_OUTPUT = "SBOM_Portfolio_Report.pdf"
+COMMANDS = ("render", "watch", "summary", "export", "validate", "policy", "normalize", "diff", "batch", "portfolio", "serve", "trend")
+
+# Exit codes shared by every command (argparse usage errors exit 2 as well)
+EXIT_OK = 0
+# A report or check failed, or a required library is missing
+EXIT_ERROR = 1
+# The input inventory could not be read
+EXIT_INPUT_ERROR = 2
+# The license policy denies a component (or, with --strict, wants one reviewed)
+EXIT_POLICY_DENY = 3
+
+
+def _input_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("input", nargs="?",
+                        help="package-lock.json, SPDX 2.x or CycloneDX JSON (default: the built-in dependency table)")
+    parser.add_argument("--input-format", choices=("auto", "lockfile", "sbom"), default="auto",
+                        help="how to read INPUT (default: lockfiles by file name, anything else as an SBOM)")
+    parser.add_argument("--lockfile", help=argparse.SUPPRESS)
+    parser.add_argument("--sbom", help=argparse.SUPPRESS)
+    parser.add_argument("--package-json", help="package.json listing the direct dependencies (defaults to the one next to the lockfile)")
+    return parser
+
+
+def _project_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--project", metavar="JSON", help="JSON file with project metadata overriding the built-in project")
+    parser.add_argument("--name", help="project name shown in the report")
+    parser.add_argument("--project-version", help="project version shown in the report")
+    return parser
+
+
+def _advisory_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--advisories", metavar="INDEX",
+                        help="SQLite advisory index used to list known vulnerabilities in section 5")
+    parser.add_argument("--advisory-dump", metavar="PATH",
+                        help="OSV/GHSA advisory dump (directory, zip or NDJSON); (re)builds --advisories when newer")
+    return parser
+
+
+def _cache_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--cache-dir", help="reuse previously rendered reports whose inventory and project metadata are unchanged")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024), help="size limit of the report cache")
+    return parser
+
+
+def _history_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--history", metavar="DB",
+                        help="SQLite history database; every rendered report records a snapshot for 'trend'")
+    return parser
+
+
+def _boilerplate_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--boilerplate", metavar="JSON",
+                        help="JSON file replacing the fixed wording of sections 5-8 and the title page notice "
+                             "(keys: security, compliance, recommendations, appendices, notice)")
+    return parser
+
+
+def _compact_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--compact", action="store_true",
+                        help="size-optimized PDF: binary compressed streams, one grid path per table page, "
+                             "shared page resources")
+    return parser
+
+
+def _export_parser():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--export", action="append", default=[], metavar="FORMAT[=PATH]",
+                        help=f"also write the inventory as {'/'.join(EXPORT_SUFFIXES)} to PATH ('-' for stdout; "
+                             "default: next to the output, named by format); repeatable")
+    return parser
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="generate-sbom-report.py", description="SBOM reports and inventory exports",
+        epilog=f"exit codes: {EXIT_OK} success, {EXIT_ERROR} failed report or check, {EXIT_INPUT_ERROR} unreadable "
+               f"input or usage error, {EXIT_POLICY_DENY} license policy deny")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    inputs, project, advisories, cache = _input_parser(), _project_parser(), _advisory_parser(), _cache_parser()
+    exports, history, boilerplate = _export_parser(), _history_parser(), _boilerplate_parser()
+    compact = _compact_parser()
+
+    render = commands.add_parser("render",
+                                 parents=[inputs, project, boilerplate, compact, advisories, cache, exports, history],
+                                 help="render the PDF report")
+    render.add_argument("-o", "--output", default=DEFAULT_OUTPUT,
+                        help=f"output PDF path ('-' for stdout, default: {DEFAULT_OUTPUT})")
+    render.add_argument("--workers", type=int, default=1,
+                        help="lay the report out in parts on this many worker processes and merge them "
+                             "(needs pypdf; default: 1, a single pass)")
+    render.add_argument("--profile", nargs="?", const="-", metavar="PATH",
+                        help="write per-phase timings, counts and peak RSS as JSON to PATH (default: stdout)")
+    render.add_argument("--policy", metavar="FILE",
+                        help=f"JSON license policy; lists its violations in section 6.4 and exits "
+                             f"{EXIT_POLICY_DENY} on deny")
+    render.add_argument("--policy-verdicts", metavar="PATH",
+                        help="write the policy verdicts as JSON to PATH ('-' for stdout); needs --policy")
+
+    watch = commands.add_parser("watch", parents=[inputs, project, boilerplate],
+                                help="re-render the report whenever its input changes (needs pypdf)")
+    watch.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"output PDF path (default: {DEFAULT_OUTPUT})")
+    watch.add_argument("--interval", type=float, default=None, help="seconds between polls of the inputs (default: 0.2)")
+    watch.add_argument("--debounce", type=float, default=None,
+                       help="seconds the inputs must stay unchanged before a rebuild (default: 0.3)")
+
+    summary = commands.add_parser("summary", parents=[inputs], help="print component and license counts")
+    summary.add_argument("--format", choices=("text", "json"), default="text")
+    summary.add_argument("-o", "--output", default="-", help="output path ('-' for stdout)")
+
+    export = commands.add_parser("export", parents=[inputs, project, exports], help="export the component inventory")
+    export.add_argument("--format", choices=tuple(EXPORT_SUFFIXES), default="csv")
+    export.add_argument("-o", "--output", default="-", help="output path ('-' for stdout)")
+
+    validate = commands.add_parser("validate", parents=[inputs], help="check an inventory for missing or malformed data")
+    validate.add_argument("--format", choices=("text", "json"), default="text")
+    validate.add_argument("--strict", action="store_true", help="exit nonzero on warnings too")
+
+    policy = commands.add_parser("policy", parents=[inputs],
+                                 help="evaluate component licenses against an allow/deny/review policy")
+    policy.add_argument("--policy", required=True, metavar="FILE", help="JSON license policy")
+    policy.add_argument("--format", choices=("text", "json"), default="text",
+                        help="text summary or the JSON verdict file (default: text)")
+    policy.add_argument("-o", "--output", default="-", help="output path ('-' for stdout)")
+    policy.add_argument("--strict", action="store_true", help=f"exit {EXIT_POLICY_DENY} on review verdicts too")
+
+    normalize = commands.add_parser("normalize",
+                                    help="merge near-duplicate vendor and asset names in an asset inventory CSV")
+    normalize.add_argument("assets", help="asset inventory CSV")
+    normalize.add_argument("-o", "--output", default="-", help="normalized CSV path ('-' for stdout)")
+    normalize.add_argument("--merge-map", metavar="PATH", help="write the original -> canonical names as CSV to PATH")
+    normalize.add_argument("--threshold", type=float, default=None,
+                           help="trigram Jaccard similarity at which two names are merged (default: 0.8; "
+                                "1 merges only case, punctuation and legal-suffix variants)")
+
+    diff = commands.add_parser("diff", parents=[project],
+                               help="report added/removed/upgraded/license-changed components between two SBOM versions")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    diff.add_argument("-o", "--output", help=f"output PDF path (default: {DEFAULT_DIFF_OUTPUT} unless --json is '-')")
+    diff.add_argument("--json", metavar="PATH", help="also write the diff as JSON to PATH ('-' for stdout)")
+
+    batch = commands.add_parser("batch", parents=[project, boilerplate, compact, advisories, cache, history],
+                                help="render one report per asset_id with a matching SBOM file "
+                                     "or per asset with an SBOM in the asset database")
+    batch.add_argument("assets", nargs="?", help="asset inventory CSV (not with --database)")
+    batch.add_argument("--sbom-dir", default=".", help="directory searched for per-asset SBOM files")
+    batch.add_argument("--output-dir", default="sbom-reports", help="directory for the reports")
+    batch.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    batch.add_argument("--merge-map", metavar="PATH",
+                       help="write the vendor/asset-name merges applied to the CSV to PATH")
+    batch.add_argument("--database", nargs="?", const="", metavar="DSN",
+                       help="read assets and SBOMs from Postgres instead of a CSV (needs psycopg and psycopg_pool; "
+                            "default DSN: $SBOM_DATABASE_URL or $DATABASE_URL)")
+    batch.add_argument("--page-size", type=int, default=None,
+                       help="assets read per keyset page from the database (default: 500)")
+    batch.add_argument("--assets-table", default=None, help="assets table (default: assets)")
+    batch.add_argument("--sbom-table", default=None,
+                       help="table of SBOM documents with asset_id, document and created_at (default: asset_sboms)")
+
+    portfolio = commands.add_parser("portfolio", parents=[project, advisories],
+                                    help="roll-up report of package spread, license exposure and shared "
+                                         "vulnerable versions across a directory of SBOMs")
+    portfolio.add_argument("sbom_dir", help="directory of per-asset SBOM files, named as for batch")
+    portfolio.add_argument("--assets", metavar="CSV", help="asset inventory CSV naming the assets in the report")
+    portfolio.add_argument("-o", "--output",
+                           help=f"output PDF path (default: {DEFAULT_PORTFOLIO_OUTPUT} unless --json is '-')")
+    portfolio.add_argument("--json", metavar="PATH", help="also write the roll-up as JSON to PATH ('-' for stdout)")
+    portfolio.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+
+    # Uploads name their own product (or pass ?name=), so serve takes no project options
+    serve = commands.add_parser("serve", parents=[compact, advisories],
+                                help="render POSTed SBOMs on warm worker processes")
+    serve.add_argument("--host", default="127.0.0.1", help="listen address")
+    serve.add_argument("--port", type=int, help="TCP port (default: 8765)")
+    serve.add_argument("--socket", metavar="PATH", help="serve on a Unix socket instead of TCP")
+    serve.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    serve.add_argument("--max-pending", type=int, default=None,
+                       help="requests allowed to wait for a worker before the service answers 503 (default: 4 x workers)")
+
+    trend = commands.add_parser("trend", help="dependency count, license mix and churn over the runs in a history database")
+    trend.add_argument("history", metavar="DB", help="history database written by render/batch --history")
+    trend.add_argument("--project", dest="projects", action="append", metavar="NAME",
+                       help="only this project (batch: asset_id); repeatable (default: every project)")
+    trend.add_argument("--since", metavar="DATE", help="first day (YYYY-MM-DD) or ISO time to include")
+    trend.add_argument("--until", metavar="DATE", help="last day (YYYY-MM-DD) or ISO time to include")
+    trend.add_argument("--period", choices=tuple(PERIODS), default="day",
+                       help="group snapshots by period; counts come from each project's last snapshot in it "
+                            "(default: day)")
+    trend.add_argument("--list", action="store_true", help="list the recorded projects instead")
+    trend.add_argument("--format", choices=("text", "json", "csv"), default="text")
+    trend.add_argument("-o", "--output", default="-", help="output path ('-' for stdout)")
+    return parser
+
+
+def parse_args(argv):
+    """Parse argv; a command line without a command (the old flag-only form) means render"""
+    argv = list(argv)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "render")
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "lockfile", None) or getattr(args, "sbom", None):
+        if args.input:
+            parser.error("give the input either as INPUT or with --lockfile/--sbom, not both")
+        args.input = args.lockfile or args.sbom
+        args.input_format = "lockfile" if args.lockfile else "sbom"
+    return parser, args
+
+
+def load_project(args, default_project, store=None):
+    """
+    Project metadata: the built-in project, overridden by the name and version
+    the inventory (store) carries for its own product, then by --project,
+    --name and --project-version
+    """
+    project = dict(default_project)
+    if store is not None:
+        project.update((key, store.project[key]) for key in ("name", "version") if store.project.get(key))
+    if getattr(args, "project", None):
+        with open(args.project, encoding="utf-8") as fp:
+            project.update(json.load(fp))
+    if getattr(args, "name", None):
+        project["name"] = args.name
+    if getattr(args, "project_version", None):
+        project["version"] = args.project_version
+    return project
+
+
+def load_inventory(args, default_dependencies):
+    """ComponentStore for the command's input, or the built-in table when none is given"""
+    from .ingest import load_components
+    from .model import ComponentStore
+
+    if args.input:
+        return load_components(args.input, args.package_json, args.input_format)
+    return ComponentStore.from_dependencies(default_dependencies)
+
+
+def _advisory_index(parser, args):
+    if args.advisories:
+        from .advisories import ensure_index
+        return ensure_index(args.advisories, args.advisory_dump)
+    if args.advisory_dump:
+        parser.error("--advisory-dump requires --advisories")
+    return None
+
+
+def _load_policy(parser, path):
+    from .policy import PolicyError, load_policy
+
+    try:
+        return load_policy(path)
+    except (OSError, PolicyError) as e:
+        parser.error(f"--policy: {e}")
+
+
+def _load_boilerplate(parser, path):
+    from .templates import load_boilerplate
+
+    try:
+        return load_boilerplate(path)
+    except (OSError, ValueError) as e:
+        parser.error(f"--boilerplate: {e}")
+
+
+def _report_templates(parser, args):
+    """ReportTemplates with the --boilerplate wording, or None without the option"""
+    if not args.boilerplate:
+        return None
+    from .templates import ReportTemplates
+    return ReportTemplates(_load_boilerplate(parser, args.boilerplate))
+
+
+def parse_exports(parser, specs, output):
+    """FORMAT[=PATH] options -> (format, path) pairs; paths default to output's stem plus the format suffix"""
+    stem = os.path.splitext(output)[0] if output and output != "-" else "sbom"
+    exports = []
+    for spec in specs:
+        export_format, _, path = spec.partition("=")
+        if export_format not in EXPORT_SUFFIXES:
+            parser.error(f"--export: unknown format {export_format!r} (choose from {', '.join(EXPORT_SUFFIXES)})")
+        exports.append((export_format, path or stem + EXPORT_SUFFIXES[export_format]))
+    if sum(1 for _, path in exports if path == "-") > 1:
+        parser.error("--export: only one format can be written to stdout")
+    return exports
+
+
+def write_exports(exports, store, project, status=sys.stdout):
+    """Write every requested format from the one already loaded store"""
+    from .exporters import EXPORTERS
+
+    for export_format, path in exports:
+        writer = EXPORTERS[export_format][0]
+        with _open_output(path) as fp:
+            writer(fp, store, project)
+        if path != "-":
+            print(f"✓ {export_format} export written: {path}", file=status)
+
+
+def _open_output(path):
+    if path == "-":
+        return open(sys.stdout.fileno(), "w", encoding="utf-8", newline="", closefd=False)
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+class BinaryOutput:
+    """
+    Binary file object over stdout that counts the bytes written
+    The PDF writers only write and ask for the position (pypdf), so a pipe
+    works as well as a file.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout.buffer
+        self.written = 0
+
+    def write(self, data):
+        self.stream.write(data)
+        self.written += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.written
+
+    def flush(self):
+        self.stream.flush()
+
+
+def generate_sbom_report(filename, dependencies, project, cache=None, profiler=None, advisory_index=None, workers=1,
+                         policy=None, templates=None, compact=False):
+    """
+    Render the complete SBOM report, reusing a cached copy when nothing changed
+    filename is a path or (without a cache) a binary file object. With
+    workers > 1 the report is laid out in parts on worker processes.
+    policy is a policy.PolicyResult listed in section 6.4, templates a
+    templates.ReportTemplates carrying the organization's boilerplate, and
+    compact asks for the size-optimized PDF.
+    """
+    from . import report
+    from .profiling import NULL_PROFILER
+
+    profiler = profiler or NULL_PROFILER
+    findings = None
+    if advisory_index:
+        from .advisories import AdvisoryIndex
+        with profiler.phase("advisories"), AdvisoryIndex(advisory_index) as index:
+            findings = index.match(dependencies)
+        profiler.count("findings", len(findings))
+
+    def render(output):
+        if workers > 1:
+            from . import parallel
+            parallel.generate_sbom_report(output, dependencies, project, workers, profiler=profiler, findings=findings,
+                                          policy=policy, templates=templates, compact=compact)
+        else:
+            report.generate_sbom_report(output, dependencies, project, profiler=profiler, findings=findings,
+                                        policy=policy, templates=templates, compact=compact)
+
+    extra = findings if policy is None else [findings, policy.as_dict()]
+    if templates is not None and templates.overrides:
+        extra = [extra, templates.overrides]
+    if compact:
+        extra = [extra, "compact"]
+    if cache is not None and cache.render(filename, dependencies, project, render, extra=extra):
+        print(f"✓ SBOM Report unchanged, reused cached copy: {filename}")
+    else:
+        if cache is None:
+            render(filename)
+        name = filename if isinstance(filename, str) else "stdout"
+        print(f"✓ SBOM Report generated successfully: {name}")
+    return filename
+
+
+def generate_diff_report(old_path, new_path, project, filename=None, json_path=None):
+    """
+    Render the added/removed/upgraded/license-changed report between two SBOMs
+    (lockfiles work too). project is the metadata dict, or a callable that
+    resolves it from the new inventory.
+    """
+    from .diff import collect_changes, diff_summary, write_diff_json
+    from .ingest import load_components
+
+    old = load_components(old_path)
+    new = load_components(new_path)
+    changes = collect_changes(old, new)
+    summary = diff_summary(old, new, changes)
+    old_label, new_label = os.path.basename(old_path), os.path.basename(new_path)
+    # Keep stdout clean when the JSON is written there
+    status = sys.stderr if json_path == "-" else sys.stdout
+
+    if json_path == "-":
+        write_diff_json(sys.stdout, summary, changes, old_label, new_label)
+    elif json_path:
+        with open(json_path, "w", encoding="utf-8") as fp:
+            write_diff_json(fp, summary, changes, old_label, new_label)
+        print(f"✓ SBOM diff written: {json_path}", file=status)
+    if filename:
+        from . import report
+        if callable(project):
+            project = project(new)
+        report.generate_diff_report(filename, summary, changes, old_label, new_label, project)
+        print(f"✓ SBOM diff report generated successfully: {filename}", file=status)
+    return summary
+
+
+def cmd_render(parser, args, default_project, default_dependencies):
+    from .profiling import NULL_PROFILER, PhaseProfiler
+
+    advisory_index = _advisory_index(parser, args)
+    exports = parse_exports(parser, args.export, args.output)
+    if args.policy_verdicts and not args.policy:
+        parser.error("--policy-verdicts requires --policy")
+    license_policy = _load_policy(parser, args.policy) if args.policy else None
+    templates = _report_templates(parser, args)
+    # Keep stdout clean when an export or the verdicts are written there
+    to_stdout = args.policy_verdicts == "-" or any(path == "-" for _, path in exports)
+    if args.output == "-":
+        if to_stdout or args.profile == "-":
+            parser.error("-o -: the PDF is the only output written to stdout; give the others a PATH")
+        if args.cache_dir:
+            parser.error("--cache-dir needs an output path, not '-'")
+        to_stdout = True
+    status = sys.stderr if to_stdout else sys.stdout
+    verdicts = None
+    try:
+        profiler = PhaseProfiler() if args.profile else NULL_PROFILER
+        with profiler.phase("ingest"):
+            store = load_inventory(args, default_dependencies)
+        project = load_project(args, default_project, store)
+        if exports:
+            with profiler.phase("export"):
+                write_exports(exports, store, project, status)
+        if license_policy is not None:
+            from .policy import write_verdicts
+
+            with profiler.phase("policy"):
+                verdicts = license_policy.evaluate(store)
+            if args.policy_verdicts:
+                with _open_output(args.policy_verdicts) as fp:
+                    write_verdicts(fp, verdicts)
+        cache = None
+        if args.cache_dir:
+            from .cache import ReportCache
+            cache = ReportCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+        output = BinaryOutput() if args.output == "-" else args.output
+        with contextlib.redirect_stdout(status):
+            generate_sbom_report(output, store, project, cache=cache, profiler=profiler,
+                                 advisory_index=advisory_index, workers=args.workers, policy=verdicts,
+                                 templates=templates, compact=args.compact)
+        if args.output == "-":
+            output.flush()
+        if args.history:
+            from .history import HistoryStore
+
+            with profiler.phase("history"), HistoryStore(args.history) as history:
+                history.record(project["name"], store, source=args.input or "")
+        if args.profile:
+            profiler.count("output_bytes", output.written if args.output == "-" else os.path.getsize(args.output))
+            profiler.write(args.profile)
+    except ImportError as e:
+        library = "pypdf" if e.name == "pypdf" else "reportlab"
+        print(f"Error: Missing required library. Please install {library}:", file=status)
+        print(f"  pip install {library}", file=status)
+        print(f"\nOriginal error: {e}", file=status)
+        return EXIT_ERROR
+    except Exception as e:
+        print(f"Error generating report: {e}", file=status)
+        import traceback
+        traceback.print_exc()
+        return EXIT_ERROR
+    if verdicts is not None:
+        print(f"License policy: {verdicts.verdict} ({len(verdicts.violations)} components not allowed)", file=status)
+        if verdicts.denied:
+            return EXIT_POLICY_DENY
+    return EXIT_OK
+
+
+def cmd_watch(parser, args, default_project, default_dependencies):
+    from .watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, InventorySource, watch
+
+    if not args.input:
+        parser.error("watch needs an INPUT file")
+    source = InventorySource(args.input, args.package_json, args.input_format)
+    try:
+        watch(source, args.output, partial(load_project, args, default_project),
+              interval=DEFAULT_INTERVAL if args.interval is None else args.interval,
+              debounce=DEFAULT_DEBOUNCE if args.debounce is None else args.debounce,
+              templates=_report_templates(parser, args))
+    except ImportError as e:
+        library = "pypdf" if e.name == "pypdf" else "reportlab"
+        print(f"Error: Missing required library. Please install {library}:")
+        print(f"  pip install {library}")
+        print(f"\nOriginal error: {e}")
+        return EXIT_ERROR
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def cmd_summary(parser, args, default_project, default_dependencies):
+    from .stats import compute_stats
+
+    stats = compute_stats(load_inventory(args, default_dependencies), example_limit=0)
+    with _open_output(args.output) as fp:
+        if args.format == "json":
+            json.dump(stats.as_dict(), fp, indent=2)
+            fp.write("\n")
+            return EXIT_OK
+        fp.write(f"Total components:  {stats.total}\n")
+        for scope in stats.scopes():
+            fp.write(f"  {scope + ':':<16} {stats.scope_count(scope)}\n")
+        fp.write(f"Unique licenses:   {stats.unique_licenses}\n")
+        fp.write(f"Primary license:   {stats.primary_license}\n")
+        fp.write(f"Permissive:        {stats.permissive_count} ({stats.percentage(stats.permissive_count):.1f}%)\n")
+        fp.write(f"Copyleft:          {stats.copyleft_count} ({stats.percentage(stats.copyleft_count):.1f}%)\n")
+        fp.write(f"Unrecognized:      {stats.unknown_count} ({stats.percentage(stats.unknown_count):.1f}%)\n")
+        fp.write("Licenses:\n")
+        for expression, count in stats.licenses():
+            fp.write(f"  {count:>8}  {expression}\n")
+    return EXIT_OK
+
+
+def cmd_export(parser, args, default_project, default_dependencies):
+    exports = [(args.format, args.output)] + parse_exports(parser, args.export, args.output)
+    if sum(1 for _, path in exports if path == "-") > 1:
+        parser.error("--export: only one format can be written to stdout")
+    status = sys.stderr if any(path == "-" for _, path in exports) else sys.stdout
+    store = load_inventory(args, default_dependencies)
+    project = load_project(args, default_project, store)
+    write_exports(exports, store, project, status)
+    return EXIT_OK
+
+
+def cmd_validate(parser, args, default_project, default_dependencies):
+    from .validation import ERROR, validate_store
+
+    try:
+        store = load_inventory(args, default_dependencies)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"✗ Could not read {args.input}: {e}", file=sys.stderr)
+        return EXIT_INPUT_ERROR
+    issues = validate_store(store)
+    errors = sum(1 for issue in issues if issue.level == ERROR)
+    if args.format == "json":
+        json.dump({"components": store.size, "valid": not errors,
+                   "issues": [issue.as_dict() for issue in issues]}, sys.stdout, indent=2)
+        print()
+    else:
+        for issue in issues:
+            examples = f" (e.g. {', '.join(issue.examples)})" if issue.examples else ""
+            print(f"{issue.level}: {issue.message}{examples}")
+        if not issues:
+            print(f"✓ {store.size} components, no issues found")
+    if errors or (args.strict and issues):
+        return EXIT_ERROR
+    return EXIT_OK
+
+
+def cmd_policy(parser, args, default_project, default_dependencies):
+    from .policy import ALLOW, DENY, VERDICTS, write_verdicts
+
+    license_policy = _load_policy(parser, args.policy)
+    try:
+        store = load_inventory(args, default_dependencies)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"✗ Could not read {args.input}: {e}", file=sys.stderr)
+        return EXIT_INPUT_ERROR
+    result = license_policy.evaluate(store)
+    with _open_output(args.output) as fp:
+        if args.format == "json":
+            write_verdicts(fp, result)
+        else:
+            for violation in result.violations:
+                fp.write(f"{violation.verdict}: {violation.name}@{violation.version} {violation.license}"
+                         f" ({', '.join(violation.ids)})\n")
+            counts = ", ".join(f"{result.counts.get(verdict, 0)} {verdict}" for verdict in VERDICTS)
+            waived = f", {result.waived} waived" if result.waived else ""
+            mark = "✓" if result.verdict == ALLOW else "✗"
+            fp.write(f"{mark} License policy: {result.verdict} ({counts}{waived})\n")
+    if result.verdict == DENY or (args.strict and result.verdict != ALLOW):
+        return EXIT_POLICY_DENY
+    return EXIT_OK
+
+
+def cmd_normalize(parser, args, default_project, default_dependencies):
+    from .assets import DEFAULT_THRESHOLD, normalize_assets, write_assets
+    from .batch import log_merged_asset_ids, read_assets
+
+    threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+    if not 0 < threshold <= 1:
+        parser.error("--threshold must be in (0, 1]")
+    with open(args.assets, newline='', encoding='utf-8-sig') as fp:
+        fieldnames = next(csv.reader(fp), [])
+    rows, merge_map = normalize_assets(read_assets(args.assets), threshold=threshold)
+    with _open_output(args.output) as fp:
+        write_assets(fp, rows, fieldnames)
+    status = sys.stderr if args.output == "-" else sys.stdout
+    log_merged_asset_ids(merge_map, partial(print, file=status))
+    if args.merge_map:
+        with _open_output(args.merge_map) as fp:
+            merge_map.write_csv(fp)
+    print(f"✓ {len(rows)} assets, {len(merge_map)} names merged", file=status)
+    return EXIT_OK
+
+
+def cmd_diff(parser, args, default_project, default_dependencies):
+    # JSON on stdout replaces the PDF unless -o asks for both
+    pdf = args.output or (None if args.json == "-" else DEFAULT_DIFF_OUTPUT)
+    generate_diff_report(args.old, args.new, partial(load_project, args, default_project), pdf, args.json)
+    return EXIT_OK
+
+
+def cmd_batch(parser, args, default_project, default_dependencies):
+    from .batch import run_batch, run_database_batch
+
+    boilerplate = _load_boilerplate(parser, args.boilerplate) if args.boilerplate else None
+
+    if args.database is not None:
+        from .database import default_dsn
+
+        if args.assets or args.merge_map:
+            parser.error("--database replaces the asset CSV; drop ASSETS and --merge-map")
+        dsn = args.database or default_dsn()
+        if not dsn:
+            parser.error("--database: give a DSN or set SBOM_DATABASE_URL or DATABASE_URL")
+        try:
+            summary = run_database_batch(dsn, args.output_dir, load_project(args, default_project),
+                                         workers=args.workers, cache_dir=args.cache_dir,
+                                         cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+                                         advisory_index=_advisory_index(parser, args), history=args.history,
+                                         page_size=args.page_size, assets_table=args.assets_table,
+                                         sbom_table=args.sbom_table, boilerplate=boilerplate,
+                                         compact=args.compact)
+        except ImportError as e:
+            if not (e.name or "").startswith("psycopg"):
+                raise
+            print("Error: Missing required library. Please install psycopg and psycopg_pool:")
+            print("  pip install 'psycopg[binary]' psycopg_pool")
+            print(f"\nOriginal error: {e}")
+            return EXIT_ERROR
+        return EXIT_ERROR if summary["failed"] else EXIT_OK
+    if not args.assets:
+        parser.error("batch needs an asset inventory CSV or --database")
+    if args.page_size or args.assets_table or args.sbom_table:
+        parser.error("--page-size, --assets-table and --sbom-table need --database")
+    summary = run_batch(args.assets, args.sbom_dir, args.output_dir, load_project(args, default_project),
+                        workers=args.workers, cache_dir=args.cache_dir,
+                        cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+                        advisory_index=_advisory_index(parser, args), history=args.history,
+                        merge_map_path=args.merge_map, boilerplate=boilerplate, compact=args.compact)
+    return EXIT_ERROR if summary["failed"] else EXIT_OK
+
+
+def cmd_portfolio(parser, args, default_project, default_dependencies):
+    from .portfolio import asset_names, run_portfolio, write_portfolio_json
+
+    advisory_index = _advisory_index(parser, args)
+    # JSON on stdout replaces the PDF unless -o asks for both
+    pdf = args.output or (None if args.json == "-" else DEFAULT_PORTFOLIO_OUTPUT)
+    status = sys.stderr if args.json == "-" else sys.stdout
+    log = partial(print, file=status)
+    aggregate, failures = run_portfolio(args.sbom_dir, workers=args.workers, log=log, advisory_index=advisory_index)
+    if args.json == "-":
+        write_portfolio_json(sys.stdout, aggregate, failures)
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as fp:
+            write_portfolio_json(fp, aggregate, failures)
+        log(f"✓ Portfolio roll-up written: {args.json}")
+    if pdf:
+        from . import report
+        names = asset_names(args.assets) if args.assets else {}
+        report.generate_portfolio_report(pdf, aggregate, failures, load_project(args, default_project), names,
+                                         matched=advisory_index is not None)
+        log(f"✓ SBOM portfolio report generated successfully: {pdf}")
+    return EXIT_ERROR if failures else EXIT_OK
+
+
+def cmd_serve(parser, args, default_project, default_dependencies):
+    import asyncio
+    from .service import DEFAULT_PORT, serve
+
+    advisory_index = _advisory_index(parser, args)
+    try:
+        asyncio.run(serve(default_project, host=args.host, port=args.port or DEFAULT_PORT,
+                          unix_socket=args.socket, workers=args.workers, max_pending=args.max_pending,
+                          advisory_index=advisory_index, compact=args.compact))
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def cmd_trend(parser, args, default_project, default_dependencies):
+    from .history import TREND_FIELDS, HistoryStore
+
+    if not os.path.exists(args.history):
+        parser.error(f"history database not found: {args.history}")
+    with HistoryStore(args.history) as history:
+        if args.list:
+            projects = history.projects()
+            with _open_output(args.output) as fp:
+                if args.format == "json":
+                    json.dump([entry._asdict() for entry in projects], fp, indent=2)
+                    fp.write("\n")
+                elif args.format == "csv":
+                    writer = csv.writer(fp)
+                    writer.writerow(("name", "snapshots", "first", "last", "components"))
+                    writer.writerows(projects)
+                else:
+                    for entry in projects:
+                        fp.write(f"{entry.name:<40} {entry.snapshots:>6} snapshots  {entry.first} .. {entry.last}  "
+                                 f"{entry.components} components\n")
+            return EXIT_OK
+        rows = history.trend(args.projects, args.since, args.until, args.period)
+        licenses = history.license_mix(args.projects, args.since, args.until)
+
+    with _open_output(args.output) as fp:
+        if args.format == "json":
+            json.dump({"period": args.period, "trend": [row._asdict() for row in rows],
+                       "licenses": dict(licenses)}, fp, indent=2)
+            fp.write("\n")
+            return EXIT_OK
+        if args.format == "csv":
+            writer = csv.writer(fp)
+            writer.writerow(TREND_FIELDS)
+            writer.writerows(rows)
+            return EXIT_OK
+        fp.write(f"{'Period':<20} {'Projects':>8} {'Components':>10} {'Prod':>8} {'Dev':>8} {'Permissive':>10} "
+                 f"{'Copyleft':>8} {'Unknown':>8} {'Added':>7} {'Removed':>7} {'Upgraded':>8} {'Downgraded':>10} "
+                 f"{'License':>7}\n")
+        for row in rows:
+            fp.write(f"{row.period:<20} {row.projects:>8} {row.components:>10} {row.production:>8} "
+                     f"{row.development:>8} {row.permissive:>10} {row.copyleft:>8} {row.unknown:>8} "
+                     f"{row.added:>7} {row.removed:>7} {row.upgraded:>8} {row.downgraded:>10} "
+                     f"{row.license_changed:>7}\n")
+        if licenses:
+            fp.write("License mix (latest snapshot of each project):\n")
+            for license_id, count in licenses:
+                fp.write(f"  {count:>8}  {license_id}\n")
+    return EXIT_OK
+
+
+HANDLERS = {
+    "render": cmd_render,
+    "watch": cmd_watch,
+    "summary": cmd_summary,
+    "export": cmd_export,
+    "validate": cmd_validate,
+    "policy": cmd_policy,
+    "normalize": cmd_normalize,
+    "diff": cmd_diff,
+    "batch": cmd_batch,
+    "portfolio": cmd_portfolio,
+    "serve": cmd_serve,
+    "trend": cmd_trend,
+}
+
+
+def main(argv, default_project, default_dependencies):
+    parser, args = parse_args(argv)
+    return HANDLERS[args.command](parser, args, default_project, default_dependencies)
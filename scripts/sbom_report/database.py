@@ -0,0 +1,119 @@
+"""
+Asset and SBOM source backed by the asset manager's Postgres database
+Assets are read from the web app's assets table and matched to the newest
+document of an SBOM table (asset_id, document, created_at). Asset pages are
+keyset-paginated on assets.id, each read through a server-side cursor in a
+short transaction of its own, so neither side ever holds the whole table;
+SBOM documents are fetched one at a time by the worker that renders them.
+Connections come from a psycopg_pool pool. psycopg (3.x) and psycopg_pool
+are optional dependencies, imported only when a database source is used.
+"""
+
+import io
+import os
+
+DEFAULT_PAGE_SIZE = 500
+# Rows a server-side cursor fetches per round trip
+FETCH_SIZE = 100
+DEFAULT_ASSETS_TABLE = "assets"
+DEFAULT_SBOM_TABLE = "asset_sboms"
+DSN_VARIABLES = ("SBOM_DATABASE_URL", "DATABASE_URL")
+
+# assets columns -> the asset row keys of an asset inventory CSV (see batch.asset_project)
+ASSET_COLUMNS = (("id", "asset_id"), ("name", "asset_name"), ("type", "asset_type"),
+                 ("location", "environment"), ("owner", "owner_team"))
+
+
+def default_dsn():
+    """Connection string from the environment, or None"""
+    for variable in DSN_VARIABLES:
+        if os.environ.get(variable):
+            return os.environ[variable]
+    return None
+
+
+class AssetDatabase:
+    """
+    Pooled connections to the asset database
+    Statements are never prepared server-side, so the Supabase connection
+    pooler (PgBouncer in transaction mode) works as well as a direct connection.
+    """
+
+    def __init__(self, dsn, min_size=1, max_size=4, assets_table=DEFAULT_ASSETS_TABLE,
+                 sbom_table=DEFAULT_SBOM_TABLE):
+        from psycopg import sql
+        from psycopg_pool import ConnectionPool
+
+        self.dsn = dsn
+        self.sbom_table = sbom_table
+        self.pool = ConnectionPool(dsn, min_size=min_size, max_size=max_size, open=True,
+                                   kwargs={"prepare_threshold": None, "application_name": "sbom-report"})
+        assets, sboms = sql.Identifier(*assets_table.split(".")), sql.Identifier(*sbom_table.split("."))
+        # The raw id leads for the keyset, compared in the column's own type
+        columns = sql.SQL(", ").join([sql.SQL("a.id")] + [
+            sql.SQL("a.{}::text").format(sql.Identifier(column)) for column, _ in ASSET_COLUMNS])
+        with_sbom = sql.SQL("EXISTS (SELECT 1 FROM {} s WHERE s.asset_id = a.id)").format(sboms)
+        self._count = sql.SQL("SELECT count(*) FROM {} a WHERE {}").format(assets, with_sbom)
+        self._first_page = sql.SQL("SELECT {} FROM {} a WHERE {} ORDER BY a.id LIMIT %(limit)s").format(
+            columns, assets, with_sbom)
+        self._next_page = sql.SQL(
+            "SELECT {} FROM {} a WHERE a.id > %(after)s AND {} ORDER BY a.id LIMIT %(limit)s").format(
+            columns, assets, with_sbom)
+        self._document = sql.SQL(
+            "SELECT document::text FROM {} WHERE asset_id = %(asset_id)s ORDER BY created_at DESC LIMIT 1").format(
+            sboms)
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def count_assets(self):
+        """Assets with at least one SBOM"""
+        with self.pool.connection() as conn:
+            return conn.execute(self._count).fetchone()[0]
+
+    def _page(self, after, limit):
+        with self.pool.connection() as conn, conn.transaction():
+            with conn.cursor(name="sbom_report_assets") as cursor:
+                cursor.itersize = FETCH_SIZE
+                if after is None:
+                    cursor.execute(self._first_page, {"limit": limit})
+                else:
+                    cursor.execute(self._next_page, {"after": after, "limit": limit})
+                return [(row[0], {key: value or "" for (_, key), value in zip(ASSET_COLUMNS, row[1:])})
+                        for row in cursor]
+
+    def iter_assets(self, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Yield asset rows (dicts keyed like the asset inventory CSV) that have an
+        SBOM, in id order, one page in memory at a time. The connection is back
+        in the pool before a page's rows are yielded.
+        """
+        after = None
+        while True:
+            page = self._page(after, page_size)
+            for _, asset in page:
+                yield asset
+            if len(page) < page_size:
+                return
+            after = page[-1][0]
+
+    def sbom_document(self, asset_id):
+        """Text of the asset's newest SBOM document, or None"""
+        with self.pool.connection() as conn:
+            row = conn.execute(self._document, {"asset_id": asset_id}).fetchone()
+        return None if row is None else row[0]
+
+    def load_components(self, asset_id):
+        """ComponentStore for the asset's newest SBOM"""
+        from .sbomdoc import read_sbom
+
+        document = self.sbom_document(asset_id)
+        if document is None:
+            raise ValueError(f"asset {asset_id} has no SBOM in {self.sbom_table}")
+        return read_sbom(io.StringIO(document), f"{self.sbom_table}:{asset_id}")
@@ -0,0 +1,121 @@
+"""
+Component diff between two versions of an SBOM
+Both inventories are joined through a hash index on (ecosystem, normalized
+package name), taken from the purl when there is one, so the diff is linear
+in time and memory. Each package is compared by version: unmatched versions
+on both sides are paired as upgrades/downgrades, the rest are added or
+removed, and a paired or unchanged version whose license differs is also
+reported as a license change.
+"""
+
+import json
+from collections import namedtuple
+
+from .advisories import version_key
+from .sbomdoc import normalize_name, parse_purl
+
+CHANGE_KINDS = ("added", "removed", "upgraded", "downgraded", "license_changed")
+
+CHANGE_TITLES = {
+    "added": "Added Components",
+    "removed": "Removed Components",
+    "upgraded": "Upgraded Components",
+    "downgraded": "Downgraded Components",
+    "license_changed": "License Changes",
+}
+
+Change = namedtuple("Change", "kind name ecosystem old_version new_version old_license new_license")
+
+
+def package_key(store, row, default_ecosystem="npm"):
+    """(ecosystem, normalized name) join key of a stored component"""
+    ecosystem, name, _ = parse_purl(store.purls[row])
+    if not name:
+        ecosystem = store.ecosystem_of(row) or default_ecosystem
+        name = store.names[row]
+    return ecosystem, normalize_name(ecosystem, name)
+
+
+def _index(store, default_ecosystem):
+    """join key -> {version: row}, in first-seen order"""
+    index = {}
+    versions = store.versions
+    for row in range(store.size):
+        key = package_key(store, row, default_ecosystem)
+        rows = index.get(key)
+        if rows is None:
+            index[key] = {versions[row]: row}
+        else:
+            rows.setdefault(versions[row], row)
+    return index
+
+
+def diff_stores(old, new, default_ecosystem="npm"):
+    """Yield a Change for every difference between two component stores"""
+    old_index = _index(old, default_ecosystem)
+    for key, new_rows in _index(new, default_ecosystem).items():
+        ecosystem = key[0]
+        old_rows = old_index.pop(key, None)
+        if old_rows is None:
+            for version, row in new_rows.items():
+                yield Change("added", new.names[row], ecosystem, "", version, "", new.license_of(row))
+            continue
+
+        for version, row in new_rows.items():
+            old_row = old_rows.get(version)
+            if old_row is not None and old.license_of(old_row) != new.license_of(row):
+                yield Change("license_changed", new.names[row], ecosystem, version, version,
+                             old.license_of(old_row), new.license_of(row))
+
+        if new_rows.keys() == old_rows.keys():
+            continue
+        removed = sorted((v for v in old_rows if v not in new_rows), key=version_key)
+        added = sorted((v for v in new_rows if v not in old_rows), key=version_key)
+        # Pair the highest versions first so 1.x/2.x -> 2.x/3.x reads as two upgrades
+        while removed and added:
+            old_version, new_version = removed.pop(), added.pop()
+            old_row, row = old_rows[old_version], new_rows[new_version]
+            kind = "upgraded" if version_key(new_version) > version_key(old_version) else "downgraded"
+            old_license, new_license = old.license_of(old_row), new.license_of(row)
+            yield Change(kind, new.names[row], ecosystem, old_version, new_version, old_license, new_license)
+            if old_license != new_license:
+                yield Change("license_changed", new.names[row], ecosystem, old_version, new_version,
+                             old_license, new_license)
+        for version in added:
+            row = new_rows[version]
+            yield Change("added", new.names[row], ecosystem, "", version, "", new.license_of(row))
+        for version in removed:
+            row = old_rows[version]
+            yield Change("removed", old.names[row], ecosystem, version, "", old.license_of(row), "")
+
+    for key, old_rows in old_index.items():
+        for version, row in old_rows.items():
+            yield Change("removed", old.names[row], key[0], version, "", old.license_of(row), "")
+
+
+def collect_changes(old, new, default_ecosystem="npm"):
+    """Group the diff by change kind: {kind: [Change, ...]} in CHANGE_KINDS order"""
+    changes = {kind: [] for kind in CHANGE_KINDS}
+    for change in diff_stores(old, new, default_ecosystem):
+        changes[change.kind].append(change)
+    return changes
+
+
+def diff_summary(old, new, changes):
+    summary = {"old_components": old.size, "new_components": new.size}
+    summary.update((kind, len(items)) for kind, items in changes.items())
+    return summary
+
+
+def write_diff_json(fp, summary, changes, old_label, new_label):
+    """Write the diff as JSON one change at a time"""
+    fp.write("{\n")
+    fp.write(f'  "old": {json.dumps(old_label)},\n  "new": {json.dumps(new_label)},\n')
+    fp.write(f'  "summary": {json.dumps(summary)},\n  "changes": [')
+    first = True
+    for kind in CHANGE_KINDS:
+        for change in changes[kind]:
+            fp.write("\n    " if first else ",\n    ")
+            fp.write(json.dumps(change._asdict()))
+            first = False
+    fp.write("\n  ]\n}\n")
@@ -0,0 +1,276 @@
+"""
+Machine-readable inventory exports
+Each exporter writes one component at a time to an open text file, so
+exports of large inventories never build the whole document in memory:
+CSV, NDJSON and a flat JSON list, plus CycloneDX 1.5 and SPDX 2.3 JSON
+documents carrying the dependency relationships of the store.
+"""
+
+import csv
+import itertools
+import json
+import re
+import uuid
+from datetime import datetime, timezone
+
+from . import __version__
+from .licenses import UNKNOWN, UNKNOWN_LICENSE, normalize_license
+from .options import EXPORT_SUFFIXES
+from .sbomdoc import SCOPE_DEVELOPMENT, TYPE_APPLICATION, TYPE_DIRECT
+
+CSV_COLUMNS = ("scope", "name", "version", "license", "type", "ecosystem", "purl")
+TOOL_NAME = "sbom-report"
+
+CYCLONEDX_TYPES = ("application", "framework", "library", "container", "platform", "operating-system",
+                   "device", "device-driver", "firmware", "file", "machine-learning-model", "data")
+SPDX_PURPOSES = ("APPLICATION", "FRAMEWORK", "LIBRARY", "CONTAINER", "OPERATING_SYSTEM", "DEVICE",
+                 "FIRMWARE", "SOURCE", "ARCHIVE", "FILE", "INSTALL", "OTHER")
+
+_LICENSE_REF_RE = re.compile(r'[^A-Za-z0-9.-]+')
+
+
+def write_csv(fp, store, project):
+    writer = csv.writer(fp, lineterminator="\n")
+    writer.writerow(CSV_COLUMNS)
+    for component in store.iter_components():
+        writer.writerow([component[column] for column in CSV_COLUMNS])
+
+
+def write_ndjson(fp, store, project):
+    """One JSON object per component per line"""
+    for component in store.iter_components():
+        fp.write(json.dumps({column: component[column] for column in CSV_COLUMNS}))
+        fp.write("\n")
+
+
+def write_json(fp, store, project):
+    fp.write('{\n  "project": ' + json.dumps(project) + ',\n  "components": [')
+    first = True
+    for component in store.iter_components():
+        fp.write("\n    " if first else ",\n    ")
+        fp.write(json.dumps({column: component[column] for column in CSV_COLUMNS}))
+        first = False
+    fp.write("\n  ]\n}\n")
+
+
+def _timestamp():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _write_array(fp, items, indent="    "):
+    """Stream an iterable of JSON-ready values as the elements of an open array"""
+    first = True
+    for item in items:
+        fp.write("\n" + indent if first else ",\n" + indent)
+        fp.write(json.dumps(item))
+        first = False
+    fp.write("\n  ]" if not first else "]")
+
+
+def _application_row(store):
+    application = store.strings.lookup(TYPE_APPLICATION)
+    if application is None:
+        return None
+    for row, type_code in enumerate(store.type_codes):
+        if type_code == application:
+            return row
+    return None
+
+
+def _root_targets(store):
+    """Rows the product depends on directly when the store has no application row"""
+    direct = store.strings.lookup(TYPE_DIRECT)
+    rows = [row for row, type_code in enumerate(store.type_codes) if type_code == direct]
+    if not rows and not store.edge_sources:
+        # A flat inventory such as the built-in table lists direct dependencies only
+        return range(store.size)
+    return rows
+
+
+def _edges_by_source(store):
+    """(source row, [target rows]) groups in source row order"""
+    sources, targets = store.edge_sources, store.edge_targets
+    order = sorted(range(len(sources)), key=sources.__getitem__)
+    group_source, group = None, []
+    for edge in order:
+        source = sources[edge]
+        if source != group_source and group:
+            yield group_source, group
+            group = []
+        group_source = source
+        group.append(targets[edge])
+    if group:
+        yield group_source, group
+
+
+def _cyclonedx_licenses(license):
+    info = normalize_license(license)
+    if info.expression == UNKNOWN_LICENSE:
+        return None
+    if isinstance(info.tree, str):
+        if info.category == UNKNOWN:
+            return [{"license": {"name": info.expression}}]
+        return [{"license": {"id": info.expression}}]
+    return [{"expression": info.expression}]
+
+
+def _cyclonedx_component(store, row, ref):
+    values = store.strings.values
+    kind = values[store.type_codes[row]].lower().replace(" ", "-")
+    component = {
+        "type": kind if kind in CYCLONEDX_TYPES else "library",
+        "bom-ref": ref,
+        "name": store.names[row],
+    }
+    if store.versions[row]:
+        component["version"] = store.versions[row]
+    licenses = _cyclonedx_licenses(values[store.license_codes[row]])
+    if licenses:
+        component["licenses"] = licenses
+    if store.purls[row]:
+        component["purl"] = store.purls[row]
+    component["scope"] = "excluded" if values[store.scope_codes[row]] == SCOPE_DEVELOPMENT else "required"
+    return component
+
+
+def _cyclonedx_refs(store):
+    """The store's own refs when they identify every row, otherwise row-based refs"""
+    refs = store.refs
+    if all(refs) and len(set(refs)) == len(refs):
+        return refs
+    return [f"component-{row}" for row in range(store.size)]
+
+
+def write_cyclonedx(fp, store, project):
+    """CycloneDX 1.5 JSON; the application row (or the project) becomes metadata.component"""
+    refs = _cyclonedx_refs(store)
+    root = _application_row(store)
+    if root is not None:
+        root_component = _cyclonedx_component(store, root, refs[root])
+        root_component.pop("scope")
+        root_ref = refs[root]
+    else:
+        root_ref = "root-component"
+        root_component = {"type": "application", "bom-ref": root_ref, "name": project.get("name", "")}
+        if project.get("version"):
+            root_component["version"] = project["version"]
+    metadata = {
+        "timestamp": _timestamp(),
+        "tools": {"components": [{"type": "application", "name": TOOL_NAME, "version": __version__}]},
+        "component": root_component,
+    }
+    if project.get("vendor"):
+        metadata["supplier"] = {"name": project["vendor"]}
+
+    fp.write('{\n  "bomFormat": "CycloneDX",\n  "specVersion": "1.5",\n')
+    fp.write(f'  "serialNumber": "urn:uuid:{uuid.uuid4()}",\n  "version": 1,\n')
+    fp.write('  "metadata": ' + json.dumps(metadata) + ',\n  "components": [')
+    _write_array(fp, (_cyclonedx_component(store, row, refs[row]) for row in range(store.size) if row != root))
+    fp.write(',\n  "dependencies": [')
+
+    def dependencies():
+        if root is None:
+            yield {"ref": root_ref, "dependsOn": [refs[row] for row in _root_targets(store)]}
+        for source, targets in _edges_by_source(store):
+            yield {"ref": refs[source], "dependsOn": [refs[target] for target in targets]}
+
+    _write_array(fp, dependencies())
+    fp.write("\n}\n")
+
+
+def _spdx_license(license):
+    """Valid SPDX expression for a raw license; unknown ids become LicenseRef- ids"""
+    info = normalize_license(license)
+    if info.expression == UNKNOWN_LICENSE:
+        return UNKNOWN_LICENSE
+    if info.category != UNKNOWN or not isinstance(info.tree, str):
+        return info.expression
+    if " " in info.expression:
+        # Free text such as "SEE LICENSE IN LICENSE.md"
+        return UNKNOWN_LICENSE
+    return info.expression if info.expression.startswith("LicenseRef-") else \
+        "LicenseRef-" + _LICENSE_REF_RE.sub("-", info.expression)
+
+
+def _spdx_package(spdx_id, name, version, license, kind, purl=""):
+    purpose = kind.upper().replace(" ", "_")
+    package = {
+        "SPDXID": spdx_id,
+        "name": name,
+        "versionInfo": version or "NOASSERTION",
+        "downloadLocation": "NOASSERTION",
+        "filesAnalyzed": False,
+        "licenseConcluded": "NOASSERTION",
+        "licenseDeclared": _spdx_license(license),
+        "copyrightText": "NOASSERTION",
+        "primaryPackagePurpose": purpose if purpose in SPDX_PURPOSES else "LIBRARY",
+    }
+    if purl:
+        package["externalRefs"] = [{"referenceCategory": "PACKAGE-MANAGER", "referenceType": "purl",
+                                    "referenceLocator": purl}]
+    return package
+
+
+def _spdx_packages(store):
+    values = store.strings.values
+    for row in range(store.size):
+        yield _spdx_package(f"SPDXRef-Package-{row}", store.names[row], store.versions[row],
+                            values[store.license_codes[row]], values[store.type_codes[row]], store.purls[row])
+
+
+def _relationship(element, kind, related):
+    return {"spdxElementId": element, "relationshipType": kind, "relatedSpdxElement": related}
+
+
+def _dependency(store, source, target, development):
+    """DEPENDS_ON, or DEV_DEPENDENCY_OF (pointing the other way) for development targets"""
+    if store.scope_codes[target] == development:
+        return _relationship(f"SPDXRef-Package-{target}", "DEV_DEPENDENCY_OF", source)
+    return _relationship(source, "DEPENDS_ON", f"SPDXRef-Package-{target}")
+
+
+def write_spdx(fp, store, project):
+    """SPDX 2.3 JSON describing the application row, or a package for the project when there is none"""
+    name = project.get("name") or "sbom"
+    creators = [f"Tool: {TOOL_NAME}-{__version__}"]
+    if project.get("vendor"):
+        creators.append(f"Organization: {project['vendor']}")
+    slug = _LICENSE_REF_RE.sub("-", name).strip("-").lower() or "sbom"
+
+    fp.write('{\n  "spdxVersion": "SPDX-2.3",\n  "dataLicense": "CC0-1.0",\n  "SPDXID": "SPDXRef-DOCUMENT",\n')
+    fp.write(f'  "name": {json.dumps(name)},\n')
+    fp.write(f'  "documentNamespace": "https://spdx.org/spdxdocs/{slug}-{uuid.uuid4()}",\n')
+    fp.write('  "creationInfo": ' + json.dumps({"created": _timestamp(), "creators": creators}) + ',\n')
+    root = _application_row(store)
+    fp.write('  "packages": [')
+    packages = _spdx_packages(store)
+    if root is None:
+        project_package = _spdx_package("SPDXRef-Project", name, project.get("version", ""),
+                                        project.get("license", UNKNOWN_LICENSE), TYPE_APPLICATION)
+        packages = itertools.chain((project_package,), packages)
+    _write_array(fp, packages)
+    fp.write(',\n  "relationships": [')
+
+    def relationships():
+        development = store.strings.lookup(SCOPE_DEVELOPMENT)
+        if root is not None:
+            yield _relationship("SPDXRef-DOCUMENT", "DESCRIBES", f"SPDXRef-Package-{root}")
+        else:
+            yield _relationship("SPDXRef-DOCUMENT", "DESCRIBES", "SPDXRef-Project")
+            for row in _root_targets(store):
+                yield _dependency(store, "SPDXRef-Project", row, development)
+        for source, target in zip(store.edge_sources, store.edge_targets):
+            yield _dependency(store, f"SPDXRef-Package-{source}", target, development)
+
+    _write_array(fp, relationships())
+    fp.write("\n}\n")
+
+
+# format -> (writer, default file suffix)
+EXPORTERS = {
+    "csv": (write_csv, EXPORT_SUFFIXES["csv"]),
+    "ndjson": (write_ndjson, EXPORT_SUFFIXES["ndjson"]),
+    "json": (write_json, EXPORT_SUFFIXES["json"]),
+    "cyclonedx": (write_cyclonedx, EXPORT_SUFFIXES["cyclonedx"]),
+    "spdx": (write_spdx, EXPORT_SUFFIXES["spdx"]),
+}
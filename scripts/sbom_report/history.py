@@ -0,0 +1,267 @@
+"""
+Historical component store for cross-run trend reporting
+Every recorded report adds a snapshot row (project, time, component and
+license-category counts, churn against the project's previous snapshot) to
+an SQLite database in WAL mode, so batch workers can record concurrently
+while trend queries read. Component lists are stored once per distinct
+inventory, keyed by a content hash, so a year of unchanged nightly
+snapshots costs one row each. Recording also flags each project's last
+snapshot per day, week and month, so a trend query is a single indexed
+GROUP BY over the snapshots table: counts are summed over the flagged rows
+and churn over all of them, with no per-project subquery or sort.
+"""
+
+import hashlib
+import sqlite3
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+
+from .diff import CHANGE_KINDS, collect_changes
+from .model import ComponentStore
+from .options import PERIODS
+from .stats import compute_stats
+
+SCHEMA_VERSION = 1
+BATCH_SIZE = 5000
+
+# Period -> snapshots column flagging each project's last snapshot in it
+PERIOD_FLAGS = {"day": "last_in_day", "week": "last_in_week", "month": "last_in_month"}
+
+TREND_FIELDS = ("period", "projects", "components", "production", "development",
+                "permissive", "copyleft", "unknown") + CHANGE_KINDS
+
+TrendRow = namedtuple("TrendRow", TREND_FIELDS)
+ProjectHistory = namedtuple("ProjectHistory", "name snapshots first last components")
+
+
+def timestamp(moment=None):
+    """ISO 8601 UTC time as stored in the snapshots table"""
+    moment = moment or datetime.now(timezone.utc)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime(PERIODS["snapshot"])
+
+
+def period_bounds(period, moment):
+    """First and last snapshot time of the period holding moment (ISO time or YYYY-MM-DD)"""
+    if period == "snapshot":
+        return moment, moment if len(moment) > 10 else moment + "T23:59:59Z"
+    day = date.fromisoformat(moment[:10])
+    if period == "week":
+        # %W weeks start on Monday and are cut at the turn of the year
+        first = max(day - timedelta(days=day.weekday()), date(day.year, 1, 1))
+        last = min(first + timedelta(days=6 - first.weekday()), date(day.year, 12, 31))
+    elif period == "month":
+        first = day.replace(day=1)
+        last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    else:
+        first = last = day
+    return f"{first.isoformat()}T00:00:00Z", f"{last.isoformat()}T23:59:59Z"
+
+
+def _create_schema(conn):
+    """Create whatever is missing in one write transaction, so concurrent first opens are safe"""
+    conn.executescript(f"""
+        BEGIN IMMEDIATE;
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS projects (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS inventories (
+            id INTEGER PRIMARY KEY, digest TEXT NOT NULL UNIQUE, components INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS components (
+            inventory_id INTEGER, name TEXT, version TEXT, license TEXT,
+            type TEXT, scope TEXT, ecosystem TEXT, purl TEXT
+        );
+        CREATE TABLE IF NOT EXISTS inventory_licenses (
+            inventory_id INTEGER, license TEXT, components INTEGER,
+            PRIMARY KEY (inventory_id, license)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY, project_id INTEGER NOT NULL, inventory_id INTEGER NOT NULL,
+            taken_at TEXT NOT NULL, source TEXT,
+            components INTEGER, production INTEGER, development INTEGER, unique_licenses INTEGER,
+            permissive INTEGER, copyleft INTEGER, unknown INTEGER,
+            added INTEGER, removed INTEGER, upgraded INTEGER, downgraded INTEGER, license_changed INTEGER,
+            last_in_day INTEGER DEFAULT 1, last_in_week INTEGER DEFAULT 1, last_in_month INTEGER DEFAULT 1
+        );
+        CREATE INDEX IF NOT EXISTS components_inventory ON components (inventory_id);
+        CREATE INDEX IF NOT EXISTS snapshots_project ON snapshots (project_id, taken_at);
+        CREATE INDEX IF NOT EXISTS snapshots_taken ON snapshots (taken_at);
+        INSERT OR IGNORE INTO meta VALUES ('schema_version', '{SCHEMA_VERSION}');
+        COMMIT;
+    """)
+
+
+def _component_rows(store):
+    """Sorted (name, version, license, type, scope, ecosystem, purl) tuples of a store"""
+    values = store.strings.values
+    return sorted(zip(store.names, store.versions,
+                      (values[code] for code in store.license_codes),
+                      (values[code] for code in store.type_codes),
+                      (values[code] for code in store.scope_codes),
+                      (values[code] for code in store.ecosystem_codes),
+                      store.purls))
+
+
+def _digest(rows):
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update("\x1f".join(row).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class HistoryStore:
+    """Read/write handle on the snapshot database; creates it on first use"""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        _create_schema(self._conn)
+        self.meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        if self.meta.get("schema_version") != str(SCHEMA_VERSION):
+            self._conn.close()
+            raise ValueError(f"{path}: history schema version {self.meta.get('schema_version')}, "
+                             f"expected {SCHEMA_VERSION}")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, project, store, stats=None, taken_at=None, source=""):
+        """
+        Add a snapshot of store under the project name; returns the churn
+        ({change kind: count}) against the project's previous snapshot, all
+        zero for its first one. taken_at defaults to now; a snapshot recorded
+        out of order does not update the churn of the ones after it.
+        """
+        if stats is None:
+            stats = compute_stats(store, example_limit=0)
+        taken_at = taken_at or timestamp()
+        rows = _component_rows(store)
+        digest = _digest(rows)
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR IGNORE INTO projects (name) VALUES (?)", (project,))
+            project_id = conn.execute("SELECT id FROM projects WHERE name = ?", (project,)).fetchone()[0]
+            inventory_id = self._inventory(digest, rows, stats)
+            previous = conn.execute(
+                "SELECT inventory_id FROM snapshots WHERE project_id = ? AND taken_at <= ? "
+                "ORDER BY taken_at DESC, id DESC LIMIT 1", (project_id, taken_at)).fetchone()
+            churn = dict.fromkeys(CHANGE_KINDS, 0)
+            if previous is not None and previous[0] != inventory_id:
+                changes = collect_changes(self._load_inventory(previous[0]), store)
+                churn.update((kind, len(items)) for kind, items in changes.items())
+            conn.execute(
+                "INSERT INTO snapshots (project_id, inventory_id, taken_at, source, components, production, "
+                "development, unique_licenses, permissive, copyleft, unknown, added, removed, upgraded, "
+                "downgraded, license_changed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (project_id, inventory_id, taken_at, source, stats.total, stats.scope_count("Production"),
+                 stats.scope_count("Development"), stats.unique_licenses, stats.permissive_count,
+                 stats.copyleft_count, stats.unknown_count) + tuple(churn[kind] for kind in CHANGE_KINDS))
+            self._flag_last(project_id, taken_at)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return churn
+
+    def _flag_last(self, project_id, taken_at):
+        """Re-flag the project's last snapshot in each period holding taken_at"""
+        for period, flag in PERIOD_FLAGS.items():
+            start, end = period_bounds(period, taken_at)
+            self._conn.execute(f"""
+                UPDATE snapshots SET {flag} = (id = (
+                    SELECT id FROM snapshots WHERE project_id = :project AND taken_at BETWEEN :start AND :end
+                    ORDER BY taken_at DESC, id DESC LIMIT 1))
+                WHERE project_id = :project AND taken_at BETWEEN :start AND :end
+            """, {"project": project_id, "start": start, "end": end})
+
+    def _inventory(self, digest, rows, stats):
+        """Id of the inventory with this digest, inserting its components the first time"""
+        conn = self._conn
+        found = conn.execute("SELECT id FROM inventories WHERE digest = ?", (digest,)).fetchone()
+        if found is not None:
+            return found[0]
+        inventory_id = conn.execute("INSERT INTO inventories (digest, components) VALUES (?, ?)",
+                                    (digest, len(rows))).lastrowid
+        for first in range(0, len(rows), BATCH_SIZE):
+            conn.executemany("INSERT INTO components VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                             [(inventory_id,) + row for row in rows[first:first + BATCH_SIZE]])
+        conn.executemany("INSERT INTO inventory_licenses VALUES (?, ?, ?)",
+                         [(inventory_id, license_id, count) for license_id, count in stats.by_license_id.items()])
+        return inventory_id
+
+    def _load_inventory(self, inventory_id):
+        store = ComponentStore()
+        for row in self._conn.execute("SELECT name, version, license, type, scope, ecosystem, purl "
+                                      "FROM components WHERE inventory_id = ?", (inventory_id,)):
+            store.add(*row)
+        return store
+
+    def projects(self):
+        """ProjectHistory per recorded project, by name"""
+        query = """
+            SELECT p.name, COUNT(*), MIN(s.taken_at), MAX(s.taken_at),
+                   (SELECT latest.components FROM snapshots latest WHERE latest.project_id = s.project_id
+                    ORDER BY latest.taken_at DESC, latest.id DESC LIMIT 1)
+            FROM snapshots s JOIN projects p ON p.id = s.project_id
+            GROUP BY s.project_id ORDER BY p.name
+        """
+        return [ProjectHistory(*row) for row in self._conn.execute(query)]
+
+    def _filter(self, projects, since, until, period="snapshot"):
+        """WHERE clause and parameters restricting the snapshots to whole periods"""
+        clauses, params = [], []
+        if projects:
+            conn = self._conn
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (name TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM wanted")
+            conn.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", ((name,) for name in projects))
+            clauses.append("project_id IN (SELECT p.id FROM projects p JOIN wanted w ON w.name = p.name)")
+        if since:
+            clauses.append("taken_at >= ?")
+            params.append(period_bounds(period, since)[0])
+        if until:
+            clauses.append("taken_at <= ?")
+            params.append(period_bounds(period, until)[1])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def trend(self, projects=None, since=None, until=None, period="day"):
+        """
+        TrendRow per period, oldest first. Counts are summed over the last
+        snapshot of each project within the period; churn is summed over
+        every snapshot in it.
+        """
+        where, params = self._filter(projects, since, until, period)
+        last = PERIOD_FLAGS.get(period, "1")
+        counts = ", ".join(f"SUM({column} * {last})" for column in TREND_FIELDS[2:8])
+        churn = ", ".join(f"SUM({kind})" for kind in CHANGE_KINDS)
+        query = f"""
+            SELECT strftime(?, taken_at) AS period, SUM({last}), {counts}, {churn}
+            FROM snapshots{where}
+            GROUP BY period ORDER BY period
+        """
+        return [TrendRow(*row) for row in self._conn.execute(query, [PERIODS[period]] + params)]
+
+    def license_mix(self, projects=None, since=None, until=None):
+        """(license id, components) over the latest snapshot of each project, most used first"""
+        where, params = self._filter(projects, since, until, "day")
+        query = f"""
+            SELECT l.license, SUM(l.components) AS total
+            FROM (
+                SELECT MAX(taken_at), inventory_id FROM snapshots{where} GROUP BY project_id
+            ) latest
+            JOIN inventory_licenses l ON l.inventory_id = latest.inventory_id
+            GROUP BY l.license ORDER BY total DESC, l.license
+        """
+        return list(self._conn.execute(query, params))
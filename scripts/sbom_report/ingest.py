@@ -0,0 +1,28 @@
+"""
+Input dispatch for the report generator
+Picks the lockfile or SBOM document loader from the input file name.
+"""
+
+import os
+
+from .lockfile import load_lockfile_dependencies
+from .sbomdoc import load_sbom
+
+LOCKFILE_NAMES = ("package-lock.json", "npm-shrinkwrap.json")
+INPUT_FORMATS = ("auto", "lockfile", "sbom")
+
+
+def is_lockfile(path):
+    return os.path.basename(path) in LOCKFILE_NAMES
+
+
+def load_components(path, package_json_path=None, input_format="auto"):
+    """
+    Load a lockfile, SPDX or CycloneDX JSON file into a ComponentStore.
+    input_format "auto" picks the loader from the file name.
+    """
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f"Unknown input format: {input_format}")
+    if input_format == "lockfile" or (input_format == "auto" and is_lockfile(path)):
+        return load_lockfile_dependencies(path, package_json_path)
+    return load_sbom(path)
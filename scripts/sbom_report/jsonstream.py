@@ -0,0 +1,178 @@
+"""
+Incremental JSON reader
+Walks a JSON document from a file object in fixed-size chunks so that only the
+value currently being decoded is held in memory, never the whole document.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WS_RE = re.compile(r'[ \t\n\r]*')
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_PLAIN_RE = re.compile(r'[^"\[\]{}]+')
+
+
+class JsonStream:
+    """Pull-style reader over a JSON text file object"""
+
+    def __init__(self, fp, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+
+    def _fill(self):
+        """Drop the consumed prefix and append the next chunk; False at EOF"""
+        if self._eof:
+            return False
+        pending = len(self._buf) - self._pos
+        chunk = self._fp.read(max(self._chunk_size, pending))
+        self._offset += self._pos
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        if not chunk:
+            self._eof = True
+            return False
+        return True
+
+    def _mark(self):
+        return self._offset + self._pos
+
+    def _skip_ws(self):
+        while True:
+            self._pos = _WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _peek(self):
+        self._skip_ws()
+        return self._buf[self._pos] if self._pos < len(self._buf) else ''
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self._mark()}")
+        self._pos += 1
+
+    def read_string(self):
+        """Decode a JSON string at the current position"""
+        self._expect('"')
+        while True:
+            try:
+                value, end = scanstring(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+    def read_value(self):
+        """Decode the JSON value at the current position"""
+        self._skip_ws()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number that ends exactly at the chunk boundary may continue
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        """Advance past the value at the current position without decoding it"""
+        if self._peek() not in ('{', '['):
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            if self._pos >= len(self._buf):
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON input")
+                continue
+            char = self._buf[self._pos]
+            if char == '"':
+                match = _STRING_RE.match(self._buf, self._pos)
+                if match is None:
+                    if not self._fill():
+                        raise ValueError("Unterminated string in JSON input")
+                    continue
+                self._pos = match.end()
+            elif char in '{[':
+                depth += 1
+                self._pos += 1
+            elif char in '}]':
+                depth -= 1
+                self._pos += 1
+                if depth == 0:
+                    return
+            else:
+                self._pos = _PLAIN_RE.match(self._buf, self._pos).end()
+
+    def iter_object(self):
+        """
+        Yield the keys of the object at the current position.
+        After each key the stream is positioned at its value; a value the
+        caller leaves unread is skipped automatically.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self._expect(':')
+            self._skip_ws()
+            start = self._mark()
+            yield key
+            if self._mark() == start:
+                self.skip_value()
+            char = self._peek()
+            self._pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or '}}' at offset {self._mark() - 1}")
+
+    def iter_array(self):
+        """
+        Yield once per element of the array at the current position.
+        The stream is positioned at the element; unread elements are skipped.
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            self._skip_ws()
+            start = self._mark()
+            yield index
+            if self._mark() == start:
+                self.skip_value()
+            char = self._peek()
+            self._pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or ']' at offset {self._mark() - 1}")
+            index += 1
+
+    def iter_items(self):
+        """Yield (key, value) pairs of the object at the current position"""
+        for key in self.iter_object():
+            yield key, self.read_value()
+
+    def iter_elements(self):
+        """Yield the decoded elements of the array at the current position"""
+        for _ in self.iter_array():
+            yield self.read_value()
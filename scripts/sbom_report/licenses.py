@@ -0,0 +1,254 @@
+"""
+SPDX license expression parsing and normalization
+Expressions are parsed into a small tree: a license id string, a
+("WITH", id, exception) tuple, or an ("AND" | "OR", operands) tuple with
+flattened, de-duplicated and sorted operands, so equivalent spellings
+normalize to the same text. Results are memoized per expression string;
+an inventory repeats the same few expressions thousands of times.
+"""
+
+import re
+from functools import lru_cache
+
+UNKNOWN_LICENSE = "NOASSERTION"
+
+PUBLIC_DOMAIN = "Public Domain"
+PERMISSIVE = "Permissive"
+WEAK_COPYLEFT = "Weak Copyleft"
+STRONG_COPYLEFT = "Strong Copyleft"
+UNKNOWN = "Unknown"
+
+# Least to most restrictive; OR takes the least restrictive operand, AND the most
+CATEGORY_ORDER = (PUBLIC_DOMAIN, PERMISSIVE, WEAK_COPYLEFT, STRONG_COPYLEFT, UNKNOWN)
+COPYLEFT_CATEGORIES = (WEAK_COPYLEFT, STRONG_COPYLEFT)
+
+# license family -> (category, description used in the report prose)
+LICENSE_INFO = {
+    "MIT": (PERMISSIVE, "A permissive open-source license allowing commercial use, modification, "
+                        "distribution, and private use with minimal restrictions. Only attribution is required."),
+    "Apache-2.0": (PERMISSIVE, "Similar to MIT but includes patent grant provisions."),
+    "ISC": (PERMISSIVE, "Functionally equivalent to MIT."),
+    "BSD-2-Clause": (PERMISSIVE, "A permissive license requiring attribution in source and binary redistributions."),
+    "BSD-3-Clause": (PERMISSIVE, "A permissive license requiring attribution that also forbids using "
+                                 "contributors' names to endorse derived products."),
+    "BlueOak-1.0.0": (PERMISSIVE, "A modern permissive license with an explicit patent grant."),
+    "Python-2.0": (PERMISSIVE, "The permissive Python Software Foundation license."),
+    "Zlib": (PERMISSIVE, "A short permissive license; altered versions must be marked as such."),
+    "BSL-1.0": (PERMISSIVE, "The permissive Boost license; attribution is only required in source distributions."),
+    "Artistic-2.0": (PERMISSIVE, "Permits redistribution provided modified versions are clearly identified."),
+    "CC-BY-3.0": (PERMISSIVE, "Attribution license commonly used for data and documentation."),
+    "CC-BY-4.0": (PERMISSIVE, "Attribution license commonly used for data and documentation."),
+    "Unicode-DFS-2016": (PERMISSIVE, "The permissive Unicode data files license."),
+    "Unicode-3.0": (PERMISSIVE, "The permissive Unicode data files license."),
+    "0BSD": (PUBLIC_DOMAIN, "A public-domain equivalent license with no attribution requirement."),
+    "MIT-0": (PUBLIC_DOMAIN, "A public-domain equivalent license with no attribution requirement."),
+    "Unlicense": (PUBLIC_DOMAIN, "Dedicates the work to the public domain."),
+    "CC0-1.0": (PUBLIC_DOMAIN, "Dedicates the work to the public domain."),
+    "WTFPL": (PUBLIC_DOMAIN, "A public-domain equivalent license with no conditions."),
+    "MPL-2.0": (WEAK_COPYLEFT, "File-level copyleft: modified MPL files must be shared under the MPL, "
+                               "while larger works may use any license."),
+    "EPL-2.0": (WEAK_COPYLEFT, "Module-level copyleft with a patent grant; modified modules must be published."),
+    "CDDL-1.0": (WEAK_COPYLEFT, "File-level copyleft similar to the MPL."),
+    "LGPL-2.1": (WEAK_COPYLEFT, "Library copyleft: changes to the library must be shared, "
+                                "but it may be linked from proprietary code."),
+    "LGPL-3.0": (WEAK_COPYLEFT, "Library copyleft: changes to the library must be shared, "
+                                "but it may be linked from proprietary code."),
+    "GPL-2.0": (STRONG_COPYLEFT, "Strong copyleft: distributing derived works requires releasing "
+                                 "their source under the GPL."),
+    "GPL-3.0": (STRONG_COPYLEFT, "Strong copyleft: distributing derived works requires releasing "
+                                 "their source under the GPL."),
+    "AGPL-3.0": (STRONG_COPYLEFT, "Strong copyleft that also applies to software offered over a network."),
+}
+
+# Deprecated or loose spellings seen in package metadata
+_ALIASES = {
+    "GPL-2.0": "GPL-2.0-only",
+    "GPL-2.0+": "GPL-2.0-or-later",
+    "GPL-3.0": "GPL-3.0-only",
+    "GPL-3.0+": "GPL-3.0-or-later",
+    "LGPL-2.1": "LGPL-2.1-only",
+    "LGPL-2.1+": "LGPL-2.1-or-later",
+    "LGPL-3.0": "LGPL-3.0-only",
+    "LGPL-3.0+": "LGPL-3.0-or-later",
+    "AGPL-3.0": "AGPL-3.0-only",
+    "Apache2": "Apache-2.0",
+    "Apache-2": "Apache-2.0",
+}
+
+_CANONICAL = {name.lower(): name for name in list(LICENSE_INFO) + list(_ALIASES)}
+for _family in ("GPL-2.0", "GPL-3.0", "LGPL-2.1", "LGPL-3.0", "AGPL-3.0"):
+    for _suffix in ("-only", "-or-later"):
+        _CANONICAL[(_family + _suffix).lower()] = _family + _suffix
+
+_TOKEN_RE = re.compile(r'\(|\)|[^\s()]+')
+_OPERATORS = ("AND", "OR", "WITH")
+
+
+class LicenseExpressionError(ValueError):
+    pass
+
+
+def canonical_id(license_id):
+    """Case-corrected SPDX id, with deprecated aliases replaced"""
+    license_id = _CANONICAL.get(license_id.lower(), license_id)
+    return _ALIASES.get(license_id, license_id)
+
+
+def license_family(license_id):
+    """GPL-3.0-or-later -> GPL-3.0; ids without a version suffix are returned as is"""
+    for suffix in ("-only", "-or-later", "+"):
+        if license_id.endswith(suffix):
+            return license_id[:-len(suffix)]
+    return license_id
+
+
+def _parse(tokens):
+    position = 0
+
+    def peek():
+        return tokens[position].upper() if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        token = tokens[position]
+        position += 1
+        return token
+
+    def parse_or():
+        operands = [parse_and()]
+        while peek() == "OR":
+            take()
+            operands.append(parse_and())
+        return _combine("OR", operands)
+
+    def parse_and():
+        operands = [parse_with()]
+        while peek() == "AND":
+            take()
+            operands.append(parse_with())
+        return _combine("AND", operands)
+
+    def parse_with():
+        node = parse_atom()
+        if peek() == "WITH":
+            take()
+            if peek() in (None, "(", ")") or peek() in _OPERATORS or not isinstance(node, str):
+                raise LicenseExpressionError("WITH needs a license on the left and an exception on the right")
+            node = ("WITH", node, take())
+        return node
+
+    def parse_atom():
+        token = peek()
+        if token is None or token == ")" or token in _OPERATORS:
+            raise LicenseExpressionError(f"Unexpected {'end' if token is None else tokens[position]!r}")
+        if token == "(":
+            take()
+            node = parse_or()
+            if peek() != ")":
+                raise LicenseExpressionError("Unbalanced parentheses")
+            take()
+            return node
+        return canonical_id(take())
+
+    node = parse_or()
+    if position != len(tokens):
+        raise LicenseExpressionError(f"Unexpected {tokens[position]!r}")
+    return node
+
+
+def _sort_key(node):
+    return format_expression(node)
+
+
+def _combine(operator, operands):
+    """Flatten nested operands of the same operator, de-duplicate and sort them"""
+    flat = []
+    for operand in operands:
+        if isinstance(operand, tuple) and operand[0] == operator:
+            flat.extend(operand[1])
+        else:
+            flat.append(operand)
+    unique = sorted(set(flat), key=_sort_key)
+    return unique[0] if len(unique) == 1 else (operator, tuple(unique))
+
+
+def format_expression(node, nested=False):
+    """SPDX text of a tree; nested AND/OR groups are always parenthesized"""
+    if isinstance(node, str):
+        return node
+    if node[0] == "WITH":
+        return f"{node[1]} WITH {node[2]}"
+    text = f" {node[0]} ".join(format_expression(operand, True) for operand in node[1])
+    return f"({text})" if nested else text
+
+
+@lru_cache(maxsize=None)
+def parse_license(expression):
+    """
+    Parse an SPDX license expression into its normalized tree.
+    Strings that are not valid expressions ("SEE LICENSE IN LICENSE.md")
+    are kept whole as a single opaque license id.
+    """
+    expression = (expression or "").strip()
+    if not expression:
+        return UNKNOWN_LICENSE
+    try:
+        return _parse(_TOKEN_RE.findall(expression))
+    except (LicenseExpressionError, IndexError):
+        return expression
+
+
+def license_ids(node):
+    """Every license id in the tree (exceptions excluded), in order"""
+    if isinstance(node, str):
+        return (node,)
+    if node[0] == "WITH":
+        return (node[1],)
+    ids = []
+    for operand in node[1]:
+        ids.extend(license_id for license_id in license_ids(operand) if license_id not in ids)
+    return tuple(ids)
+
+
+def license_category(license_id):
+    info = LICENSE_INFO.get(license_family(license_id))
+    if info is not None:
+        return info[0]
+    if license_id.startswith(("GPL-", "AGPL-")):
+        return STRONG_COPYLEFT
+    if license_id.startswith(("LGPL-", "MPL-", "EPL-", "CDDL-")):
+        return WEAK_COPYLEFT
+    return UNKNOWN
+
+
+def _node_category(node):
+    if isinstance(node, str):
+        return license_category(node)
+    if node[0] == "WITH":
+        return license_category(node[1])
+    ranks = [CATEGORY_ORDER.index(_node_category(operand)) for operand in node[1]]
+    return CATEGORY_ORDER[min(ranks) if node[0] == "OR" else max(ranks)]
+
+
+class LicenseInfo:
+    """Normalized view of one license expression"""
+
+    __slots__ = ("expression", "tree", "ids", "category")
+
+    def __init__(self, expression, tree, ids, category):
+        self.expression = expression
+        self.tree = tree
+        self.ids = ids
+        self.category = category
+
+
+@lru_cache(maxsize=None)
+def normalize_license(expression):
+    """Memoized LicenseInfo for a raw license string"""
+    tree = parse_license(expression)
+    return LicenseInfo(format_expression(tree), tree, license_ids(tree), _node_category(tree))
+
+
+def license_description(license_id):
+    info = LICENSE_INFO.get(license_family(license_id))
+    return info[1] if info is not None else None
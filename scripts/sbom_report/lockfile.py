@@ -0,0 +1,354 @@
+"""
+package.json / package-lock.json ingestion
+Streams the v2/v3 lockfile "packages" map entry by entry into a
+ComponentStore, which the report tables consume in place of DEPENDENCIES.
+Each entry's dependencies are resolved the way node does, walking up the
+node_modules directories, and recorded as edges between component rows.
+"""
+
+import json
+import os
+from array import array
+
+from .jsonstream import JsonStream
+from .model import ComponentStore
+
+NODE_MODULES = "node_modules/"
+ECOSYSTEM = "npm"
+UNKNOWN_LICENSE = "NOASSERTION"
+
+SCOPE_PRODUCTION = "Production"
+SCOPE_DEVELOPMENT = "Development"
+
+TYPE_DIRECT = "Direct"
+TYPE_TRANSITIVE = "Transitive"
+
+# Entry fields naming the packages an installed package requires
+DEPENDENCY_KEYS = ("dependencies", "optionalDependencies", "peerDependencies")
+
+
+def read_package_manifest(path):
+    """Read the direct dependency names from package.json"""
+    with open(path, encoding="utf-8") as fp:
+        manifest = json.load(fp)
+    return _manifest_summary(manifest)
+
+
+def _manifest_summary(manifest):
+    production = set()
+    for key in ("dependencies", "optionalDependencies", "peerDependencies"):
+        production.update(manifest.get(key) or {})
+    return {
+        "name": manifest.get("name"),
+        "version": manifest.get("version"),
+        "license": _license(manifest),
+        "production": production,
+        "development": set(manifest.get("devDependencies") or {}),
+    }
+
+
+def _license(entry):
+    """Normalize the npm license field (string, legacy object or list)"""
+    lic = entry.get("license")
+    if isinstance(lic, dict):
+        lic = lic.get("type")
+    if not lic:
+        legacy = entry.get("licenses")
+        if isinstance(legacy, list) and legacy:
+            names = [item.get("type") if isinstance(item, dict) else item for item in legacy]
+            lic = " OR ".join(name for name in names if name)
+    return lic if isinstance(lic, str) and lic else UNKNOWN_LICENSE
+
+
+def _package_name(path, entry):
+    """Package name for a lockfile key such as node_modules/a/node_modules/@b/c"""
+    name = entry.get("name")
+    if name:
+        return name
+    return path[path.rfind(NODE_MODULES) + len(NODE_MODULES):]
+
+
+def _requires(entry):
+    names = []
+    for key in DEPENDENCY_KEYS:
+        names.extend(entry.get(key) or ())
+    return names
+
+
+def iter_lockfile_components(lock_path, manifest=None, paths=None):
+    """
+    Yield (scope, component) for every installed package in the lockfile.
+    Each distinct name@version is reported once; links and workspace sources
+    are skipped since they are first-party code. When paths is a dict it is
+    filled with install path -> ((name, version), required names) for every
+    installed copy, duplicates included.
+    """
+    seen = set()
+    with open(lock_path, encoding="utf-8") as fp:
+        stream = JsonStream(fp)
+        found_packages = False
+        for key in stream.iter_object():
+            if key == "lockfileVersion":
+                version = stream.read_value()
+                if version == 1:
+                    raise ValueError(
+                        f"{lock_path}: lockfileVersion 1 is not supported; "
+                        "regenerate it with npm 7 or later"
+                    )
+            elif key == "packages":
+                found_packages = True
+                for path, entry in stream.iter_items():
+                    if path == "":
+                        if manifest is None:
+                            manifest = _manifest_summary(entry)
+                        continue
+                    if NODE_MODULES not in path or entry.get("link"):
+                        continue
+
+                    name = _package_name(path, entry)
+                    version = entry.get("version", "")
+                    if paths is not None:
+                        paths[path] = ((name, version), _requires(entry))
+                    if (name, version) in seen:
+                        continue
+                    seen.add((name, version))
+
+                    dev = entry.get("dev") or entry.get("devOptional")
+                    scope = SCOPE_DEVELOPMENT if dev else SCOPE_PRODUCTION
+                    direct = (
+                        manifest is not None
+                        and path == NODE_MODULES + name
+                        and (name in manifest["production"] or name in manifest["development"])
+                    )
+                    yield scope, {
+                        "name": name,
+                        "version": version,
+                        "license": _license(entry),
+                        "type": TYPE_DIRECT if direct else TYPE_TRANSITIVE,
+                    }
+    if not found_packages:
+        raise ValueError(f"{lock_path}: no 'packages' map found (lockfileVersion 2 or 3 required)")
+
+
+def npm_purl(name, version):
+    """Package URL for an npm package (the @scope prefix is percent-encoded)"""
+    if name.startswith("@"):
+        name = "%40" + name[1:]
+    return f"pkg:npm/{name}@{version}" if version else f"pkg:npm/{name}"
+
+
+def resolve_path(paths, path, name):
+    """Install path node would load name from when required at path, or None"""
+    while True:
+        candidate = f"{path}/{NODE_MODULES}{name}" if path else NODE_MODULES + name
+        if candidate in paths:
+            return candidate
+        if not path:
+            return None
+        cut = path.rfind("/" + NODE_MODULES)
+        path = path[:cut] if cut >= 0 else ""
+
+
+def _add_edges(store, paths, rows):
+    seen = set()
+    for path, (key, requires) in paths.items():
+        source = rows[key]
+        for name in requires:
+            target_path = resolve_path(paths, path, name)
+            if target_path is None:
+                # Unmet optional or peer dependency
+                continue
+            edge = (source, rows[paths[target_path][0]])
+            if edge not in seen:
+                seen.add(edge)
+                store.add_edge(*edge)
+
+
+class IncrementalLockfile:
+    """
+    Lockfile loader that keeps what it parsed between loads, for watch mode.
+    Each load streams the "packages" map, compares every entry with the one
+    seen last time, and re-derives name, version, license and required names
+    only for entries that changed. Dependency resolution is redone only for
+    those entries and for entries requiring a name whose install paths came
+    or went. When no package was added or removed the kept store is updated
+    row by row; otherwise it is rebuilt from the kept per-entry state.
+    """
+
+    def __init__(self, lock_path, package_json_path=None):
+        if package_json_path is None:
+            candidate = os.path.join(os.path.dirname(os.path.abspath(lock_path)), "package.json")
+            if os.path.exists(candidate):
+                package_json_path = candidate
+        self.lock_path = lock_path
+        self.package_json_path = package_json_path
+        self.store = None
+        self._manifest = None
+        # Install path -> raw lockfile entry, as last loaded
+        self._entries = {}
+        # Install path -> (name, version, license, dev, required names)
+        self._derived = {}
+        # Install path -> install paths its required names resolve to
+        self._targets = {}
+        # (name, version) -> row, the install path that row was taken from, and its number of install paths
+        self._rows = {}
+        self._first = {}
+        self._copies = {}
+
+    def _read_packages(self):
+        """
+        Stream the "packages" map one entry at a time, as iter_lockfile_components
+        does, comparing each installed entry with the one kept from the previous
+        load. Returns (root entry, installed entries, changed install paths).
+        """
+        previous = self._entries
+        root = {}
+        installed = {}
+        changed = set()
+        found_packages = False
+        with open(self.lock_path, encoding="utf-8") as fp:
+            stream = JsonStream(fp)
+            for key in stream.iter_object():
+                if key == "lockfileVersion":
+                    if stream.read_value() == 1:
+                        raise ValueError(
+                            f"{self.lock_path}: lockfileVersion 1 is not supported; "
+                            "regenerate it with npm 7 or later"
+                        )
+                elif key == "packages":
+                    found_packages = True
+                    for path, entry in stream.iter_items():
+                        if path == "":
+                            root = entry
+                        elif NODE_MODULES in path and not entry.get("link"):
+                            installed[path] = entry
+                            if previous.get(path) != entry:
+                                changed.add(path)
+        if not found_packages:
+            raise ValueError(f"{self.lock_path}: no 'packages' map found (lockfileVersion 2 or 3 required)")
+        return root, installed, changed
+
+    def load(self):
+        """(ComponentStore, install paths added, changed or removed since the previous load)"""
+        root, installed, changed = self._read_packages()
+        if self.package_json_path:
+            manifest = read_package_manifest(self.package_json_path)
+        else:
+            manifest = _manifest_summary(root)
+
+        previous, derived = self._entries, self._derived
+        removed = previous.keys() - installed.keys()
+        old = {path: derived.pop(path) for path in changed | removed if path in derived}
+        for path in removed:
+            del self._targets[path]
+        for path in changed:
+            entry = installed[path]
+            derived[path] = (_package_name(path, entry), entry.get("version", ""), _license(entry),
+                             bool(entry.get("dev") or entry.get("devOptional")), _requires(entry))
+        self._entries = installed
+
+        # Paths appearing or disappearing can change where any require of their name resolves
+        moved = {derived[path][0] for path in changed if path not in old}
+        moved.update(old[path][0] for path in removed)
+        retargeted = False
+        for path, (_, _, _, _, requires) in derived.items():
+            if path in changed or (moved and not moved.isdisjoint(requires)):
+                targets = [target for target in (resolve_path(installed, path, name) for name in requires)
+                           if target is not None]
+                if targets != self._targets.get(path):
+                    self._targets[path] = targets
+                    retargeted = True
+
+        if self.store is None or manifest != self._manifest or not self._update_rows(changed, removed, old):
+            self._build(installed, manifest)
+        elif retargeted:
+            self._build_edges(installed)
+        self._manifest = manifest
+        return self.store, changed | removed
+
+    def _component_type(self, path, name, manifest):
+        direct = path == NODE_MODULES + name and (name in manifest["production"] or name in manifest["development"])
+        return TYPE_DIRECT if direct else TYPE_TRANSITIVE
+
+    def _update_rows(self, changed, removed, old):
+        """Apply changed entries to the kept store in place; False when the rows themselves came or went"""
+        if removed or any(path not in old for path in changed):
+            return False
+        updates = []
+        renamed = set()
+        for path in changed:
+            old_key, new_key = old[path][:2], self._derived[path][:2]
+            if new_key != old_key:
+                # A lone copy may move to a version nobody else has; anything else reshapes the rows
+                if (self._first[old_key] != path or self._copies[old_key] != 1 or new_key in self._rows
+                        or new_key in renamed):
+                    return False
+                renamed.add(new_key)
+            if self._first[old_key] == path:
+                updates.append((path, old_key, new_key))
+        store = self.store
+        for path, old_key, new_key in updates:
+            name, version, license, dev, _ = self._derived[path]
+            row = self._rows.pop(old_key)
+            del self._first[old_key]
+            self._copies[new_key] = self._copies.pop(old_key)
+            self._rows[new_key] = row
+            self._first[new_key] = path
+            store.set_component(row, name, version, license, npm_purl(name, version))
+            store.set_type(row, self._component_type(path, name, self._manifest))
+            store.set_scope(row, SCOPE_DEVELOPMENT if dev else SCOPE_PRODUCTION)
+        return True
+
+    def _build(self, installed, manifest):
+        store = ComponentStore()
+        if self.package_json_path and manifest["name"]:
+            store.project = {"name": manifest["name"], "version": manifest["version"] or ""}
+        rows, first, copies = {}, {}, {}
+        for path in installed:
+            name, version, license, dev, _ = self._derived[path]
+            key = (name, version)
+            copies[key] = copies.get(key, 0) + 1
+            if key in rows:
+                continue
+            first[key] = path
+            rows[key] = store.add(name, version, license, self._component_type(path, name, manifest),
+                                  SCOPE_DEVELOPMENT if dev else SCOPE_PRODUCTION, ECOSYSTEM, npm_purl(name, version))
+        self.store, self._rows, self._first, self._copies = store, rows, first, copies
+        self._build_edges(installed)
+
+    def _build_edges(self, installed):
+        store, rows, derived = self.store, self._rows, self._derived
+        store.edge_sources = array('I')
+        store.edge_targets = array('I')
+        seen = set()
+        for path in installed:
+            source = rows[derived[path][:2]]
+            for target in self._targets[path]:
+                edge = (source, rows[derived[target][:2]])
+                if edge not in seen:
+                    seen.add(edge)
+                    store.add_edge(*edge)
+
+
+def load_lockfile_dependencies(lock_path, package_json_path=None):
+    """
+    Load the lockfile into a ComponentStore (a scope -> components mapping).
+    package.json defaults to the file next to the lockfile when present.
+    """
+    if package_json_path is None:
+        candidate = os.path.join(os.path.dirname(os.path.abspath(lock_path)), "package.json")
+        if os.path.exists(candidate):
+            package_json_path = candidate
+    manifest = read_package_manifest(package_json_path) if package_json_path else None
+
+    store = ComponentStore()
+    if manifest is not None and manifest["name"]:
+        store.project = {"name": manifest["name"], "version": manifest["version"] or ""}
+    paths = {}
+    rows = {}
+    for scope, component in iter_lockfile_components(lock_path, manifest, paths):
+        name, version = component["name"], component["version"]
+        rows[name, version] = store.add(name, version, component["license"], component["type"], scope,
+                                        ECOSYSTEM, npm_purl(name, version))
+    _add_edges(store, paths, rows)
+    return store
@@ -0,0 +1,223 @@
+"""
+Compact component model
+Components are held column-wise: names, versions and references in plain
+lists, and the low-cardinality fields (license, type, scope, ecosystem) as
+integer codes into shared string tables. Per-component records are only
+materialized while iterating.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+
+SCOPE_ORDER = ("Production", "Development")
+
+
+class StringTable:
+    """Intern table mapping repeated strings to small integer codes"""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, value):
+        """Return the code for value, or None when it was never interned"""
+        return self._codes.get(value)
+
+    def __len__(self):
+        return len(self.values)
+
+
+class Component:
+    """Read-only view of one stored component (supports dep['name'] access)"""
+
+    __slots__ = ("name", "version", "license", "type", "scope", "ecosystem", "purl", "ref")
+
+    def __init__(self, name, version, license, type, scope, ecosystem="", purl="", ref=""):
+        self.name = name
+        self.version = version
+        self.license = license
+        self.type = type
+        self.scope = scope
+        self.ecosystem = ecosystem
+        self.purl = purl
+        self.ref = ref
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __repr__(self):
+        return f"Component({self.name}@{self.version}, {self.license}, {self.scope})"
+
+
+class ScopeView(Sequence):
+    """The components of one scope, in insertion order"""
+
+    __slots__ = ("_store", "_rows")
+
+    def __init__(self, store, rows):
+        self._store = store
+        self._rows = rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ScopeView(self._store, self._rows[index])
+        return self._store.component(self._rows[index])
+
+    def __iter__(self):
+        component = self._store.component
+        for row in self._rows:
+            yield component(row)
+
+    @property
+    def rows(self):
+        return self._rows
+
+
+class ComponentStore(Mapping):
+    """
+    Columnar component inventory.
+    Behaves as a read-only mapping of scope -> components so it can be passed
+    anywhere the DEPENDENCIES dict is accepted.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.versions = []
+        self.purls = []
+        self.refs = []
+        self.strings = StringTable()
+        self.license_codes = array('I')
+        self.type_codes = array('I')
+        self.scope_codes = array('I')
+        self.ecosystem_codes = array('I')
+        # Dependency edges as parallel arrays of row indices
+        self.edge_sources = array('I')
+        self.edge_targets = array('I')
+        self.project = {}
+        self._scope_rows = None
+
+    @property
+    def size(self):
+        """Total number of components across all scopes"""
+        return len(self.names)
+
+    def add(self, name, version, license, type, scope, ecosystem="", purl="", ref=""):
+        """Append a component and return its row index"""
+        row = len(self.names)
+        code = self.strings.code
+        self.names.append(name)
+        self.versions.append(version)
+        self.purls.append(sys.intern(purl) if purl else "")
+        self.refs.append(sys.intern(ref) if ref else "")
+        self.license_codes.append(code(license))
+        self.type_codes.append(code(type))
+        self.scope_codes.append(code(scope))
+        self.ecosystem_codes.append(code(ecosystem))
+        self._scope_rows = None
+        return row
+
+    def add_edge(self, source_row, target_row):
+        self.edge_sources.append(source_row)
+        self.edge_targets.append(target_row)
+
+    def set_component(self, row, name, version, license, purl=""):
+        """Replace a row's name, version, license and purl in place"""
+        self.names[row] = name
+        self.versions[row] = version
+        self.license_codes[row] = self.strings.code(license)
+        self.purls[row] = sys.intern(purl) if purl else ""
+
+    def set_type(self, row, type):
+        self.type_codes[row] = self.strings.code(type)
+
+    def set_scope(self, row, scope):
+        self.scope_codes[row] = self.strings.code(scope)
+        self._scope_rows = None
+
+    def _scope_index(self):
+        """scope -> row indices, rebuilt lazily after the store changes"""
+        if self._scope_rows is None:
+            by_code = {}
+            for row, scope_code in enumerate(self.scope_codes):
+                rows = by_code.get(scope_code)
+                if rows is None:
+                    rows = by_code[scope_code] = array('I')
+                rows.append(row)
+            values = self.strings.values
+            self._scope_rows = {values[scope_code]: rows for scope_code, rows in by_code.items()}
+        return self._scope_rows
+
+    def component(self, row):
+        values = self.strings.values
+        return Component(
+            self.names[row],
+            self.versions[row],
+            values[self.license_codes[row]],
+            values[self.type_codes[row]],
+            values[self.scope_codes[row]],
+            values[self.ecosystem_codes[row]],
+            self.purls[row],
+            self.refs[row],
+        )
+
+    def license_of(self, row):
+        return self.strings.values[self.license_codes[row]]
+
+    def scope_of(self, row):
+        return self.strings.values[self.scope_codes[row]]
+
+    def ecosystem_of(self, row):
+        return self.strings.values[self.ecosystem_codes[row]]
+
+    def __iter__(self):
+        index = self._scope_index()
+        for scope in SCOPE_ORDER:
+            if scope in index:
+                yield scope
+        for scope in index:
+            if scope not in SCOPE_ORDER:
+                yield scope
+
+    def __len__(self):
+        return len(self._scope_index())
+
+    def __getitem__(self, scope):
+        return ScopeView(self, self._scope_index()[scope])
+
+    def __contains__(self, scope):
+        return scope in self._scope_index()
+
+    def iter_components(self):
+        """Yield every component in row order"""
+        for row in range(len(self.names)):
+            yield self.component(row)
+
+    @classmethod
+    def from_dependencies(cls, dependencies, ecosystem="npm"):
+        """Build a store from a scope -> list of component dicts mapping"""
+        store = cls()
+        for scope, deps in dependencies.items():
+            for dep in deps:
+                store.add(dep['name'], dep['version'], dep['license'], dep['type'], scope,
+                          dep.get('ecosystem', ecosystem), dep.get('purl', ""), dep.get('ref', ""))
+        return store
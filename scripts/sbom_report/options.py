@@ -0,0 +1,26 @@
+"""
+Option values shared by the command line and the modules behind it
+Kept free of imports so the argument parser can offer the export formats,
+trend periods and cache size without loading the exporters, history or
+cache modules; those modules take their defaults from here.
+"""
+
+# Report cache size limit
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Export format -> default file suffix (exporters.EXPORTERS adds the writers)
+EXPORT_SUFFIXES = {
+    "csv": ".csv",
+    "ndjson": ".ndjson",
+    "json": ".json",
+    "cyclonedx": ".cdx.json",
+    "spdx": ".spdx.json",
+}
+
+# Trend period -> strftime format applied to the ISO snapshot time
+PERIODS = {
+    "snapshot": "%Y-%m-%dT%H:%M:%SZ",
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+}
@@ -0,0 +1,226 @@
+"""
+Paginated table engine for large inventories
+Row heights are measured once up front; page breaks are then found by
+bisecting the cumulative heights, and each page is drawn as its own small
+Table with the header repeated. ReportLab never has to re-wrap or re-split
+the full table, so layout time grows linearly with the row count.
+A compact table draws the backgrounds and grid of each page itself
+(CompactChunk) with a handful of operators instead of one per row and line.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from reportlab.lib import colors
+from reportlab.platypus import Table, TableStyle
+from reportlab.platypus.flowables import Flowable
+
+# Style commands a CompactChunk draws itself
+CHUNK_DECORATION = ('BACKGROUND', 'ROWBACKGROUNDS', 'GRID')
+
+
+def measure_row_heights(header, rows, col_widths, style_commands):
+    """
+    Measure the header height and per-row heights for plain string cells.
+    A probe table gives the exact single- and two-line heights for the
+    style; multi-line rows are then derived from the line count.
+    """
+    width = len(header)
+    probe = Table([header, ['x'] * width, ['x\nx'] * width], colWidths=col_widths)
+    probe.setStyle(TableStyle(style_commands))
+    probe.wrap(sum(col_widths), 1e9)
+    header_height, single, double = probe._rowHeights
+    per_line = double - single
+
+    heights = array('d')
+    for row in rows:
+        lines = 1
+        for value in row:
+            if '\n' in value:
+                lines = max(lines, value.count('\n') + 1)
+        heights.append(single + (lines - 1) * per_line)
+    return header_height, heights
+
+
+class PaginatedTable(Flowable):
+    """
+    Flowable for a pre-measured table.
+    split() cuts at the last row that fits the frame and returns a Table for
+    that page (a CompactChunk when compact) plus a PaginatedTable for the
+    remainder, which shares the row data and height offsets with its parent.
+    """
+
+    def __init__(self, header, rows, col_widths, style_commands, header_height=None,
+                 offsets=None, start=0, end=None, compact=False):
+        Flowable.__init__(self)
+        self.header = header
+        self.rows = rows
+        self.col_widths = col_widths
+        self.style_commands = style_commands
+        if offsets is None:
+            header_height, heights = measure_row_heights(header, rows, col_widths, style_commands)
+            # offsets[i] is the height of rows[:i]
+            offsets = array('d', [0.0])
+            total = 0.0
+            for height in heights:
+                total += height
+                offsets.append(total)
+        self.header_height = header_height
+        self.offsets = offsets
+        self.start = start
+        self.end = len(rows) if end is None else end
+        self.compact = compact
+        self.width = sum(col_widths)
+
+    def _rows_height(self, start, end):
+        return self.offsets[end] - self.offsets[start]
+
+    def wrap(self, availWidth, availHeight):
+        self.height = self.header_height + self._rows_height(self.start, self.end)
+        return self.width, self.height
+
+    def _fitting_end(self, availHeight, start=None):
+        """Index one past the last row from start (default: self.start) that fits below the header"""
+        start = self.start if start is None else start
+        limit = self.offsets[start] + availHeight - self.header_height
+        end = bisect_right(self.offsets, limit, start, self.end + 1) - 1
+        return max(end, start)
+
+    def slice(self, start, end=None):
+        """PaginatedTable for rows[start:end], sharing the measurements and keeping the banding"""
+        return PaginatedTable(self.header, self.rows, self.col_widths, self.style_commands,
+                              self.header_height, self.offsets, start, self.end if end is None else end,
+                              self.compact)
+
+    def page_ranges(self, first_height, height):
+        """
+        (start, end) row ranges of the pages the table splits into, given the
+        height left on its first page and the height of every later page
+        """
+        ranges = []
+        start, available = self.start, first_height
+        while start < self.end:
+            end = self._fitting_end(available, start)
+            if end == start:
+                if available == height:
+                    # Taller than a page; the frame would reject it too
+                    end = start + 1
+                else:
+                    available = height
+                    continue
+            ranges.append((start, end))
+            start, available = end, height
+        return ranges
+
+    def split(self, availWidth, availHeight):
+        end = self._fitting_end(availHeight)
+        if end == self.start:
+            return []
+        chunk = self.build_chunk(self.start, end)
+        if end == self.end:
+            return [chunk]
+        rest = PaginatedTable(self.header, self.rows, self.col_widths, self.style_commands,
+                              self.header_height, self.offsets, end, self.end, self.compact)
+        return [chunk, rest]
+
+    def build_chunk(self, start, end):
+        """Build the Table for rows[start:end] with the header and banding continued"""
+        offsets = self.offsets
+        row_heights = [self.header_height]
+        row_heights.extend(offsets[i + 1] - offsets[i] for i in range(start, end))
+        data = [self.header]
+        data.extend(self.rows[start:end])
+        table = Table(data, colWidths=self.col_widths, rowHeights=row_heights, repeatRows=1)
+        if self.compact:
+            return CompactChunk(table, self._chunk_style(start))
+        table.setStyle(TableStyle(self._chunk_style(start)))
+        return table
+
+    def _chunk_style(self, start):
+        if start % 2 == 0:
+            return self.style_commands
+        commands = []
+        for command in self.style_commands:
+            if command[0] == 'ROWBACKGROUNDS':
+                band = list(command[3])
+                command = command[:3] + (band[1:] + band[:1],) + tuple(command[4:])
+            commands.append(command)
+        return commands
+
+    def draw(self):
+        table = self.build_chunk(self.start, self.end)
+        table.wrapOn(self.canv, self.width, self.height)
+        table.drawOn(self.canv, 0, 0)
+
+
+def _cell_range(command, columns, rows):
+    """(first column, first row, last column, last row) of a style command, negative indices resolved"""
+    (c0, r0), (c1, r1) = command[1], command[2]
+    return (c0 % columns, r0 % rows, c1 % columns, r1 % rows)
+
+
+class CompactChunk(Flowable):
+    """
+    One page of a compact table
+    The Table draws the cell text; every background command becomes one
+    filled path per color and every GRID one stroked path, where ReportLab
+    fills each row and strokes each line on its own. White fills on cells
+    nothing was painted on before are left out, as the pages are white.
+    """
+
+    def __init__(self, table, style_commands):
+        Flowable.__init__(self)
+        self.table = table
+        self.decoration = [command for command in style_commands if command[0] in CHUNK_DECORATION]
+        table.setStyle(TableStyle([command for command in style_commands if command[0] not in CHUNK_DECORATION]))
+
+    def wrap(self, availWidth, availHeight):
+        self.width, self.height = self.table.wrap(availWidth, availHeight)
+        return self.width, self.height
+
+    def _fill(self, rectangles, color):
+        canvas = self.canv
+        path = canvas.beginPath()
+        for rectangle in rectangles:
+            path.rect(*rectangle)
+        canvas.setFillColor(color)
+        canvas.drawPath(path, stroke=0, fill=1)
+
+    def draw(self):
+        canvas, table = self.canv, self.table
+        xs, ys = table._colpositions, table._rowpositions
+        columns, rows = len(xs) - 1, len(ys) - 1
+        painted = set()
+        grids = []
+        for command in self.decoration:
+            c0, r0, c1, r1 = _cell_range(command, columns, rows)
+            if command[0] == 'GRID':
+                grids.append((c0, r0, c1, r1, command[3], command[4]))
+                continue
+            band = command[3] if command[0] == 'ROWBACKGROUNDS' else [command[3]]
+            fills = {}
+            for row in range(r0, r1 + 1):
+                color = band[(row - r0) % len(band)]
+                cells = {(column, row) for column in range(c0, c1 + 1)}
+                if color is None or (color == colors.white and not cells & painted):
+                    continue
+                painted |= cells
+                fills.setdefault(color, []).append((xs[c0], ys[row], xs[c1 + 1] - xs[c0], ys[row + 1] - ys[row]))
+            for color, rectangles in fills.items():
+                self._fill(rectangles, color)
+
+        table.drawOn(canvas, 0, 0)
+
+        for c0, r0, c1, r1, width, color in grids:
+            path = canvas.beginPath()
+            for y in ys[r0:r1 + 2]:
+                path.moveTo(xs[c0], y)
+                path.lineTo(xs[c1 + 1], y)
+            for x in xs[c0:c1 + 2]:
+                path.moveTo(x, ys[r1 + 1])
+                path.lineTo(x, ys[r0])
+            canvas.setLineCap(1)
+            canvas.setLineJoin(1)
+            canvas.setLineWidth(width)
+            canvas.setStrokeColor(color)
+            canvas.drawPath(path, stroke=1, fill=0)
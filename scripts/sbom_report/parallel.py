@@ -0,0 +1,166 @@
+"""
+Parallel report rendering
+Every section starts on a new page, and the component tables split into
+pages at row boundaries known from their pre-measured heights, so the report
+can be cut into parts that each fill whole pages: the front matter and
+sections 1-2, runs of inventory pages, and sections 3.3-8. The parent lays
+out the short front part itself; its page count plus the predicted page
+count of every inventory run give each part its first page number, and the
+remaining parts are laid out on worker processes with their footers already
+numbered. A part whose actual page count differs from the prediction makes
+the parts after it render again with corrected numbers. The part PDFs are
+then joined in order with pypdf.
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus.frames import Frame
+
+from .profiling import NULL_PROFILER
+from .report import (INVENTORY_SECTIONS, SECTIONS, StoryContext, build_sections, create_custom_styles,
+                     CompactCanvas, create_title_page, draw_footer, report_document)
+from .stats import compute_stats
+
+# Fewest inventory pages worth a part of their own
+MIN_PART_PAGES = 10
+
+FRONT_SECTIONS = ("front", "summary", "project")
+
+_worker_context = None
+
+
+def _available_height(doc, flowables):
+    """Frame height left on a fresh page of doc after laying out flowables"""
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height)
+    canvas = Canvas(BytesIO())
+    for flowable in flowables:
+        frame.add(flowable, canvas)
+    return frame._y - frame._y1p
+
+
+def plan_parts(context, workers, part_pages=None):
+    """
+    Cut the report after the front part into (sections, start, end, predicted pages)
+    parts: runs of whole inventory pages (part_pages long, by default enough
+    for two parts per worker), then sections 3.3-8 together
+    """
+    doc = report_document(os.devnull)
+    page_height = _available_height(doc, ())
+    runs = []
+    for name in INVENTORY_SECTIONS:
+        table = context.component_table(INVENTORY_SECTIONS[name])
+        headings = build_sections(context, [name])[:-1]
+        pages = table.page_ranges(_available_height(doc, headings), page_height)
+        runs.append((name, pages or [(0, 0)]))
+
+    total = sum(len(pages) for _, pages in runs)
+    per_part = part_pages or max(MIN_PART_PAGES, -(-total // (2 * workers)))
+    parts = []
+    for name, pages in runs:
+        for first in range(0, len(pages), per_part):
+            run = pages[first:first + per_part]
+            end = run[-1][1] if first + per_part < len(pages) else None
+            parts.append(((name,), run[0][0], end, len(run)))
+    rest = [name for name, _ in SECTIONS if name not in FRONT_SECTIONS and name not in INVENTORY_SECTIONS]
+    parts.append((tuple(rest), 0, None, None))
+    return parts
+
+
+def render_part(context, names, start, end, path, first_page):
+    """Lay out one part into path, numbering its pages from first_page; returns the page count"""
+    doc = report_document(path, context.compact)
+    story = build_sections(context, names, start, end)
+    footer = partial(draw_footer, project=context.project, first_page=first_page)
+    if first_page == 1:
+        first = partial(create_title_page, project=context.project, templates=context.templates)
+    else:
+        first = footer
+    doc.build(story, onFirstPage=first, onLaterPages=footer, canvasmaker=CompactCanvas if context.compact else Canvas)
+    return doc.page
+
+
+def init_worker(dependencies, project, findings, stats, policy=None, boilerplate=None, compact=False):
+    """Build the stylesheet and story context (with templates for boilerplate) once per worker process"""
+    global _worker_context
+    templates = None
+    if boilerplate is not None:
+        from .templates import ReportTemplates
+        templates = ReportTemplates(boilerplate)
+    _worker_context = StoryContext(dependencies, project, create_custom_styles(), findings=findings, stats=stats,
+                                   policy=policy, templates=templates, compact=compact)
+
+
+def render_task(task):
+    names, start, end, path, first_page = task
+    return render_part(_worker_context, names, start, end, path, first_page)
+
+
+def _first_pages(front_pages, counts):
+    numbers = []
+    page = front_pages + 1
+    for count in counts:
+        numbers.append(page)
+        page += count or 0
+    return numbers
+
+
+def generate_sbom_report(filename, dependencies, project, workers, styles=None, profiler=NULL_PROFILER, findings=None,
+                         policy=None, templates=None, compact=False):
+    """
+    Generate the SBOM report on worker processes; same pages and footers as report.generate_sbom_report
+    filename may be a path or a binary file object, which the merged PDF is
+    written to object by object. compact parts are size-optimized, and the
+    objects they have in common (fonts, resources) are merged into one.
+    """
+    from pypdf import PdfWriter
+
+    if styles is None:
+        styles = create_custom_styles()
+    with profiler.phase("story"):
+        stats = compute_stats(dependencies)
+        context = StoryContext(dependencies, project, styles, profiler, findings, stats, policy=policy,
+                               templates=templates, compact=compact)
+        parts = plan_parts(context, workers)
+    profiler.count("components", stats.total)
+    profiler.count("parts", len(parts) + 1)
+
+    directory = tempfile.mkdtemp(prefix="sbom-parts-")
+    try:
+        paths = [os.path.join(directory, f"part-{index:04d}.pdf") for index in range(len(parts) + 1)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(dependencies, project, findings, stats, policy,
+                                           None if templates is None else templates.overrides, compact)) as pool:
+            with profiler.phase("layout"):
+                front_pages = render_part(context, FRONT_SECTIONS, 0, None, paths[0], 1)
+                counts = [predicted for _, _, _, predicted in parts]
+                rendered = [None] * len(parts)
+                stale = range(len(parts))
+                while stale:
+                    first_pages = _first_pages(front_pages, counts)
+                    tasks = [(parts[index][0], parts[index][1], parts[index][2], paths[index + 1],
+                              first_pages[index]) for index in stale]
+                    for index, pages in zip(stale, pool.map(render_task, tasks)):
+                        rendered[index] = first_pages[index]
+                        counts[index] = pages
+                    # Parts numbered from a wrong prediction are laid out again
+                    first_pages = _first_pages(front_pages, counts)
+                    stale = [index for index in range(len(parts)) if rendered[index] != first_pages[index]]
+                    profiler.count("rerendered_parts", len(stale))
+
+        with profiler.phase("write"):
+            writer = PdfWriter()
+            for path in paths:
+                writer.append(path)
+            if compact:
+                writer.compress_identical_objects()
+            writer.write(filename)
+        profiler.count("pages", front_pages + sum(counts))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return filename
@@ -0,0 +1,232 @@
+"""
+License policy evaluation
+A policy file (JSON) lists license patterns under "allow", "review" and
+"deny": exact SPDX ids, shell-style globs ("GPL-*"), "category:<name>" for
+a license category (in any case), or a full "<id> WITH <exception>". It is compiled once
+into an exact-id table, one regex per verdict for the globs and a category
+table. Expressions are evaluated on the tree from licenses.parse_license:
+an OR takes its most permissive operand, since the licensee may choose, and
+an AND its strictest. Verdicts are memoized per license id and per license
+string, and a component store is evaluated once per distinct license code,
+so each component costs a single lookup.
+"""
+
+import fnmatch
+import json
+import re
+from collections import Counter, namedtuple
+
+from .licenses import CATEGORY_ORDER, license_category, parse_license
+from .sbomdoc import TYPE_APPLICATION
+
+ALLOW = "allow"
+REVIEW = "review"
+DENY = "deny"
+
+# Verdicts from the most to the least permissive
+VERDICTS = (ALLOW, REVIEW, DENY)
+_RANK = {verdict: rank for rank, verdict in enumerate(VERDICTS)}
+
+CATEGORY_PREFIX = "category:"
+# Category names as written in policies: any case, "-" or "_" for spaces
+_CATEGORY_NAMES = {category.casefold(): category for category in CATEGORY_ORDER}
+
+Violation = namedtuple("Violation", "name version license verdict ids")
+
+
+class PolicyError(ValueError):
+    pass
+
+
+class PolicyResult:
+    """Verdict counts and the components that are not allowed"""
+
+    def __init__(self, source, counts, violations, waived=0):
+        self.source = source
+        self.counts = counts
+        self.violations = violations
+        self.waived = waived
+
+    @property
+    def verdict(self):
+        """Strictest verdict of any component"""
+        for verdict in reversed(VERDICTS):
+            if self.counts.get(verdict):
+                return verdict
+        return ALLOW
+
+    @property
+    def denied(self):
+        return bool(self.counts.get(DENY))
+
+    def as_dict(self):
+        """JSON-ready verdict file"""
+        return {
+            "policy": self.source,
+            "verdict": self.verdict,
+            "counts": {verdict: self.counts.get(verdict, 0) for verdict in VERDICTS},
+            "waived": self.waived,
+            "violations": [{"name": v.name, "version": v.version, "license": v.license,
+                            "verdict": v.verdict, "licenses": list(v.ids)} for v in self.violations],
+        }
+
+
+def _glob_regex(patterns):
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+
+class LicensePolicy:
+    """Compiled policy; build it with load_policy or LicensePolicy.from_dict"""
+
+    def __init__(self, exact, globs, categories, default=REVIEW, waivers=(), source=""):
+        # License id (or "id WITH exception") -> verdict
+        self.exact = exact
+        # (verdict, compiled regex) pairs, strictest first
+        self.globs = globs
+        # License category -> verdict
+        self.categories = categories
+        self.default = default
+        # Package names or name@version that are always allowed
+        self.waivers = frozenset(waivers)
+        self.source = source
+        self._ids = {}
+        self._expressions = {}
+
+    @classmethod
+    def from_dict(cls, data, source=""):
+        if not isinstance(data, dict):
+            raise PolicyError("a policy is a JSON object")
+        default = data.get("default", REVIEW)
+        if default not in _RANK:
+            raise PolicyError(f"default must be one of {', '.join(VERDICTS)}, not {default!r}")
+        exact, categories, globs = {}, {}, []
+        for verdict in VERDICTS:
+            patterns = data.get(verdict) or []
+            if isinstance(patterns, str) or not all(isinstance(p, str) for p in patterns):
+                raise PolicyError(f"{verdict} must be a list of license patterns")
+            wildcards = []
+            for pattern in patterns:
+                pattern = pattern.strip()
+                if pattern.startswith(CATEGORY_PREFIX):
+                    name = pattern[len(CATEGORY_PREFIX):].strip()
+                    category = _CATEGORY_NAMES.get(" ".join(re.split(r"[\s_-]+", name.casefold())))
+                    if category is None:
+                        raise PolicyError(f"unknown license category {name!r} "
+                                          f"(expected one of {', '.join(CATEGORY_ORDER)})")
+                    table, key = categories, category
+                elif any(char in pattern for char in "*?["):
+                    wildcards.append(pattern)
+                    continue
+                else:
+                    table, key = exact, _pattern_key(pattern)
+                # A pattern listed under two verdicts takes the stricter one
+                if key not in table or _RANK[verdict] > _RANK[table[key]]:
+                    table[key] = verdict
+            regex = _glob_regex(wildcards)
+            if regex is not None:
+                globs.append((verdict, regex))
+        globs.reverse()
+        return cls(exact, globs, categories, default, data.get("waivers") or (), source)
+
+    def license_verdict(self, license_id):
+        """Verdict for one license id: exact match, then globs, then its category, then the default"""
+        verdict = self._ids.get(license_id)
+        if verdict is None:
+            verdict = self.exact.get(license_id)
+            if verdict is None:
+                for candidate, regex in self.globs:
+                    if regex.match(license_id):
+                        verdict = candidate
+                        break
+            if verdict is None and " WITH " not in license_id:
+                verdict = self.categories.get(license_category(license_id), self.default)
+            self._ids[license_id] = verdict
+        return verdict
+
+    def _evaluate(self, node):
+        """(verdict, license ids that decided it) for a parsed expression tree"""
+        if isinstance(node, str):
+            return self.license_verdict(node), (node,)
+        if node[0] == "WITH":
+            combined = f"{node[1]} WITH {node[2]}"
+            verdict = self.license_verdict(combined)
+            if verdict is not None:
+                return verdict, (combined,)
+            return self.license_verdict(node[1]), (node[1],)
+        results = [self._evaluate(operand) for operand in node[1]]
+        pick = min if node[0] == "OR" else max
+        verdict = pick((result[0] for result in results), key=_RANK.__getitem__)
+        ids = []
+        for result_verdict, result_ids in results:
+            if result_verdict == verdict:
+                ids.extend(license_id for license_id in result_ids if license_id not in ids)
+        return verdict, tuple(ids)
+
+    def evaluate_expression(self, expression):
+        """Memoized (verdict, deciding license ids) for a raw license string"""
+        result = self._expressions.get(expression)
+        if result is None:
+            result = self._expressions[expression] = self._evaluate(parse_license(expression))
+        return result
+
+    def evaluate(self, store):
+        """PolicyResult for every component of a ComponentStore but the application itself"""
+        values = store.strings.values
+        application = store.strings.lookup(TYPE_APPLICATION)
+        per_code = Counter(store.license_codes)
+        results = {code: self.evaluate_expression(values[code]) for code in per_code}
+        counts = Counter()
+        for code, count in per_code.items():
+            counts[results[code][0]] += count
+
+        violations = []
+        waived = 0
+        flagged = {code for code, (verdict, _) in results.items() if verdict != ALLOW}
+        if application is not None:
+            for row, type_code in enumerate(store.type_codes):
+                if type_code == application:
+                    counts[results[store.license_codes[row]][0]] -= 1
+        if flagged:
+            names, versions, waivers = store.names, store.versions, self.waivers
+            for row, code in enumerate(store.license_codes):
+                if code not in flagged or store.type_codes[row] == application:
+                    continue
+                verdict, ids = results[code]
+                if waivers and (names[row] in waivers or f"{names[row]}@{versions[row]}" in waivers):
+                    counts[verdict] -= 1
+                    counts[ALLOW] += 1
+                    waived += 1
+                    continue
+                violations.append(Violation(names[row], versions[row], values[code], verdict, ids))
+        violations.sort(key=lambda v: (-_RANK[v.verdict], v.name, v.version))
+        return PolicyResult(self.source, dict(counts), violations, waived)
+
+
+def _pattern_key(pattern):
+    """Canonical spelling of an exact pattern, so 'mit' or 'GPL-2.0-only with Classpath-exception-2.0' match"""
+    node = parse_license(pattern)
+    if isinstance(node, str):
+        return node
+    if node[0] == "WITH":
+        return f"{node[1]} WITH {node[2]}"
+    raise PolicyError(f"{pattern!r}: list license ids one at a time, not AND/OR expressions")
+
+
+def load_policy(path):
+    """Compile a JSON policy file"""
+    with open(path, encoding="utf-8") as fp:
+        try:
+            data = json.load(fp)
+        except json.JSONDecodeError as e:
+            raise PolicyError(f"{path}: {e}") from None
+    try:
+        return LicensePolicy.from_dict(data, source=path)
+    except PolicyError as e:
+        raise PolicyError(f"{path}: {e}") from None
+
+
+def write_verdicts(fp, result):
+    json.dump(result.as_dict(), fp, indent=2)
+    fp.write("\n")
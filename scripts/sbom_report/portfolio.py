@@ -0,0 +1,229 @@
+"""
+Portfolio roll-up across a directory of SBOMs
+Every SBOM is mapped on a worker process to a small partial aggregate: its
+distinct packages with their versions, license id and category counts, and
+the advisories matched to it. The parent merges the partials as they
+complete, with at most 2 x workers in flight, and drops each one once
+merged, so memory grows with the number of distinct packages in the
+portfolio rather than with its total component count.
+"""
+
+import json
+import os
+
+from .advisories import SEVERITY_ORDER
+from .batch import index_sbom_files, read_assets, run_jobs
+from .diff import package_key
+from .licenses import COPYLEFT_CATEGORIES, PERMISSIVE, PUBLIC_DOMAIN, UNKNOWN, normalize_license
+from .sbomdoc import TYPE_APPLICATION, normalize_name
+from .stats import compute_stats
+
+TOP_PACKAGES = 40
+TOP_LICENSES = 30
+
+_worker_advisories = None
+
+
+class AssetPartial:
+    """What one SBOM contributes to the portfolio"""
+
+    __slots__ = ("asset_id", "components", "by_scope", "by_category", "license_ids", "packages", "findings")
+
+    def __init__(self, asset_id):
+        self.asset_id = asset_id
+        self.components = 0
+        self.by_scope = {}
+        self.by_category = {}
+        # License id -> components
+        self.license_ids = {}
+        # (ecosystem, normalized name) -> (display name, versions)
+        self.packages = {}
+        # (ecosystem, normalized name, version, display name, advisory id, severity)
+        self.findings = []
+
+
+class PortfolioAggregate:
+    """Merged partials: per-package asset counts, license exposure and shared vulnerable versions"""
+
+    def __init__(self):
+        self.assets = []
+        self.components = 0
+        self.by_scope = {}
+        self.by_category = {}
+        # License id -> [components, assets]
+        self.license_ids = {}
+        # Package key -> [display name, assets, {version: assets}]
+        self.packages = {}
+        # (package key, version) -> [display name, {advisory id: severity}, [asset ids]]
+        self.vulnerable = {}
+
+    def merge(self, partial):
+        self.assets.append(partial.asset_id)
+        self.components += partial.components
+        for scope, count in partial.by_scope.items():
+            self.by_scope[scope] = self.by_scope.get(scope, 0) + count
+        for category, count in partial.by_category.items():
+            self.by_category[category] = self.by_category.get(category, 0) + count
+        for license_id, count in partial.license_ids.items():
+            entry = self.license_ids.get(license_id)
+            if entry is None:
+                self.license_ids[license_id] = [count, 1]
+            else:
+                entry[0] += count
+                entry[1] += 1
+        for key, (name, versions) in partial.packages.items():
+            entry = self.packages.get(key)
+            if entry is None:
+                entry = self.packages[key] = [name, 0, {}]
+            entry[1] += 1
+            counts = entry[2]
+            for version in versions:
+                counts[version] = counts.get(version, 0) + 1
+        for ecosystem, name, version, display, advisory_id, severity in partial.findings:
+            entry = self.vulnerable.get(((ecosystem, name), version))
+            if entry is None:
+                entry = self.vulnerable[((ecosystem, name), version)] = [display, {}, []]
+            entry[1][advisory_id] = severity
+            if not entry[2] or entry[2][-1] != partial.asset_id:
+                entry[2].append(partial.asset_id)
+
+    @property
+    def package_versions(self):
+        return sum(len(entry[2]) for entry in self.packages.values())
+
+    def percentage(self, count, total=None):
+        total = len(self.assets) if total is None else total
+        return 100.0 * count / total if total else 0.0
+
+    @property
+    def permissive_count(self):
+        return sum(self.by_category.get(category, 0) for category in (PERMISSIVE, PUBLIC_DOMAIN))
+
+    @property
+    def copyleft_count(self):
+        return sum(self.by_category.get(category, 0) for category in COPYLEFT_CATEGORIES)
+
+    @property
+    def unknown_count(self):
+        return self.by_category.get(UNKNOWN, 0)
+
+    def top_packages(self, limit=TOP_PACKAGES):
+        """(name, ecosystem, assets, version count, most common version) for the most widely used packages"""
+        ranked = sorted(self.packages.items(), key=lambda item: (-item[1][1], item[1][0]))[:limit]
+        rows = []
+        for (ecosystem, _), (name, assets, versions) in ranked:
+            common = max(versions.items(), key=lambda item: (item[1], item[0]))[0]
+            rows.append((name, ecosystem, assets, len(versions), common))
+        return rows
+
+    def license_exposure(self, limit=TOP_LICENSES):
+        """(license id, category, components, assets) ranked by assets, copyleft and unknown first on ties"""
+        rank = {category: index for index, category in enumerate((*COPYLEFT_CATEGORIES, UNKNOWN))}
+        rows = [(license_id, normalize_license(license_id).category, components, assets)
+                for license_id, (components, assets) in self.license_ids.items()]
+        rows.sort(key=lambda row: (-row[3], rank.get(row[1], len(rank)), -row[2], row[0]))
+        return rows[:limit]
+
+    def shared_vulnerabilities(self):
+        """(name, ecosystem, version, {advisory id: severity}, asset ids), most assets and worst severity first"""
+        rank = {severity: index for index, severity in enumerate(SEVERITY_ORDER)}
+        rows = [(name, key[0], version, advisories, assets)
+                for (key, version), (name, advisories, assets) in self.vulnerable.items()]
+        rows.sort(key=lambda row: (-len(row[4]), min(rank.get(s, len(rank)) for s in row[3].values()),
+                                   row[0], row[2]))
+        return rows
+
+    def as_dict(self):
+        """JSON-ready view of the roll-up"""
+        return {
+            "assets": len(self.assets),
+            "components": self.components,
+            "distinct_packages": len(self.packages),
+            "distinct_package_versions": self.package_versions,
+            "by_scope": self.by_scope,
+            "license_categories": self.by_category,
+            "top_packages": [{"name": name, "ecosystem": ecosystem, "assets": assets, "versions": versions,
+                              "common_version": common}
+                             for name, ecosystem, assets, versions, common in self.top_packages()],
+            "licenses": [{"license": license_id, "category": category, "components": components, "assets": assets}
+                         for license_id, category, components, assets in self.license_exposure(limit=None)],
+            "shared_vulnerabilities": [{"name": name, "ecosystem": ecosystem, "version": version,
+                                        "advisories": advisories, "assets": assets}
+                                       for name, ecosystem, version, advisories, assets
+                                       in self.shared_vulnerabilities()],
+        }
+
+
+def map_store(asset_id, store, advisories=None):
+    """
+    Partial aggregate of one component store
+    The application row an SBOM describes itself with is not a component of
+    the asset: compute_stats leaves it out of the counts, and it is left out
+    of the packages here.
+    """
+    partial = AssetPartial(asset_id)
+    stats = compute_stats(store, example_limit=0)
+    partial.components = stats.total
+    partial.by_scope = stats.by_scope
+    partial.by_category = stats.by_category
+    partial.license_ids = stats.by_license_id
+    application_code = store.strings.lookup(TYPE_APPLICATION)
+    packages = partial.packages
+    for row in range(store.size):
+        if store.type_codes[row] == application_code:
+            continue
+        key = package_key(store, row)
+        entry = packages.get(key)
+        if entry is None:
+            packages[key] = (store.names[row], {store.versions[row]})
+        else:
+            entry[1].add(store.versions[row])
+    if advisories is not None:
+        for finding in advisories.match(store):
+            partial.findings.append((finding.ecosystem, normalize_name(finding.ecosystem, finding.name),
+                                     finding.version, finding.name, finding.advisory_id, finding.severity))
+    return partial
+
+
+def init_worker(advisory_index=None):
+    """Open the advisory index once per worker process"""
+    global _worker_advisories
+    if advisory_index:
+        from .advisories import AdvisoryIndex
+        _worker_advisories = AdvisoryIndex(advisory_index)
+
+
+def map_sbom(task):
+    """Load one SBOM and reduce it to its partial aggregate; runs inside a worker process"""
+    from .ingest import load_components
+
+    asset_id, path = task
+    return map_store(asset_id, load_components(path), _worker_advisories)
+
+
+def run_portfolio(sbom_dir, workers=None, log=print, advisory_index=None):
+    """
+    Map every SBOM in sbom_dir (newest per asset, named as for batch mode)
+    and merge the partials; returns (aggregate, failures)
+    """
+    tasks = sorted(index_sbom_files(sbom_dir).items())
+    workers = workers or os.cpu_count() or 1
+    total = len(tasks)
+    log(f"Portfolio: {total} SBOMs, {workers} workers")
+
+    aggregate = PortfolioAggregate()
+    failures = run_jobs(tasks, total, workers, log, map_sbom, lambda task, partial: aggregate.merge(partial),
+                        init_worker, (advisory_index,))
+    return aggregate, failures
+
+
+def asset_names(csv_path):
+    """asset_id -> asset_name from an asset inventory CSV"""
+    return {asset['asset_id']: asset.get('asset_name') or asset['asset_id'] for asset in read_assets(csv_path)}
+
+
+def write_portfolio_json(fp, aggregate, failures):
+    document = aggregate.as_dict()
+    document["failures"] = failures
+    json.dump(document, fp, indent=2)
+    fp.write("\n")
@@ -0,0 +1,96 @@
+"""
+Per-phase profiling for report generation
+Phases may nest; each phase records its exclusive time (time spent in
+nested phases is attributed to those phases only), so the phase times add
+up to the total.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from . import __version__
+
+PHASES = ("ingest", "aggregation", "story", "layout", "write")
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None when unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class PhaseProfiler:
+    """Collects exclusive wall time per phase plus named counters"""
+
+    enabled = True
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        self._stack = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        # Each stack frame is [phase start, time spent in nested phases]
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[0]
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - frame[1]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def count(self, name, value):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self):
+        phases = {name: round(self.phases.get(name, 0.0), 4) for name in PHASES}
+        for name, seconds in self.phases.items():
+            phases.setdefault(name, round(seconds, 4))
+        return {
+            "generator_version": __version__,
+            "total_seconds": round(time.perf_counter() - self._started, 4),
+            "phases": phases,
+            "counters": dict(self.counters),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def write(self, path):
+        """Write the JSON report to path, or to stdout for '-'"""
+        text = json.dumps(self.report(), indent=2)
+        if path == "-":
+            print(text)
+        else:
+            with open(path, "w", encoding="utf-8") as fp:
+                fp.write(text + "\n")
+
+
+class NullProfiler:
+    """Drop-in profiler that records nothing"""
+
+    enabled = False
+
+    @contextmanager
+    def phase(self, name):
+        yield
+
+    def count(self, name, value):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
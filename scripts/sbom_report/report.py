@@ -0,0 +1,1054 @@
+"""
+SBOM report rendering
+ReportLab section builders and the full report layout. Project metadata and
+the component inventory are passed in by the caller.
+"""
+
+import os
+from functools import partial
+from xml.sax.saxutils import escape
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen.canvas import Canvas
+
+from .advisories import severity_counts
+from .diff import CHANGE_KINDS, CHANGE_TITLES
+from .graph import analyze_graph
+from .pagination import PaginatedTable
+from .licenses import license_description
+from .profiling import NULL_PROFILER
+from .stats import TOP_LICENSES, compute_stats
+
+def create_custom_styles():
+    """Create custom paragraph styles for the report"""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1e40af'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Section heading
+    styles.add(ParagraphStyle(
+        name='SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#1e40af'),
+        spaceAfter=12,
+        spaceBefore=20,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Subsection heading
+    styles.add(ParagraphStyle(
+        name='SubsectionHeading',
+        parent=styles['Heading3'],
+        fontSize=14,
+        textColor=colors.HexColor('#334155'),
+        spaceAfter=10,
+        spaceBefore=15,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Body text (modify existing Normal style)
+    styles['Normal'].fontSize = 10
+    styles['Normal'].leading = 14
+    styles['Normal'].alignment = TA_JUSTIFY
+    
+    # Footer style
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=TA_CENTER
+    ))
+    
+    return styles
+
+def _title_artwork(canvas, notice):
+    """Title page background, heading and notice: the same on every report"""
+    canvas.saveState()
+    
+    # Background color
+    canvas.setFillColor(colors.HexColor('#f8fafc'))
+    canvas.rect(0, 0, letter[0], letter[1], fill=1)
+    
+    # Title
+    canvas.setFillColor(colors.HexColor('#1e40af'))
+    canvas.setFont("Helvetica-Bold", 28)
+    canvas.drawCentredString(letter[0]/2, letter[1] - 2*inch, "SOFTWARE BILL OF MATERIALS")
+    canvas.drawCentredString(letter[0]/2, letter[1] - 2.5*inch, "(SBOM) REPORT")
+    
+    # Confidentiality notice
+    canvas.setFont("Helvetica-Oblique", 9)
+    canvas.setFillColor(colors.HexColor('#dc2626'))
+    canvas.drawCentredString(letter[0]/2, 1*inch, notice)
+    
+    canvas.restoreState()
+
+def create_title_page(canvas, doc, project, templates=None):
+    """
+    Create a professional title page
+    With templates (a templates.ReportTemplates) the artwork is stamped from
+    its pre-rendered form and only the project fields are drawn.
+    """
+    if templates is None:
+        _title_artwork(canvas, BOILERPLATE["notice"])
+    else:
+        notice = templates.boilerplate["notice"]
+        templates.stamp(canvas, ("title", notice), partial(_title_artwork, notice=notice))
+    canvas.saveState()
+    
+    # Project name
+    canvas.setFont("Helvetica-Bold", 20)
+    canvas.setFillColor(colors.HexColor('#334155'))
+    canvas.drawCentredString(letter[0]/2, letter[1] - 4*inch, project["name"])
+    
+    # Version
+    canvas.setFont("Helvetica", 14)
+    canvas.drawCentredString(letter[0]/2, letter[1] - 4.5*inch, f"Version {project['version']}")
+    
+    # Vendor
+    canvas.setFont("Helvetica", 12)
+    canvas.drawCentredString(letter[0]/2, letter[1] - 5.5*inch, project["vendor"])
+    
+    # Report metadata
+    canvas.setFont("Helvetica", 10)
+    canvas.setFillColor(colors.grey)
+    y_pos = letter[1] - 7*inch
+    canvas.drawCentredString(letter[0]/2, y_pos, f"Report Date: {project['report_date']}")
+    canvas.drawCentredString(letter[0]/2, y_pos - 0.3*inch, f"Report Version: {project['report_version']}")
+    
+    canvas.restoreState()
+
+def _data_table_style(header_size=10, body_size=9, padding=6, vertical_padding=None, valign='MIDDLE', align=()):
+    """
+    TableStyle commands of the report's data tables: blue header row, grey
+    grid and banded rows. align adds ALIGN commands after the default left
+    alignment; vertical_padding defaults to padding.
+    """
+    vertical_padding = padding if vertical_padding is None else vertical_padding
+    return [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        *align,
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_size),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), body_size),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
+        ('VALIGN', (0, 0), (-1, -1), valign),
+        ('LEFTPADDING', (0, 0), (-1, -1), padding),
+        ('RIGHTPADDING', (0, 0), (-1, -1), padding),
+        ('TOPPADDING', (0, 0), (-1, -1), vertical_padding),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), vertical_padding),
+    ]
+
+def create_component_table(dependencies, compact=False):
+    """Create a paginated table for component listing; compact draws each page's grid in one path"""
+    header = ['Component Name', 'Version', 'License', 'Type']
+    rows = [(dep['name'], dep['version'], dep['license'], dep['type']) for dep in dependencies]
+    
+    style = _data_table_style()
+    
+    return PaginatedTable(header, rows, [3*inch, 1.5*inch, 1.5*inch, 1.5*inch], style, compact=compact)
+
+def create_findings_table(findings):
+    """Create a paginated table of matched vulnerability advisories"""
+    header = ['Component', 'Version', 'Advisory', 'Severity', 'Fixed In']
+    rows = [(finding.name, finding.version, finding.advisory_id, finding.severity.title(), finding.fixed or '-')
+            for finding in findings]
+    
+    style = _data_table_style()
+    
+    return PaginatedTable(header, rows, [2.2*inch, 1*inch, 1.7*inch, 1*inch, 1.1*inch], style)
+
+def create_policy_table(violations):
+    """Create a paginated table of components the license policy does not allow"""
+    header = ['Component', 'Version', 'License', 'Verdict', 'Decided By']
+    rows = [(violation.name, violation.version, violation.license, violation.verdict.title(),
+             '\n'.join(violation.ids)) for violation in violations]
+    
+    style = _data_table_style()
+    
+    return PaginatedTable(header, rows, [1.8*inch, 0.9*inch, 1.8*inch, 0.8*inch, 1.7*inch], style)
+
+def create_change_table(kind, changes):
+    """Create a paginated table for one kind of change in a diff report"""
+    if kind in ("added", "removed"):
+        header = ['Component', 'Ecosystem', 'Version', 'License']
+        rows = [(c.name, c.ecosystem, c.new_version or c.old_version, c.new_license or c.old_license) for c in changes]
+        col_widths = [3*inch, 1.1*inch, 1.3*inch, 1.6*inch]
+    elif kind == "license_changed":
+        header = ['Component', 'Version', 'Old License', 'New License']
+        rows = [(c.name, c.new_version if c.old_version == c.new_version else f"{c.old_version} -> {c.new_version}",
+                 c.old_license, c.new_license) for c in changes]
+        col_widths = [2.6*inch, 1.4*inch, 1.5*inch, 1.5*inch]
+    else:
+        header = ['Component', 'Old Version', 'New Version', 'License']
+        rows = [(c.name, c.old_version, c.new_version, c.new_license) for c in changes]
+        col_widths = [3*inch, 1.2*inch, 1.2*inch, 1.6*inch]
+    
+    style = _data_table_style(vertical_padding=4)
+    
+    return PaginatedTable(header, rows, col_widths, style)
+
+def create_subtree_table(graph, total):
+    """Create a table of the direct dependencies that pull in the most packages"""
+    header = ['Direct Dependency', 'Version', 'Subtree', 'Exclusive', 'Share']
+    rows = [(subtree.name, subtree.version, str(subtree.size), str(subtree.exclusive),
+             f"{100.0 * subtree.size / total:.1f}%" if total else "-") for subtree in graph.heaviest()]
+    
+    style = _data_table_style(vertical_padding=4, align=[('ALIGN', (2, 1), (-1, -1), 'CENTER')])
+    
+    return PaginatedTable(header, rows, [2.8*inch, 1.1*inch, 0.9*inch, 0.9*inch, 0.8*inch], style)
+
+def create_fan_in_table(graph):
+    """Create a table of the packages the most other packages depend on"""
+    header = ['Component', 'Version', 'Dependents']
+    rows = [(name, version, str(count)) for name, version, count in graph.top_fan_in()]
+    
+    style = _data_table_style(vertical_padding=4, align=[('ALIGN', (2, 1), (-1, -1), 'CENTER')])
+    
+    return PaginatedTable(header, rows, [3.4*inch, 1.5*inch, 1.5*inch], style)
+
+def dependency_graph_text(graph):
+    """Section 3.3 prose for the graph statistics"""
+    transitive = graph.reachable_count - len(graph.roots)
+    text = (f"The {len(graph.roots)} direct dependencies pull in {transitive} transitive "
+            f"dependenc{'y' if transitive == 1 else 'ies'} through {graph.graph.edge_count} dependency "
+            f"relationships, up to {graph.max_depth} levels deep.")
+    if graph.duplicate_versions:
+        names = len(graph.duplicate_versions)
+        text += (f" {names} package{'s are' if names != 1 else ' is'} installed in more than one version, "
+                 f"adding {graph.duplicate_count} duplicate cop{'y' if graph.duplicate_count == 1 else 'ies'}.")
+    if graph.cycles:
+        text += (f" {graph.cycles} dependency cycle{'s' if graph.cycles != 1 else ''} "
+                 f"involve{'s' if graph.cycles == 1 else ''} {graph.rows_in_cycles} packages.")
+    text += (" <b>Subtree</b> counts every package reachable from a direct dependency, itself included; "
+             "<b>Exclusive</b> counts those no other direct dependency reaches, which removing it would "
+             "drop from the build.")
+    return text
+
+def create_package_spread_table(aggregate):
+    """Create a table of the packages used by the most assets in a portfolio"""
+    header = ['Package', 'Ecosystem', 'Assets', 'Share', 'Versions', 'Most Common']
+    rows = [(name, ecosystem or '-', str(assets), f"{aggregate.percentage(assets):.1f}%", str(versions), common)
+            for name, ecosystem, assets, versions, common in aggregate.top_packages()]
+    
+    style = _data_table_style(vertical_padding=4, align=[('ALIGN', (2, 1), (4, -1), 'CENTER')])
+    
+    return PaginatedTable(header, rows, [2.4*inch, 0.9*inch, 0.7*inch, 0.7*inch, 0.8*inch, 1.5*inch], style)
+
+def create_license_exposure_table(aggregate):
+    """Create a table of license ids by the number of assets that ship them"""
+    header = ['License', 'Category', 'Components', 'Assets', 'Share']
+    rows = [(license_id, category, str(components), str(assets), f"{aggregate.percentage(assets):.1f}%")
+            for license_id, category, components, assets in aggregate.license_exposure()]
+    
+    style = _data_table_style(vertical_padding=4, align=[('ALIGN', (2, 1), (-1, -1), 'CENTER')])
+    
+    return PaginatedTable(header, rows, [2.4*inch, 1.3*inch, 1.1*inch, 0.9*inch, 0.9*inch], style)
+
+def create_shared_vulnerability_table(vulnerabilities, names):
+    """Create a table of vulnerable package versions and the assets that share them"""
+    header = ['Package', 'Version', 'Advisories', 'Assets']
+    rows = []
+    for name, _, version, advisories, assets in vulnerabilities:
+        ids = sorted(advisories)
+        listed = '\n'.join(ids[:3] + ([f"+{len(ids) - 3} more"] if len(ids) > 3 else []))
+        shown = [names.get(asset_id, asset_id) for asset_id in assets[:3]]
+        if len(assets) > 3:
+            shown.append(f"+{len(assets) - 3} more")
+        rows.append((name, version, listed, f"{len(assets)}: " + '\n'.join(shown)))
+    
+    style = _data_table_style(vertical_padding=4, valign='TOP')
+    
+    return PaginatedTable(header, rows, [1.9*inch, 0.9*inch, 1.8*inch, 2.4*inch], style)
+
+def create_summary_table(stats):
+    """Create summary statistics table"""
+    data = [
+        ['Metric', 'Value'],
+        ['Total Components', str(stats.total)],
+        ['Production Dependencies', str(stats.scope_count("Production"))],
+        ['Development Dependencies', str(stats.scope_count("Development"))],
+    ]
+    for scope in stats.scopes():
+        if scope not in ("Production", "Development"):
+            data.append([f'{scope or "Unscoped"} Components', str(stats.scope_count(scope))])
+    for label, counts in (('Component Types', stats.by_type), ('Ecosystems', stats.by_ecosystem)):
+        if counts:
+            ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            value = ', '.join(f"{name} {count}" for name, count in ranked[:4])
+            if len(ranked) > 4:
+                value += f", {len(ranked) - 4} more"
+            data.append([label, value])
+    data += [
+        ['Unique Licenses', str(stats.unique_licenses)],
+        ['Primary License', stats.primary_license],
+        ['Copyleft Licensed Components', str(stats.copyleft_count)],
+        ['Components Without a Recognized License', str(stats.unknown_count)],
+    ]
+    
+    table = Table(data, colWidths=[3*inch, 3*inch])
+    table.setStyle(TableStyle(_data_table_style(header_size=11, body_size=10, padding=8)))
+    
+    return table
+
+def create_license_summary(stats):
+    """Create license distribution table"""
+    data = [['License Type', 'Count', 'Percentage']]
+    
+    for lic, count in stats.licenses():
+        data.append([lic, str(count), f"{stats.percentage(count):.1f}%"])
+    
+    table = Table(data, colWidths=[2.5*inch, 1*inch, 1*inch])
+    table.setStyle(TableStyle(_data_table_style(align=[('ALIGN', (1, 1), (-1, -1), 'CENTER')])))
+    
+    return table
+
+def licensing_overview(stats):
+    """Executive summary sentence on the license mix"""
+    permissive = stats.percentage(stats.permissive_count)
+    text = (f"{'The majority' if permissive > 50 else f'{permissive:.0f}%'} of components utilize permissive "
+            f"open-source licenses (primarily {escape(stats.primary_license)})")
+    if not stats.copyleft_count and not stats.unknown_count:
+        return text + ", ensuring minimal licensing restrictions for commercial use."
+    concerns = []
+    if stats.copyleft_count:
+        concerns.append(f"{stats.copyleft_count} {'uses' if stats.copyleft_count == 1 else 'use'} copyleft licenses")
+    if stats.unknown_count:
+        concerns.append(f"{stats.unknown_count} {'has' if stats.unknown_count == 1 else 'have'} "
+                        f"no recognized license")
+    return text + "; " + " and ".join(concerns) + " (see section 4)."
+
+def license_summary_text(stats):
+    """Section 4.2 prose for the most used licenses"""
+    parts = []
+    for license_id in stats.top_license_ids():
+        count = stats.by_license_id[license_id]
+        description = license_description(license_id) or "See the license text for its obligations."
+        examples = stats.license_examples.get(license_id)
+        used_by = f"Used by {count} component{'s' if count != 1 else ''}"
+        if examples:
+            used_by += f", including {escape(', '.join(examples))}"
+        parts.append(f"<b>{escape(license_id)}:</b> {description} {used_by}.")
+    
+    if not stats.copyleft_count and not stats.unknown_count:
+        parts.append("All licenses are compatible with commercial use and do not impose copyleft requirements.")
+    if stats.copyleft_count:
+        parts.append(f"<b>Copyleft:</b> {stats.copyleft_count} components use copyleft licenses "
+                     f"({escape(', '.join(stats.copyleft_license_ids()[:TOP_LICENSES]))}); review their distribution obligations "
+                     f"before shipping.")
+    if stats.unknown_count:
+        parts.append(f"<b>Unknown:</b> {stats.unknown_count} components have no recognized license "
+                     f"information and need manual review.")
+    return "<br/><br/>".join(parts)
+
+class StoryContext:
+    """
+    Inputs shared by the section builders
+    stats (from compute_stats), graph (from analyze_graph) and the component
+    tables are computed on first use, so a builder only pays for what it needs.
+    With templates (a templates.ReportTemplates) the fixed text of sections
+    5-8 is stamped from its pre-rendered pages, and its wording comes from the
+    templates' boilerplate. compact component tables draw with fewer operators.
+    """
+
+    def __init__(self, dependencies, project, styles, profiler=NULL_PROFILER, findings=None, stats=None, graph=None,
+                 policy=None, templates=None, compact=False):
+        self.dependencies = dependencies
+        self.project = project
+        self.styles = styles
+        self.profiler = profiler
+        self.findings = findings
+        self.policy = policy
+        self.templates = templates
+        self.boilerplate = BOILERPLATE if templates is None else templates.boilerplate
+        self.compact = compact
+        self._stats = stats
+        self._graph = graph
+        self._tables = {}
+
+    @property
+    def stats(self):
+        if self._stats is None:
+            with self.profiler.phase("aggregation"):
+                self._stats = compute_stats(self.dependencies)
+        return self._stats
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            with self.profiler.phase("graph"):
+                self._graph = analyze_graph(self.dependencies)
+        return self._graph
+
+    def component_table(self, scope):
+        table = self._tables.get(scope)
+        if table is None:
+            table = self._tables[scope] = create_component_table(self.dependencies.get(scope, []), self.compact)
+        return table
+
+    def prerendered(self, key, build):
+        """The flowables build() returns, or blocks stamping their pre-rendered pages"""
+        if self.templates is None:
+            return build()
+        return self.templates.blocks(key, build)
+
+def _front_matter(context):
+    """Title page (drawn by the first page template) and table of contents"""
+    styles = context.styles
+    story = []
+    
+    # Title page (drawn by the first page template)
+    story.append(PageBreak())
+    
+    # Table of Contents
+    story.append(Paragraph("TABLE OF CONTENTS", styles['SectionHeading']))
+    story.append(Spacer(1, 0.2*inch))
+    
+    toc_items = [
+        "1. Executive Summary",
+        "2. Project Information",
+        "3. Component Inventory",
+        "4. License Information",
+        "5. Security & Vulnerability Assessment",
+        "6. Compliance & Risk Analysis",
+        "7. Recommendations",
+        "8. Appendices"
+    ]
+    
+    for item in toc_items:
+        story.append(Paragraph(item, styles['Normal']))
+        story.append(Spacer(1, 0.1*inch))
+    return story
+
+def _executive_summary(context):
+    """1. Executive Summary"""
+    project, styles, stats = context.project, context.styles, context.stats
+    story = []
+    
+    story.append(Paragraph("1. EXECUTIVE SUMMARY", styles['SectionHeading']))
+    story.append(Spacer(1, 0.1*inch))
+    
+    summary_text = """
+    This Software Bill of Materials (SBOM) report provides a comprehensive inventory of all software 
+    components, dependencies, and third-party libraries used in the {name} application. 
+    The report includes detailed information about component versions, licenses, security considerations, 
+    and compliance status.
+    
+    The application {stack}has a total of {total} dependencies identified. {licensing}
+    
+    This SBOM is essential for:
+    • Security vulnerability management and tracking
+    • License compliance verification
+    • Supply chain risk assessment
+    • Regulatory compliance (NIST, SOC 2, ISO 27001)
+    • Incident response and forensic analysis
+    """.format(
+        name=project['name'],
+        stack=f"is built using {project['stack_summary']} and " if project.get('stack_summary') else "",
+        total=stats.total,
+        licensing=licensing_overview(stats),
+    )
+    
+    story.append(Paragraph(summary_text, styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+    story.append(create_summary_table(stats))
+    return story
+
+def _project_information(context):
+    """2. Project Information"""
+    project, styles = context.project, context.styles
+    story = []
+    
+    story.append(Paragraph("2. PROJECT INFORMATION", styles['SectionHeading']))
+    story.append(Spacer(1, 0.1*inch))
+    
+    project_data = [
+        ['Property', 'Value'],
+        ['Project Name', project['name']],
+        ['Version', project['version']],
+        ['Vendor', project['vendor']],
+        ['Description', project['description']],
+        ['Project License', project['license']],
+        ['Report Date', project['report_date']],
+        ['Report Version', project['report_version']],
+    ]
+    for label, key in (('Technology Stack', 'technology_stack'), ('Build Tool', 'build_tool'),
+                       ('Package Manager', 'package_manager')):
+        if project.get(key):
+            project_data.append([label, project[key]])
+    
+    project_table = Table(project_data, colWidths=[2.5*inch, 4*inch])
+    project_table.setStyle(TableStyle(_data_table_style()))
+    
+    story.append(project_table)
+    return story
+
+def component_inventory(context, scope, start=0, end=None):
+    """
+    3.1 / 3.2 inventory of one scope; start and end select a row range of the
+    table, and only the range starting at row 0 carries the headings
+    """
+    styles = context.styles
+    table = context.component_table(scope)
+    story = []
+    if start == 0:
+        if scope == "Production":
+            story.append(Paragraph("3. COMPONENT INVENTORY", styles['SectionHeading']))
+            story.append(Spacer(1, 0.1*inch))
+            story.append(Paragraph("3.1 Production Dependencies", styles['SubsectionHeading']))
+        else:
+            story.append(Paragraph("3.2 Development Dependencies", styles['SubsectionHeading']))
+        story.append(Spacer(1, 0.1*inch))
+    story.append(table if start == 0 and end is None else table.slice(start, end))
+    return story
+
+def _transitive_dependencies(context):
+    """3.3 Transitive dependency graph"""
+    styles, graph = context.styles, context.graph
+    story = []
+    
+    story.append(Paragraph("3.3 Transitive Dependencies", styles['SubsectionHeading']))
+    story.append(Spacer(1, 0.1*inch))
+    if not graph.graph.edge_count:
+        story.append(Paragraph(
+            "<i>The inventory does not record dependency relationships. Generate the report from "
+            "package-lock.json or an SBOM with relationships to analyze transitive dependencies.</i>",
+            styles['Normal']))
+    else:
+        story.append(Paragraph(dependency_graph_text(graph), styles['Normal']))
+        story.append(Spacer(1, 0.2*inch))
+        story.append(Paragraph("<b>Heaviest Dependency Subtrees</b>", styles['Normal']))
+        story.append(Spacer(1, 0.1*inch))
+        story.append(create_subtree_table(graph, graph.reachable_count))
+        story.append(Spacer(1, 0.2*inch))
+        story.append(Paragraph("<b>Most Depended-Upon Packages</b>", styles['Normal']))
+        story.append(Spacer(1, 0.1*inch))
+        story.append(create_fan_in_table(graph))
+    return story
+
+def _license_information(context):
+    """4. License Information"""
+    styles, stats = context.styles, context.stats
+    story = []
+    
+    story.append(Paragraph("4. LICENSE INFORMATION", styles['SectionHeading']))
+    story.append(Spacer(1, 0.1*inch))
+    
+    license_text = """
+    This section provides an overview of the license types used across all dependencies. 
+    Understanding license obligations is critical for legal compliance and commercial deployment.
+    """
+    story.append(Paragraph(license_text, styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+    
+    story.append(Paragraph("4.1 License Distribution", styles['SubsectionHeading']))
+    story.append(create_license_summary(stats))
+    story.append(Spacer(1, 0.2*inch))
+    
+    story.append(Paragraph("4.2 License Summary", styles['SubsectionHeading']))
+    story.append(Paragraph(license_summary_text(stats), styles['Normal']))
+    return story
+
+# Fixed wording of sections 5-8 and the title page notice; an organization can
+# replace any of it with a JSON file of the same keys (templates.load_boilerplate).
+# compliance takes {license_risk} and {license_review}; appendices is followed by
+# the generated contact details of Appendix C.
+BOILERPLATE = {
+    "security": """
+    <b>5.1 Vulnerability Management Process</b><br/><br/>
+    
+    Regular security scanning and vulnerability assessment should be performed using tools such as:
+    • npm audit
+    • Snyk
+    • OWASP Dependency-Check
+    • GitHub Dependabot
+    
+    <b>5.2 Recommended Actions</b><br/><br/>
+    
+    1. <b>Automated Scanning:</b> Implement continuous vulnerability scanning in CI/CD pipeline
+    2. <b>Dependency Updates:</b> Regularly update dependencies to latest secure versions
+    3. <b>Security Monitoring:</b> Subscribe to security advisories for critical dependencies
+    4. <b>Patch Management:</b> Establish process for rapid patching of critical vulnerabilities
+    
+    <b>5.3 Critical Dependencies</b><br/><br/>
+    
+    The following dependencies require special attention due to their critical nature:
+    • React & React-DOM: Core framework components
+    • @supabase/supabase-js: Backend authentication and data access
+    • react-router-dom: Client-side routing and navigation
+    • jspdf & html2canvas: PDF generation capabilities
+    """,
+    "compliance": """
+    <b>6.1 Regulatory Compliance</b><br/><br/>
+    
+    This SBOM supports compliance with the following frameworks:
+    • <b>NIST Cybersecurity Framework:</b> Asset inventory and supply chain risk management
+    • <b>SOC 2:</b> Vendor management and third-party risk assessment
+    • <b>ISO 27001:</b> Information security management system requirements
+    • <b>Executive Order 14028:</b> Software supply chain security requirements
+    
+    <b>6.2 Supply Chain Risk</b><br/><br/>
+    
+    <b>Low Risk Areas:</b>
+    • Well-maintained open-source projects with active communities
+    • Established vendors (Meta/React, Vercel/Vite, Supabase)
+    • {license_risk}
+    
+    <b>Medium Risk Areas:</b>
+    • Dependencies with transitive dependencies (nested dependencies)
+    • Components with frequent updates requiring maintenance
+    • Third-party services (Supabase) requiring operational monitoring{license_review}
+    
+    <b>6.3 Risk Mitigation Strategies</b><br/><br/>
+    
+    1. Maintain dependency lock files (package-lock.json) for reproducible builds
+    2. Implement dependency pinning for critical components
+    3. Regular security audits and dependency updates
+    4. Monitor dependency health and maintenance status
+    5. Maintain vendor relationships and support channels
+    """,
+    "recommendations": """
+    <b>7.1 Immediate Actions</b><br/><br/>
+    
+    1. Establish automated SBOM generation in CI/CD pipeline
+    2. Integrate vulnerability scanning tools (npm audit, Snyk)
+    3. Create dependency update schedule (monthly/quarterly reviews)
+    4. Document dependency selection and approval process
+    
+    <b>7.2 Long-term Improvements</b><br/><br/>
+    
+    1. Implement Software Composition Analysis (SCA) tools
+    2. Establish security review process for new dependencies
+    3. Create dependency lifecycle management policy
+    4. Regular SBOM updates and distribution to stakeholders
+    5. Integration with security information and event management (SIEM)
+    
+    <b>7.3 Best Practices</b><br/><br/>
+    
+    • Keep dependencies up to date with security patches
+    • Minimize dependency count where possible
+    • Prefer well-maintained, actively developed libraries
+    • Review and understand license obligations
+    • Maintain comprehensive documentation of all dependencies
+    • Regular security training for development team
+    """,
+    "appendices": """
+    <b>Appendix A: SBOM Format Standards</b><br/><br/>
+    
+    This report follows industry-standard SBOM formats including:
+    • SPDX (Software Package Data Exchange)
+    • CycloneDX
+    • SWID (Software Identification) tags
+    
+    <b>Appendix B: Glossary</b><br/><br/>
+    
+    • <b>SBOM:</b> Software Bill of Materials - A nested inventory of software components
+    • <b>Dependency:</b> External library or package required by the application
+    • <b>Transitive Dependency:</b> A dependency of a dependency
+    • <b>Vulnerability:</b> A security flaw that could be exploited
+    • <b>CVE:</b> Common Vulnerabilities and Exposures identifier
+    
+    """,
+    "notice": "CONFIDENTIAL - For Internal Use Only",
+}
+
+def _security_assessment(context):
+    """5. Security & Vulnerability Assessment"""
+    styles, findings = context.styles, context.findings
+    security_text = context.boilerplate["security"]
+    story = context.prerendered(("security", security_text), lambda: [
+        Paragraph("5. SECURITY & VULNERABILITY ASSESSMENT", styles['SectionHeading']),
+        Spacer(1, 0.1*inch),
+        Paragraph(security_text, styles['Normal']),
+    ])
+    story.append(Spacer(1, 0.1*inch))
+    
+    story.append(Paragraph("<b>5.4 Known Vulnerabilities</b>", styles['Normal']))
+    story.append(Spacer(1, 0.1*inch))
+    if findings is None:
+        story.append(Paragraph(
+            "<i>Note: This report should be updated with current vulnerability scan results. "
+            "Run 'npm audit' to get the latest vulnerability information.</i>", styles['Normal']))
+    elif not findings:
+        story.append(Paragraph(
+            "No component matched a known advisory in the offline vulnerability database.", styles['Normal']))
+    else:
+        counts = severity_counts(findings)
+        affected = len({(finding.name, finding.version) for finding in findings})
+        breakdown = ", ".join(f"{count} {severity.lower()}" for severity, count in counts.items() if count)
+        story.append(Paragraph(
+            f"{len(findings)} advisories from the offline vulnerability database affect {affected} "
+            f"component versions ({breakdown}). Upgrade to the listed fixed versions where available.",
+            styles['Normal']))
+        story.append(Spacer(1, 0.1*inch))
+        story.append(create_findings_table(findings))
+    return story
+
+def _compliance_analysis(context):
+    """6. Compliance & Risk Analysis"""
+    styles, stats, policy = context.styles, context.stats, context.policy
+    compliance_text = context.boilerplate["compliance"]
+    if stats.copyleft_count or stats.unknown_count:
+        license_risk = f"{stats.permissive_count} of {stats.total} components under permissive licenses"
+        license_review = (f"\n    • {stats.copyleft_count} copyleft and {stats.unknown_count} unidentified "
+                          f"licenses needing legal review")
+    else:
+        license_risk = "Permissive licenses with minimal legal risk"
+        license_review = ""
+    compliance_text = compliance_text.format(license_risk=license_risk, license_review=license_review)
+    def section():
+        return [
+            Paragraph("6. COMPLIANCE & RISK ANALYSIS", styles['SectionHeading']),
+            Spacer(1, 0.1*inch),
+            Paragraph(compliance_text, styles['Normal']),
+        ]
+    # Only the wording without per-report counts is worth keeping pre-rendered
+    story = section() if license_review else context.prerendered(("compliance", compliance_text), section)
+    
+    if policy is not None:
+        story.append(Spacer(1, 0.1*inch))
+        story.append(Paragraph("<b>6.4 License Policy</b>", styles['Normal']))
+        story.append(Spacer(1, 0.1*inch))
+        counts = policy.counts
+        waived = f" ({policy.waived} of them by waiver)" if policy.waived else ""
+        story.append(Paragraph(
+            f"Evaluated against the license policy {escape(os.path.basename(policy.source))}: "
+            f"{counts.get('allow', 0)} components allowed{waived}, {counts.get('review', 0)} for review and "
+            f"{counts.get('deny', 0)} denied. Overall verdict: <b>{policy.verdict.upper()}</b>.",
+            styles['Normal']))
+        if policy.violations:
+            story.append(Spacer(1, 0.1*inch))
+            story.append(create_policy_table(policy.violations))
+    return story
+
+def _recommendations(context):
+    """7. Recommendations"""
+    styles = context.styles
+    recommendations_text = context.boilerplate["recommendations"]
+    return context.prerendered(("recommendations", recommendations_text), lambda: [
+        Paragraph("7. RECOMMENDATIONS", styles['SectionHeading']),
+        Spacer(1, 0.1*inch),
+        Paragraph(recommendations_text, styles['Normal']),
+    ])
+
+def _appendices(context):
+    """8. Appendices"""
+    project, styles = context.project, context.styles
+    appendix_text = context.boilerplate["appendices"] + "<b>Appendix C: Contact Information</b>"
+    story = context.prerendered(("appendices", appendix_text), lambda: [
+        Paragraph("8. APPENDICES", styles['SectionHeading']),
+        Spacer(1, 0.1*inch),
+        Paragraph(appendix_text, styles['Normal']),
+    ])
+    
+    # The blank line after the Appendix C heading
+    story.append(Spacer(1, styles['Normal'].leading))
+    contact_text = """
+    For questions regarding this SBOM report, please contact:
+    • Vendor: {vendor}
+    • Project: {name}
+    • Report Version: {version}
+    • Report Date: {date}
+    """.format(vendor=project['vendor'], name=project['name'],
+               version=project['report_version'], date=project['report_date'])
+    
+    story.append(Paragraph(contact_text, styles['Normal']))
+    return story
+
+# Section name -> scope for the sections that list one scope's components
+INVENTORY_SECTIONS = {"production": "Production", "development": "Development"}
+
+# Report sections in order; each starts on a new page
+SECTIONS = (
+    ("front", _front_matter),
+    ("summary", _executive_summary),
+    ("project", _project_information),
+    ("production", partial(component_inventory, scope=INVENTORY_SECTIONS["production"])),
+    ("development", partial(component_inventory, scope=INVENTORY_SECTIONS["development"])),
+    ("graph", _transitive_dependencies),
+    ("licenses", _license_information),
+    ("security", _security_assessment),
+    ("compliance", _compliance_analysis),
+    ("recommendations", _recommendations),
+    ("appendices", _appendices),
+)
+
+def build_story(dependencies, project, styles, profiler=NULL_PROFILER, findings=None, stats=None, graph=None,
+                policy=None, templates=None, compact=False):
+    """
+    Build the flowables for every report section after the title page
+    findings are the advisory matches for section 5.4; None keeps the scan note.
+    policy is a policy.PolicyResult for section 6.4, which is left out without one.
+    stats (from compute_stats) and graph (from analyze_graph) are computed
+    here when not passed in.
+    """
+    context = StoryContext(dependencies, project, styles, profiler, findings, stats, graph, policy, templates, compact)
+    return build_sections(context, [name for name, _ in SECTIONS])
+
+def build_sections(context, names, start=0, end=None):
+    """
+    Flowables for the named sections, each on a new page
+    start and end select a row range of an inventory section's table.
+    """
+    builders = dict(SECTIONS)
+    story = []
+    for name in names:
+        if story:
+            story.append(PageBreak())
+        if name in INVENTORY_SECTIONS:
+            story.extend(builders[name](context, start=start, end=end))
+        else:
+            story.extend(builders[name](context))
+    return story
+
+def report_document(filename, compact=False):
+    """
+    The letter-size document template every report page is laid out on
+    filename may be a path or a binary file object. compact documents always
+    compress their page streams; build them with CompactCanvas.
+    """
+    return SimpleDocTemplate(
+        filename,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch,
+        pageCompression=1 if compact else None
+    )
+
+class CompactCanvas(Canvas):
+    """
+    Canvas for size-optimized reports
+    Streams are written as binary Flate data without the ASCII85 layer,
+    which adds a quarter to their size, and pages that use nothing but the
+    standard fonts share one resource dictionary instead of each carrying
+    a copy.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["pageCompression"] = 1
+        Canvas.__init__(self, *args, **kwargs)
+        self._shared_resources = None
+
+    def showPage(self):
+        Canvas.showPage(self)
+        page = self._doc.Pages.pages[-1]
+        if page.XObjects or page.ExtGState or page._colorsUsed or page._shadingUsed:
+            return
+        if self._shared_resources is None:
+            resources = pdfdoc.PDFResourceDictionary()
+            resources.basicFonts()
+            resources.allProcs()
+            self._shared_resources = self._doc.Reference(resources, "SBOMPageResources")
+        page.Resources = self._shared_resources
+        page.Trans = None
+
+    def save(self):
+        # The filters are picked when the streams are serialized
+        use_a85 = rl_config.useA85
+        rl_config.useA85 = 0
+        try:
+            Canvas.save(self)
+        finally:
+            rl_config.useA85 = use_a85
+
+def draw_footer(canvas, doc, project, first_page=1, title="SBOM Report"):
+    """
+    Page footer; first_page numbers the document's first page when it continues
+    another one, and title names the kind of report
+    """
+    canvas.saveState()
+    canvas.setFont('Helvetica', 8)
+    canvas.setFillColor(colors.grey)
+    page_num = canvas.getPageNumber() + first_page - 1
+    canvas.drawCentredString(letter[0]/2, 0.5*inch, 
+                            f"Page {page_num} | {project['name']} {title} | {project['report_date']}")
+    canvas.restoreState()
+
+def generate_sbom_report(filename, dependencies, project, styles=None, profiler=NULL_PROFILER, findings=None,
+                         policy=None, templates=None, compact=False):
+    """
+    Generate the complete SBOM report in a single layout pass
+    filename may be a path or a binary file object. styles may be passed in so
+    that repeated renders reuse one stylesheet, and templates (a
+    templates.ReportTemplates) so that they stamp the fixed text. compact
+    optimizes the PDF for size (CompactCanvas, compact component tables).
+    """
+    doc = report_document(filename, compact)
+    
+    if styles is None:
+        styles = create_custom_styles()
+    
+    with profiler.phase("story"):
+        story = build_story(dependencies, project, styles, profiler, findings, policy=policy, templates=templates,
+                            compact=compact)
+    profiler.count("components", sum(len(deps) for deps in dependencies.values()))
+    profiler.count("flowables", len(story))
+    
+    # Build the document: title page first, footer on every later page
+    title_page = partial(create_title_page, project=project, templates=templates)
+    add_footer = partial(draw_footer, project=project)
+    base = CompactCanvas if compact else Canvas
+    canvasmaker = _profiled_canvas(profiler, base) if profiler.enabled else base
+    with profiler.phase("layout"):
+        doc.build(story, onFirstPage=title_page, onLaterPages=add_footer, canvasmaker=canvasmaker)
+    profiler.count("pages", doc.page)
+    
+    return filename
+
+
+def generate_diff_report(filename, summary, changes, old_label, new_label, project, styles=None):
+    """
+    Generate the compact change report between two SBOM versions
+    changes maps each kind in CHANGE_KINDS to its list of Change records.
+    """
+    doc = report_document(filename)
+    
+    if styles is None:
+        styles = create_custom_styles()
+    
+    story = []
+    story.append(Paragraph("SBOM CHANGE REPORT", styles['SectionHeading']))
+    story.append(Paragraph(
+        f"<b>{escape(project['name'])}</b><br/>"
+        f"Baseline: {escape(old_label)} ({summary['old_components']} components)<br/>"
+        f"Compared: {escape(new_label)} ({summary['new_components']} components)<br/>"
+        f"Report Date: {escape(project['report_date'])}",
+        styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+    
+    data = [['Change', 'Count']] + [[CHANGE_TITLES[kind], str(summary[kind])] for kind in CHANGE_KINDS]
+    table = Table(data, colWidths=[3*inch, 1.5*inch])
+    table.setStyle(TableStyle(_data_table_style(align=[('ALIGN', (1, 1), (-1, -1), 'CENTER')])))
+    story.append(table)
+    
+    for kind in CHANGE_KINDS:
+        if not changes[kind]:
+            continue
+        story.append(Paragraph(f"{CHANGE_TITLES[kind]} ({len(changes[kind])})", styles['SubsectionHeading']))
+        story.append(create_change_table(kind, changes[kind]))
+    
+    if not any(changes.values()):
+        story.append(Spacer(1, 0.2*inch))
+        story.append(Paragraph("No component changes between the two SBOM versions.", styles['Normal']))
+    
+    add_footer = partial(draw_footer, project=project, title="SBOM Change Report")
+    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    return filename
+
+
+def generate_portfolio_report(filename, aggregate, failures, project, names=None, matched=False, styles=None):
+    """
+    Generate the roll-up report for a portfolio of SBOMs
+    aggregate is a portfolio.PortfolioAggregate; names maps asset ids to display
+    names, and matched tells whether advisories were matched at all.
+    """
+    doc = report_document(filename)
+    names = names or {}
+    
+    if styles is None:
+        styles = create_custom_styles()
+    
+    assets = len(aggregate.assets)
+    unreadable = f" ({len(failures)} SBOM{'s' if len(failures) != 1 else ''} could not be read)" if failures else ""
+    story = []
+    story.append(Paragraph("SBOM PORTFOLIO REPORT", styles['SectionHeading']))
+    story.append(Paragraph(
+        f"<b>{escape(project['name'])}</b><br/>"
+        f"Assets: {assets}{unreadable}<br/>"
+        f"Report Date: {project['report_date']}",
+        styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+    
+    total = aggregate.components
+    data = [
+        ['Metric', 'Value'],
+        ['Assets', str(assets)],
+        ['Total Components', str(total)],
+        ['Distinct Packages', str(len(aggregate.packages))],
+        ['Distinct Package Versions', str(aggregate.package_versions)],
+        ['Production Components', str(aggregate.by_scope.get("Production", 0))],
+        ['Development Components', str(aggregate.by_scope.get("Development", 0))],
+        ['Permissive Licensed Components',
+         f"{aggregate.permissive_count} ({aggregate.percentage(aggregate.permissive_count, total):.1f}%)"],
+        ['Copyleft Licensed Components',
+         f"{aggregate.copyleft_count} ({aggregate.percentage(aggregate.copyleft_count, total):.1f}%)"],
+        ['Components Without a Recognized License',
+         f"{aggregate.unknown_count} ({aggregate.percentage(aggregate.unknown_count, total):.1f}%)"],
+    ]
+    vulnerabilities = aggregate.shared_vulnerabilities()
+    if matched:
+        affected = len({asset_id for *_, asset_ids in vulnerabilities for asset_id in asset_ids})
+        data.append(['Vulnerable Package Versions', str(len(vulnerabilities))])
+        data.append(['Assets With Known Vulnerabilities', f"{affected} ({aggregate.percentage(affected):.1f}%)"])
+    table = Table(data, colWidths=[3*inch, 3*inch])
+    table.setStyle(TableStyle(_data_table_style(header_size=11, body_size=10, padding=8)))
+    story.append(table)
+    
+    story.append(Paragraph("Most Widely Used Packages", styles['SubsectionHeading']))
+    story.append(Paragraph(
+        "Packages ranked by the number of assets that include them in any version. <b>Versions</b> counts "
+        "the distinct versions in use across the portfolio; <b>Most Common</b> is the version most assets run.",
+        styles['Normal']))
+    story.append(Spacer(1, 0.1*inch))
+    story.append(create_package_spread_table(aggregate))
+    
+    story.append(Paragraph("License Exposure", styles['SubsectionHeading']))
+    story.append(Paragraph(
+        "License ids ranked by the number of assets that ship at least one component under them; "
+        "copyleft and unrecognized licenses come first among equally widespread ones.",
+        styles['Normal']))
+    story.append(Spacer(1, 0.1*inch))
+    story.append(create_license_exposure_table(aggregate))
+    
+    story.append(Paragraph("Shared Vulnerable Versions", styles['SubsectionHeading']))
+    if not matched:
+        story.append(Paragraph("No advisory index was given, so components were not matched against known "
+                               "vulnerabilities (see --advisories).", styles['Normal']))
+    elif not vulnerabilities:
+        story.append(Paragraph("No component version in the portfolio matches a known advisory.", styles['Normal']))
+    else:
+        story.append(Paragraph(
+            "Vulnerable package versions ranked by the number of assets that share them; upgrading one of "
+            "these fixes every listed asset.", styles['Normal']))
+        story.append(Spacer(1, 0.1*inch))
+        story.append(create_shared_vulnerability_table(vulnerabilities, names))
+    
+    if failures:
+        story.append(Paragraph(f"Unreadable SBOMs ({len(failures)})", styles['SubsectionHeading']))
+        for failure in failures[:20]:
+            story.append(Paragraph(f"{escape(failure['asset_id'])}: {escape(failure['error'])}", styles['Normal']))
+    
+    add_footer = partial(draw_footer, project=project, title="SBOM Portfolio Report")
+    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    return filename
+
+def _profiled_canvas(profiler, base=Canvas):
+    """Canvas class that attributes PDF serialization to the write phase"""
+    class ProfiledCanvas(base):
+        def save(self):
+            with profiler.phase("write"):
+                base.save(self)
+    return ProfiledCanvas
@@ -0,0 +1,314 @@
+"""
+SPDX 2.x and CycloneDX JSON ingestion
+Both formats are streamed: packages/components and relationships/dependencies
+are decoded one element at a time into a ComponentStore.
+"""
+
+import re
+import sys
+from urllib.parse import unquote
+
+from .jsonstream import JsonStream
+from .model import ComponentStore
+
+UNKNOWN_LICENSE = "NOASSERTION"
+DEFAULT_TYPE = "Library"
+
+SCOPE_PRODUCTION = "Production"
+SCOPE_DEVELOPMENT = "Development"
+
+TYPE_APPLICATION = "Application"
+TYPE_DIRECT = "Direct"
+TYPE_TRANSITIVE = "Transitive"
+
+# Top-level keys that identify each format
+SPDX_KEYS = ("spdxVersion", "SPDXID", "name", "packages", "relationships", "documentDescribes")
+CYCLONEDX_KEYS = ("bomFormat", "specVersion", "metadata", "components", "dependencies")
+
+# Edge kinds collected while streaming relationships
+_DESCRIBES = 0
+_DEPENDS = 1
+_DEV_DEPENDS = 2
+
+# SPDX relationship type -> (edge kind, whether the edge points from related to element)
+SPDX_RELATIONSHIPS = {
+    "DESCRIBES": (_DESCRIBES, False),
+    "DESCRIBED_BY": (_DESCRIBES, True),
+    "DEPENDS_ON": (_DEPENDS, False),
+    "DEPENDENCY_OF": (_DEPENDS, True),
+    "CONTAINS": (_DEPENDS, False),
+    "CONTAINED_BY": (_DEPENDS, True),
+    "OPTIONAL_DEPENDENCY_OF": (_DEPENDS, True),
+    "RUNTIME_DEPENDENCY_OF": (_DEPENDS, True),
+    "DEV_DEPENDENCY_OF": (_DEV_DEPENDS, True),
+    "TEST_DEPENDENCY_OF": (_DEV_DEPENDS, True),
+    "BUILD_DEPENDENCY_OF": (_DEV_DEPENDS, True),
+    "DEV_TOOL_OF": (_DEV_DEPENDS, True),
+    "BUILD_TOOL_OF": (_DEV_DEPENDS, True),
+    "TEST_TOOL_OF": (_DEV_DEPENDS, True),
+}
+
+
+def purl_type(purl):
+    """Ecosystem of a package URL (pkg:npm/... -> npm)"""
+    if not purl or not purl.startswith("pkg:"):
+        return ""
+    end = purl.find("/", 4)
+    return purl[4:end].lower() if end > 4 else ""
+
+
+def parse_purl(purl):
+    """
+    (type, name, version) of a package URL; qualifiers and subpath are dropped.
+    The namespace is kept in the name the way the loaders spell it:
+    pkg:npm/%40babel/core@7.0.0 -> ("npm", "@babel/core", "7.0.0"),
+    pkg:maven/org.slf4j/slf4j-api@2.0.9 -> ("maven", "org.slf4j:slf4j-api", "2.0.9")
+    """
+    if not purl or not purl.startswith("pkg:"):
+        return "", "", ""
+    body = purl[4:].lstrip("/").split("#", 1)[0].split("?", 1)[0]
+    type, _, path = body.partition("/")
+    version = ""
+    at = path.rfind("@")
+    if at > 0:
+        path, version = path[:at], path[at + 1:]
+    type = type.lower()
+    name = path.strip("/")
+    if type == "maven":
+        name = name.replace("/", ":")
+    # Most purls carry no escapes; unquote only when needed
+    if "%" in name:
+        name = unquote(name)
+    if "%" in version:
+        version = unquote(version)
+    return type, name, version
+
+
+def normalize_name(ecosystem, name):
+    """Package name as compared within an ecosystem (case and PEP 503 folding)"""
+    if ecosystem == "pypi":
+        return re.sub(r'[-_.]+', '-', name).lower()
+    if ecosystem in ("npm", "cargo", "nuget", "composer"):
+        return name.lower()
+    return name
+
+
+class _Edges:
+    """Relationships held by reference until every component has been read"""
+
+    __slots__ = ("sources", "targets", "kinds")
+
+    def __init__(self):
+        self.sources = []
+        self.targets = []
+        self.kinds = bytearray()
+
+    def add(self, source, target, kind):
+        self.sources.append(sys.intern(source))
+        self.targets.append(sys.intern(target))
+        self.kinds.append(kind)
+
+
+def _spdx_license(package):
+    for key in ("licenseConcluded", "licenseDeclared"):
+        value = package.get(key)
+        if value and value not in ("NOASSERTION", "NONE"):
+            return value
+    return UNKNOWN_LICENSE
+
+
+def _spdx_purl(package):
+    for ref in package.get("externalRefs") or ():
+        if ref.get("referenceType") == "purl":
+            return ref.get("referenceLocator") or ""
+    return ""
+
+
+def _add_spdx_package(store, package):
+    purl = _spdx_purl(package)
+    purpose = package.get("primaryPackagePurpose")
+    store.add(
+        package.get("name") or "",
+        package.get("versionInfo") or "",
+        _spdx_license(package),
+        purpose.replace("_", " ").title() if purpose else DEFAULT_TYPE,
+        SCOPE_PRODUCTION,
+        purl_type(purl),
+        purl,
+        package.get("SPDXID") or "",
+    )
+
+
+def _cdx_license(component):
+    names = []
+    for entry in component.get("licenses") or ():
+        if "expression" in entry:
+            if entry["expression"]:
+                names.append(entry["expression"])
+            continue
+        lic = entry.get("license") or {}
+        name = lic.get("id") or lic.get("name")
+        if name:
+            names.append(name)
+    if not names:
+        return UNKNOWN_LICENSE
+    if len(names) == 1:
+        return names[0]
+    return " AND ".join(f"({name})" if " " in name else name for name in names)
+
+
+def _cdx_is_dev(component):
+    if component.get("scope") == "excluded":
+        return True
+    for prop in component.get("properties") or ():
+        if prop.get("name") == "cdx:npm:package:development" and prop.get("value") == "true":
+            return True
+    return False
+
+
+def _add_cdx_component(store, component):
+    purl = component.get("purl") or ""
+    ecosystem = purl_type(purl)
+    name = component.get("name") or ""
+    group = component.get("group")
+    if group:
+        name = f"{group}/{name}" if ecosystem == "npm" else f"{group}:{name}"
+    kind = component.get("type")
+    store.add(
+        name,
+        component.get("version") or "",
+        _cdx_license(component),
+        kind.replace("-", " ").title() if kind else DEFAULT_TYPE,
+        SCOPE_DEVELOPMENT if _cdx_is_dev(component) else SCOPE_PRODUCTION,
+        ecosystem,
+        purl,
+        component.get("bom-ref") or "",
+    )
+    for child in component.get("components") or ():
+        _add_cdx_component(store, child)
+
+
+def _resolve_edges(store, edges, roots):
+    """Attach relationships to the store and derive Direct/Transitive types"""
+    rows = {ref: row for row, ref in enumerate(store.refs) if ref}
+    root_set = set(roots)
+    outgoing = set()
+    direct = set()
+    dev = set()
+    root_targets = {}
+    for source, target, kind in zip(edges.sources, edges.targets, edges.kinds):
+        target_row = rows.get(target)
+        if target_row is None:
+            continue
+        if kind == _DEV_DEPENDS:
+            dev.add(target_row)
+        source_row = rows.get(source)
+        if source in root_set:
+            direct.add(target_row)
+        if source_row is not None:
+            store.add_edge(source_row, target_row)
+            outgoing.add(source_row)
+            if source in root_set:
+                root_targets.setdefault(source_row, []).append(target_row)
+
+    for row in dev:
+        store.set_scope(row, SCOPE_DEVELOPMENT)
+    if not store.edge_sources and not direct:
+        return
+
+    # A single described package with its own dependencies is the product itself
+    for ref in roots:
+        row = rows.get(ref)
+        if row is None:
+            continue
+        if row in outgoing and len(root_set) == 1:
+            store.set_type(row, TYPE_APPLICATION)
+            if not store.project.get("version"):
+                store.project = {"name": store.names[row], "version": store.versions[row]}
+            direct.update(root_targets.get(row, ()))
+        else:
+            direct.add(row)
+    application = store.strings.code(TYPE_APPLICATION)
+    for row in range(store.size):
+        if store.type_codes[row] != application:
+            store.set_type(row, TYPE_DIRECT if row in direct else TYPE_TRANSITIVE)
+
+
+def _load_spdx_key(stream, key, store, edges, roots):
+    if key == "name":
+        store.project.setdefault("name", stream.read_value() or "")
+    elif key == "SPDXID":
+        roots.append(("document", stream.read_value()))
+    elif key == "documentDescribes":
+        for ref in stream.iter_elements():
+            roots.append(("described", ref))
+    elif key == "packages":
+        for package in stream.iter_elements():
+            _add_spdx_package(store, package)
+    elif key == "relationships":
+        for rel in stream.iter_elements():
+            mapping = SPDX_RELATIONSHIPS.get(rel.get("relationshipType"))
+            if mapping is None:
+                continue
+            kind, reverse = mapping
+            element, related = rel.get("spdxElementId") or "", rel.get("relatedSpdxElement") or ""
+            if reverse:
+                element, related = related, element
+            edges.add(element, related, kind)
+
+
+def _load_cdx_key(stream, key, store, edges, roots):
+    if key == "metadata":
+        metadata = stream.read_value()
+        component = metadata.get("component") or {}
+        if component.get("name"):
+            store.project = {"name": component["name"], "version": component.get("version") or ""}
+        if component.get("bom-ref"):
+            roots.append(("described", component["bom-ref"]))
+    elif key == "components":
+        for component in stream.iter_elements():
+            _add_cdx_component(store, component)
+    elif key == "dependencies":
+        for dependency in stream.iter_elements():
+            ref = dependency.get("ref") or ""
+            for target in dependency.get("dependsOn") or ():
+                if target:
+                    edges.add(ref, target, _DEPENDS)
+
+
+def load_sbom(path):
+    """Load an SPDX 2.x or CycloneDX JSON document into a ComponentStore"""
+    with open(path, encoding="utf-8") as fp:
+        return read_sbom(fp, path)
+
+
+def read_sbom(fp, name="<stream>"):
+    """Read an SPDX 2.x or CycloneDX JSON document from a text file object; name is used in errors"""
+    store = ComponentStore()
+    edges = _Edges()
+    roots = []
+    handler = None
+    stream = JsonStream(fp)
+    for key in stream.iter_object():
+        if handler is None:
+            if key in SPDX_KEYS:
+                handler = _load_spdx_key
+            elif key in CYCLONEDX_KEYS:
+                handler = _load_cdx_key
+            else:
+                continue
+        handler(stream, key, store, edges, roots)
+    if handler is None:
+        raise ValueError(f"{name}: not an SPDX or CycloneDX JSON document")
+
+    document_refs = {ref for kind, ref in roots if kind == "document"}
+    root_refs = [ref for kind, ref in roots if kind == "described"]
+    # SPDX: DOCUMENT DESCRIBES <package> marks the described packages as roots
+    kept = _Edges()
+    for source, target, kind in zip(edges.sources, edges.targets, edges.kinds):
+        if kind == _DESCRIBES or source in document_refs:
+            root_refs.append(target)
+        else:
+            kept.add(source, target, kind)
+    _resolve_edges(store, kept, root_refs)
+    return store
@@ -0,0 +1,309 @@
+"""
+Local report service
+A small asyncio HTTP server (TCP on localhost or a Unix socket) that renders
+SBOM payloads in a pool of warm worker processes, each holding the imported
+ReportLab modules, loaded fonts and the stylesheet for its whole lifetime.
+
+    POST /render?name=...&version=...&type=auto|sbom|lockfile   body: SBOM or lockfile JSON
+        -> 200 application/pdf, streamed back as it is read from disk
+    GET /health
+        -> 200 application/json with worker and queue counters
+
+Uploads are spooled to disk rather than held in memory. At most `workers`
+reports render at once and at most `max_pending` more wait for a worker;
+beyond that requests are refused with 503 so callers can retry. A worker
+that dies mid-render breaks the pool; it is replaced with a freshly warmed
+one and the affected requests get 503 as well.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from .batch import init_worker
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_PAYLOAD_BYTES = 256 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+HEADER_TIMEOUT = 30
+PROJECT_OVERRIDES = ("name", "version", "vendor", "description")
+# Organisation-wide fields of the base project that apply to every uploaded SBOM
+SHARED_PROJECT_FIELDS = ("vendor", "report_version")
+PAYLOAD_TYPES = ("auto", "sbom", "lockfile")
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _warm():
+    """No-op task that forces a worker process (and its initializer) to start"""
+    return os.getpid()
+
+
+def _payload_type(path):
+    """Sniff a spooled payload: npm lockfiles declare lockfileVersion near the top"""
+    with open(path, "rb") as fp:
+        head = fp.read(4096)
+    return "lockfile" if b'"lockfileVersion"' in head else "sbom"
+
+
+def render_payload(payload_path, payload_type, project, overrides, output):
+    """Load a spooled payload and render its report; runs inside a worker process"""
+    from .batch import render_store
+    from .lockfile import load_lockfile_dependencies
+    from .sbomdoc import load_sbom
+
+    if payload_type == "auto":
+        payload_type = _payload_type(payload_path)
+    if payload_type == "lockfile":
+        store = load_lockfile_dependencies(payload_path)
+    else:
+        store = load_sbom(payload_path)
+    if store.project.get("name") and "name" not in overrides:
+        project = dict(project, name=store.project["name"])
+    render_store(store, dict(project, **overrides), output)
+    return store.size
+
+
+def service_project(base_project):
+    """Project metadata for an uploaded SBOM before its own name/version are known"""
+    project = {
+        "name": "Uploaded SBOM",
+        "version": "N/A",
+        "description": "Report rendered by the SBOM report service",
+        "license": "NOASSERTION",
+    }
+    project.update((key, base_project[key]) for key in SHARED_PROJECT_FIELDS)
+    return project
+
+
+class ReportService:
+    """Accepts render requests and schedules them on the warm worker pool"""
+
+    def __init__(self, base_project, workers=None, max_pending=None, advisory_index=None,
+                 max_payload_bytes=DEFAULT_MAX_PAYLOAD_BYTES, log=print, compact=False):
+        self.base_project = service_project(base_project)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = self.workers * 4 if max_pending is None else max_pending
+        self.advisory_index = advisory_index
+        self.compact = compact
+        self.max_payload_bytes = max_payload_bytes
+        self.log = log
+        self.in_flight = 0
+        self.waiting = 0
+        self.rendered = 0
+        self.failed = 0
+        self.pool = None
+        self.spool_dir = None
+        self._slots = None
+
+    async def start(self):
+        """Start the worker processes and wait until every one is warm"""
+        self.spool_dir = tempfile.mkdtemp(prefix="sbom-service-")
+        self._slots = asyncio.Semaphore(self.workers)
+        pids = await self._start_pool()
+        self.log(f"✓ {len(set(pids))} report workers ready")
+
+    async def _start_pool(self):
+        """Replace self.pool with new worker processes; returns their pids once all are warm"""
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                        initargs=(self.advisory_index, None, None, None, self.compact))
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(loop.run_in_executor(self.pool, _warm) for _ in range(self.workers)))
+
+    async def _replace_pool(self, broken):
+        """Swap a broken pool for a warm one, once however many requests saw it break"""
+        if self.pool is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        pids = await self._start_pool()
+        self.log(f"  ✗ a report worker died; {len(set(pids))} new workers ready")
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        if self.spool_dir is not None:
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+    def health(self):
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_pending": self.max_pending,
+            "rendered": self.rendered,
+            "failed": self.failed,
+        }
+
+    async def handle(self, reader, writer):
+        started = time.perf_counter()
+        method = target = "-"
+        status = 500
+        sent = 0
+        try:
+            method, target, headers = await asyncio.wait_for(_read_head(reader), HEADER_TIMEOUT)
+            url = urlsplit(target)
+            if url.path == "/health" and method == "GET":
+                status = 200
+                sent = await _respond(writer, status, json.dumps(self.health()).encode())
+            elif url.path == "/render" and method == "POST":
+                status, sent = await self._render(reader, writer, headers, parse_qs(url.query))
+            elif url.path in ("/health", "/render"):
+                raise RequestError(405, f"{method} not allowed on {url.path}")
+            else:
+                raise RequestError(404, f"No such endpoint: {url.path}")
+        except RequestError as e:
+            status = e.status
+            sent = await _respond(writer, status, json.dumps({"error": str(e)}).encode())
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            status = 400
+        except Exception as e:
+            status = 500
+            self.log(f"  ✗ {type(e).__name__}: {e}")
+            sent = await _respond(writer, status, json.dumps({"error": "internal error"}).encode())
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.log(f"{method} {target} {status} {sent} bytes {time.perf_counter() - started:.3f}s")
+
+    async def _render(self, reader, writer, headers, query):
+        payload_type = query.get("type", ["auto"])[-1]
+        if payload_type not in PAYLOAD_TYPES:
+            raise RequestError(400, f"type must be one of {', '.join(PAYLOAD_TYPES)}")
+        length = headers.get("content-length")
+        if length is None or not length.isdigit():
+            raise RequestError(411, "Content-Length is required")
+        length = int(length)
+        if length > self.max_payload_bytes:
+            raise RequestError(413, f"Payload larger than {self.max_payload_bytes} bytes")
+        if self.waiting >= self.max_pending:
+            raise RequestError(503, "Render queue is full, retry later")
+
+        fd, payload_path = tempfile.mkstemp(dir=self.spool_dir, suffix=".json")
+        output = payload_path[:-len(".json")] + ".pdf"
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                remaining = length
+                while remaining:
+                    chunk = await reader.read(min(STREAM_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise asyncio.IncompleteReadError(b"", remaining)
+                    fp.write(chunk)
+                    remaining -= len(chunk)
+
+            overrides = {key: query[key][-1] for key in PROJECT_OVERRIDES if key in query}
+            project = dict(self.base_project, report_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            await self._run(payload_path, payload_type, project, overrides, output)
+            return 200, await _stream_file(writer, output, "application/pdf")
+        finally:
+            for path in (payload_path, output):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    async def _run(self, *args):
+        """Wait for a free worker slot, then render in the pool"""
+        if self.waiting >= self.max_pending:
+            raise RequestError(503, "Render queue is full, retry later")
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+        pool = self.pool
+        try:
+            await asyncio.get_running_loop().run_in_executor(pool, render_payload, *args)
+            self.rendered += 1
+        except BrokenProcessPool as e:
+            self.failed += 1
+            await self._replace_pool(pool)
+            raise RequestError(503, "A report worker died, retry later") from e
+        except (ValueError, KeyError) as e:
+            self.failed += 1
+            message = str(e).replace(args[0], "payload")
+            raise RequestError(422, f"Could not read the payload: {message}") from e
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+
+async def _read_head(reader):
+    """Parse the request line and headers"""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    method, target, _ = request_line.split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method.upper(), target, headers
+
+
+def _head(status, content_type, length):
+    return (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {length}\r\n"
+            f"Connection: close\r\n\r\n").encode("latin-1")
+
+
+async def _respond(writer, status, body, content_type="application/json"):
+    writer.write(_head(status, content_type, len(body)) + body)
+    await writer.drain()
+    return len(body)
+
+
+async def _stream_file(writer, path, content_type):
+    """Send a file in chunks, waiting on the socket between chunks"""
+    size = os.path.getsize(path)
+    writer.write(_head(200, content_type, size))
+    with open(path, "rb") as fp:
+        while True:
+            chunk = fp.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    return size
+
+
+async def serve(base_project, host="127.0.0.1", port=DEFAULT_PORT, unix_socket=None, workers=None,
+                max_pending=None, advisory_index=None, log=print, compact=False):
+    """Run the service until cancelled (Ctrl+C)"""
+    service = ReportService(base_project, workers=workers, max_pending=max_pending,
+                            advisory_index=advisory_index, log=log, compact=compact)
+    await service.start()
+    try:
+        if unix_socket:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            server = await asyncio.start_unix_server(service.handle, path=unix_socket)
+            log(f"✓ SBOM report service listening on unix:{unix_socket}")
+        else:
+            server = await asyncio.start_server(service.handle, host, port)
+            log(f"✓ SBOM report service listening on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+        if unix_socket and os.path.exists(unix_socket):
+            os.remove(unix_socket)
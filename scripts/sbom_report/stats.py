@@ -0,0 +1,162 @@
+"""
+Report statistics computed in one pass over the component store
+The (license, type, scope, ecosystem) code columns are counted together in a
+single C-level pass; everything else is folded from those few distinct
+combinations, so license expressions are normalized once per distinct
+string rather than once per component.
+"""
+
+from collections import Counter
+
+from .licenses import COPYLEFT_CATEGORIES, PERMISSIVE, PUBLIC_DOMAIN, UNKNOWN, UNKNOWN_LICENSE, normalize_license
+from .model import SCOPE_ORDER, ComponentStore
+from .sbomdoc import TYPE_APPLICATION
+
+TOP_LICENSES = 5
+EXAMPLES_PER_LICENSE = 3
+
+
+def _add(counts, key, value):
+    counts[key] = counts.get(key, 0) + value
+
+
+def _ranked(counts):
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+class ReportStats:
+    """Every count the report needs, from one aggregation pass"""
+
+    def __init__(self):
+        self.total = 0
+        self.by_scope = {}
+        self.by_type = {}
+        self.by_ecosystem = {}
+        # Normalized expression -> components
+        self.by_license = {}
+        # License id -> components whose expression names it
+        self.by_license_id = {}
+        self.by_category = {}
+        # License id -> a few component names, for the top license ids
+        self.license_examples = {}
+
+    @property
+    def unique_licenses(self):
+        return len(self.by_license)
+
+    def scope_count(self, scope):
+        return self.by_scope.get(scope, 0)
+
+    def scopes(self):
+        """Scopes in report order: Production, Development, then the rest"""
+        ordered = [scope for scope in SCOPE_ORDER if scope in self.by_scope]
+        return ordered + sorted(scope for scope in self.by_scope if scope not in SCOPE_ORDER)
+
+    def licenses(self):
+        """(expression, count) pairs, most used first"""
+        return _ranked(self.by_license)
+
+    def top_license_ids(self, limit=TOP_LICENSES):
+        """Most used license ids, leaving out missing license information"""
+        return [license_id for license_id, _ in _ranked(self.by_license_id)
+                if normalize_license(license_id).category != UNKNOWN][:limit]
+
+    @property
+    def primary_license(self):
+        top = self.top_license_ids(1)
+        return top[0] if top else UNKNOWN_LICENSE
+
+    def category_count(self, *categories):
+        return sum(self.by_category.get(category, 0) for category in categories)
+
+    def percentage(self, count):
+        return 100.0 * count / self.total if self.total else 0.0
+
+    @property
+    def permissive_count(self):
+        return self.category_count(PERMISSIVE, PUBLIC_DOMAIN)
+
+    @property
+    def copyleft_count(self):
+        return self.category_count(*COPYLEFT_CATEGORIES)
+
+    @property
+    def unknown_count(self):
+        return self.category_count(UNKNOWN)
+
+    def copyleft_license_ids(self):
+        return [license_id for license_id, _ in _ranked(self.by_license_id)
+                if normalize_license(license_id).category in COPYLEFT_CATEGORIES]
+
+    def as_dict(self):
+        """JSON-ready view of every statistic"""
+        return {
+            "total": self.total,
+            "by_scope": {scope: self.by_scope[scope] for scope in self.scopes()},
+            "by_type": dict(_ranked(self.by_type)),
+            "by_ecosystem": dict(_ranked(self.by_ecosystem)),
+            "unique_licenses": self.unique_licenses,
+            "primary_license": self.primary_license,
+            "licenses": dict(self.licenses()),
+            "license_ids": dict(_ranked(self.by_license_id)),
+            "license_categories": dict(_ranked(self.by_category)),
+            "copyleft_license_ids": self.copyleft_license_ids(),
+        }
+
+
+def compute_stats(dependencies, example_limit=EXAMPLES_PER_LICENSE):
+    """Aggregate a ComponentStore (or a scope -> component dicts mapping), leaving out the application row"""
+    store = dependencies if isinstance(dependencies, ComponentStore) else ComponentStore.from_dependencies(dependencies)
+    values = store.strings.values
+    stats = ReportStats()
+    application = store.strings.lookup(TYPE_APPLICATION)
+
+    combinations = Counter(zip(store.license_codes, store.type_codes, store.scope_codes, store.ecosystem_codes))
+    license_ids_by_code = {}
+    for (license_code, type_code, scope_code, ecosystem_code), count in combinations.items():
+        # The product an SBOM describes is not one of its own components
+        if type_code == application:
+            continue
+        stats.total += count
+        info = normalize_license(values[license_code])
+        license_ids_by_code[license_code] = info.ids
+        _add(stats.by_license, info.expression, count)
+        _add(stats.by_category, info.category, count)
+        for license_id in info.ids:
+            _add(stats.by_license_id, license_id, count)
+        _add(stats.by_type, values[type_code], count)
+        _add(stats.by_scope, values[scope_code], count)
+        if values[ecosystem_code]:
+            _add(stats.by_ecosystem, values[ecosystem_code], count)
+
+    if example_limit:
+        stats.license_examples = _license_examples(store, license_ids_by_code, stats.top_license_ids(), example_limit)
+    return stats
+
+
+def _license_examples(store, license_ids_by_code, top_ids, limit):
+    """First few component names per top license id; production first, the application row skipped"""
+    examples = {license_id: [] for license_id in top_ids}
+    wanted = {}
+    for code, ids in license_ids_by_code.items():
+        matching = [license_id for license_id in ids if license_id in examples]
+        if matching:
+            wanted[code] = matching
+    missing = len(examples)
+    names = store.names
+    license_codes = store.license_codes
+    type_codes = store.type_codes
+    application = store.strings.lookup(TYPE_APPLICATION)
+    for scope in store:
+        for row in store[scope].rows:
+            if type_codes[row] == application:
+                continue
+            for license_id in wanted.get(license_codes[row], ()):
+                names_for_id = examples[license_id]
+                if len(names_for_id) < limit and names[row] not in names_for_id:
+                    names_for_id.append(names[row])
+                    if len(names_for_id) == limit:
+                        missing -= 1
+            if not missing:
+                return examples
+    return examples
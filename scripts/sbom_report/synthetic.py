@@ -0,0 +1,230 @@
+"""
+Deterministic synthetic SBOM generators for benchmarks
+Writes SPDX 2.3, CycloneDX 1.5 and npm lockfile v3 documents of any size.
+The same (size, seed) always produces the same inventory in every format.
+Documents are written entry by entry; the JSON tree is never built in memory.
+"""
+
+import json
+import os
+import random
+
+FORMATS = ("spdx", "cyclonedx", "lockfile")
+
+# (license expression, weight) - roughly the mix seen in npm production trees
+LICENSE_WEIGHTS = (
+    ("MIT", 60),
+    ("Apache-2.0", 12),
+    ("ISC", 10),
+    ("BSD-3-Clause", 6),
+    ("BSD-2-Clause", 4),
+    ("MIT OR Apache-2.0", 3),
+    ("NOASSERTION", 3),
+    ("GPL-3.0-only", 1),
+    ("LGPL-2.1-or-later", 1),
+)
+
+SCOPES = ("", "", "", "@acme/", "@types/", "@babel/", "@radix-ui/")
+
+
+class SyntheticPackage:
+    __slots__ = ("index", "name", "version", "license", "dev", "depends_on")
+
+    def __init__(self, index, name, version, license, dev, depends_on):
+        self.index = index
+        self.name = name
+        self.version = version
+        self.license = license
+        self.dev = dev
+        self.depends_on = depends_on
+
+
+def synthetic_packages(size, seed=1):
+    """
+    Yield a deterministic dependency DAG of size packages.
+    Every package depends on up to four earlier ones; about 5% reuse an
+    earlier name with a different version and about 30% are development-only.
+    """
+    rng = random.Random(seed)
+    licenses = [lic for lic, weight in LICENSE_WEIGHTS for _ in range(weight)]
+    names = []
+    for index in range(size):
+        if names and rng.random() < 0.05:
+            name = names[rng.randrange(len(names))]
+        else:
+            name = f"{rng.choice(SCOPES)}pkg-{index:06d}"
+            names.append(name)
+        version = f"{rng.randrange(0, 12)}.{rng.randrange(0, 30)}.{rng.randrange(0, 20)}"
+        depends_on = sorted({rng.randrange(index) for _ in range(rng.randrange(5))}) if index else []
+        yield SyntheticPackage(index, name, version, rng.choice(licenses), rng.random() < 0.3, depends_on)
+
+
+def _first_dependents(packages):
+    """index -> first package that depends on it; packages missing here are top-level"""
+    first = {}
+    for pkg in packages:
+        for dep in pkg.depends_on:
+            first.setdefault(dep, pkg.index)
+    return first
+
+
+def _purl(name, version):
+    if name.startswith("@"):
+        name = "%40" + name[1:]
+    return f"pkg:npm/{name}@{version}"
+
+
+def _write_array(fp, items):
+    fp.write("[")
+    first = True
+    for item in items:
+        if not first:
+            fp.write(",")
+        fp.write("\n    ")
+        fp.write(json.dumps(item))
+        first = False
+    fp.write("\n  ]")
+
+
+def write_spdx(path, size, seed=1):
+    packages = list(synthetic_packages(size, seed))
+    dependents = _first_dependents(packages)
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write('{\n  "spdxVersion": "SPDX-2.3",\n  "dataLicense": "CC0-1.0",\n')
+        fp.write('  "SPDXID": "SPDXRef-DOCUMENT",\n')
+        fp.write(f'  "name": "synthetic-{size}",\n')
+        fp.write(f'  "documentNamespace": "https://example.com/sbom/synthetic/{size}/{seed}",\n')
+        fp.write('  "packages": ')
+        _write_array(fp, (
+            {
+                "SPDXID": "SPDXRef-Package-root" if pkg is None else f"SPDXRef-Package-{pkg.index}",
+                "name": "synthetic-app" if pkg is None else pkg.name,
+                "versionInfo": "1.0.0" if pkg is None else pkg.version,
+                "downloadLocation": "NOASSERTION",
+                "licenseDeclared": "MIT" if pkg is None else pkg.license,
+                "externalRefs": [] if pkg is None else [{
+                    "referenceCategory": "PACKAGE-MANAGER",
+                    "referenceType": "purl",
+                    "referenceLocator": _purl(pkg.name, pkg.version),
+                }],
+            }
+            for pkg in [None] + packages
+        ))
+        fp.write(',\n  "relationships": ')
+
+        def relationships():
+            yield {"spdxElementId": "SPDXRef-DOCUMENT", "relationshipType": "DESCRIBES",
+                   "relatedSpdxElement": "SPDXRef-Package-root"}
+            for pkg in packages:
+                if pkg.index not in dependents:
+                    kind = "DEV_DEPENDENCY_OF" if pkg.dev else "DEPENDENCY_OF"
+                    yield {"spdxElementId": f"SPDXRef-Package-{pkg.index}", "relationshipType": kind,
+                           "relatedSpdxElement": "SPDXRef-Package-root"}
+                for dep in pkg.depends_on:
+                    if packages[dep].dev:
+                        yield {"spdxElementId": f"SPDXRef-Package-{dep}", "relationshipType": "DEV_DEPENDENCY_OF",
+                               "relatedSpdxElement": f"SPDXRef-Package-{pkg.index}"}
+                    else:
+                        yield {"spdxElementId": f"SPDXRef-Package-{pkg.index}", "relationshipType": "DEPENDS_ON",
+                               "relatedSpdxElement": f"SPDXRef-Package-{dep}"}
+        _write_array(fp, relationships())
+        fp.write("\n}\n")
+
+
+def write_cyclonedx(path, size, seed=1):
+    packages = list(synthetic_packages(size, seed))
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write('{\n  "bomFormat": "CycloneDX",\n  "specVersion": "1.5",\n  "version": 1,\n')
+        fp.write('  "metadata": ' + json.dumps({
+            "component": {"bom-ref": "root", "type": "application", "name": "synthetic-app", "version": "1.0.0"}
+        }) + ',\n')
+        fp.write('  "components": ')
+        _write_array(fp, (
+            {
+                "bom-ref": f"c{pkg.index}",
+                "type": "library",
+                "name": pkg.name,
+                "version": pkg.version,
+                "purl": _purl(pkg.name, pkg.version),
+                "scope": "excluded" if pkg.dev else "required",
+                "licenses": [] if pkg.license == "NOASSERTION" else (
+                    [{"expression": pkg.license}] if " " in pkg.license else [{"license": {"id": pkg.license}}]
+                ),
+            }
+            for pkg in packages
+        ))
+        fp.write(',\n  "dependencies": ')
+        dependents = _first_dependents(packages)
+        roots = [f"c{pkg.index}" for pkg in packages if pkg.index not in dependents]
+        _write_array(fp, [{"ref": "root", "dependsOn": roots}] + [
+            {"ref": f"c{pkg.index}", "dependsOn": [f"c{dep}" for dep in pkg.depends_on]}
+            for pkg in packages
+        ])
+        fp.write("\n}\n")
+
+
+def write_lockfile(directory, size, seed=1):
+    """Write package.json and package-lock.json into directory; returns the lockfile path"""
+    packages = list(synthetic_packages(size, seed))
+    dependents = _first_dependents(packages)
+    direct = [pkg for pkg in packages if pkg.index not in dependents]
+    manifest = {
+        "name": "synthetic-app",
+        "version": "1.0.0",
+        "license": "MIT",
+        "dependencies": {pkg.name: f"^{pkg.version}" for pkg in direct if not pkg.dev},
+        "devDependencies": {pkg.name: f"^{pkg.version}" for pkg in direct if pkg.dev},
+    }
+    with open(os.path.join(directory, "package.json"), "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=2)
+
+    path = os.path.join(directory, "package-lock.json")
+    hoisted = set()
+    keys = set()
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write('{\n  "name": "synthetic-app",\n  "version": "1.0.0",\n  "lockfileVersion": 3,\n')
+        fp.write('  "requires": true,\n  "packages": {\n')
+        fp.write('    "": ' + json.dumps(manifest))
+        for pkg in packages:
+            # Repeated names are nested under the first package that depends on them
+            if pkg.name not in hoisted:
+                key = f"node_modules/{pkg.name}"
+                hoisted.add(pkg.name)
+            elif pkg.index in dependents:
+                parent = packages[dependents[pkg.index]].name
+                key = f"node_modules/{parent}/node_modules/{pkg.name}"
+            else:
+                continue
+            if key in keys:
+                continue
+            keys.add(key)
+            entry = {
+                "version": pkg.version,
+                "resolved": f"https://registry.npmjs.org/{pkg.name}/-/{pkg.name.split('/')[-1]}-{pkg.version}.tgz",
+                "integrity": f"sha512-{pkg.index:0>86}==",
+                "dependencies": {packages[dep].name: f"^{packages[dep].version}" for dep in pkg.depends_on},
+            }
+            if pkg.dev:
+                entry["dev"] = True
+            if pkg.license != "NOASSERTION":
+                entry["license"] = pkg.license
+            fp.write(",\n    " + json.dumps(key) + ": " + json.dumps(entry))
+        fp.write("\n  }\n}\n")
+    return path
+
+
+def write_synthetic(fmt, directory, size, seed=1):
+    """Write one synthetic input of the given format; returns the path to load"""
+    if fmt == "spdx":
+        path = os.path.join(directory, f"synthetic-{size}.spdx.json")
+        write_spdx(path, size, seed)
+        return path
+    if fmt == "cyclonedx":
+        path = os.path.join(directory, f"synthetic-{size}.cdx.json")
+        write_cyclonedx(path, size, seed)
+        return path
+    if fmt == "lockfile":
+        lock_dir = os.path.join(directory, f"lockfile-{size}")
+        os.makedirs(lock_dir, exist_ok=True)
+        return write_lockfile(lock_dir, size, seed)
+    raise ValueError(f"Unknown synthetic format: {fmt}")
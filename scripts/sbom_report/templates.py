@@ -0,0 +1,172 @@
+"""
+Pre-rendered report pages
+The text of sections 5-8 and the title page artwork read the same in every
+report but for a few project fields. ReportTemplates lays such a block out
+once per process, keeps the PDF drawing operators of each of its pages and
+stamps them into every later report as a form XObject, so a batch worker
+parses and flows that text once instead of once per report. The variable
+parts (5.4, the 6.2 counts, 6.4, the contact details of Appendix C, the
+project fields of the title page) are laid out normally around the stamps,
+and page numbers and footers still come from the report's own page callbacks.
+The operators keep the fonts they use open and take the font resource names
+of the report they are stamped into. A block whose pages would need
+resources of their own (links, images) is flowed as usual instead.
+"""
+
+import json
+import re
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak
+from reportlab.platypus.flowables import Flowable
+
+from .report import BOILERPLATE, report_document
+
+# The font operand of a Tf operator, the only place page operators name a resource
+_FONT_RE = re.compile(r"(/F\d+)(?= [-\d.]+ Tf)")
+
+
+class Operators:
+    """Page drawing operators with their font resources left open"""
+
+    def __init__(self, code, font_mapping):
+        names = {internal: font for font, internal in font_mapping.items()}
+        # Text, font name, text, ... with the fonts at the odd indices
+        self.parts = _FONT_RE.split(code)
+        self.parts[1::2] = [names[internal] for internal in self.parts[1::2]]
+
+    @classmethod
+    def from_canvas(cls, canvas):
+        return cls("\n".join(canvas._code), canvas._doc.fontMapping)
+
+    def render(self, doc):
+        """The operators with the font resource names of the document doc"""
+        parts = list(self.parts)
+        parts[1::2] = [doc.getInternalFontName(font) for font in parts[1::2]]
+        return "".join(parts)
+
+
+def _has_own_resources(canvas):
+    return bool(canvas._formsinuse or canvas._annotationrefs or canvas._colorsUsed or canvas._shadingUsed)
+
+
+def _use_form(canvas, name, operators):
+    """Draw the named form, defining it in canvas's document on first use"""
+    if not canvas.hasForm(name):
+        canvas.beginForm(name)
+        canvas._code.append(operators.render(canvas._doc))
+        canvas.endForm()
+    canvas.doForm(name)
+
+
+class StaticBlock(Flowable):
+    """
+    One page of a pre-rendered block
+    (x, y) is the bottom left of the laid-out content on the page it was
+    captured from, so the form lands where the flowables would have been.
+    """
+
+    def __init__(self, name, operators, x, y, width, height):
+        Flowable.__init__(self)
+        self.name = name
+        self.operators = operators
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.translate(-self.x, -self.y)
+        _use_form(self.canv, self.name, self.operators)
+
+
+def _capture(flowables):
+    """Lay flowables out from the top of fresh report pages; [(Operators, x, y, width, height)] or None"""
+    doc = report_document(BytesIO())
+    pages = []
+
+    def after_page():
+        canvas, frame = doc.canv, doc.frame
+        if _has_own_resources(canvas):
+            pages.append(None)
+            return
+        top = frame._y2 - frame._topPadding
+        pages.append((Operators.from_canvas(canvas), frame._x1 + frame._leftPadding, frame._y, frame._aW,
+                      top - frame._y))
+
+    doc.afterPage = after_page
+    doc.build(list(flowables))
+    if None in pages:
+        return None
+    return pages
+
+
+class ReportTemplates:
+    """
+    Blocks and canvas drawings pre-rendered in this process, keyed by their
+    section and text, with the boilerplate wording the reports use.
+    All reports stamped from one ReportTemplates share its first stylesheet.
+    """
+
+    def __init__(self, boilerplate=None):
+        # The organization's replacements (load_boilerplate), part of a cached report's key
+        self.overrides = dict(boilerplate or {})
+        self.boilerplate = dict(BOILERPLATE, **self.overrides)
+        self._blocks = {}
+        self._drawings = {}
+
+    def _name(self):
+        return f"SBOMStatic{len(self._blocks) + len(self._drawings)}"
+
+    def blocks(self, key, build):
+        """
+        Flowables stamping the pages the flowables from build() fill, each
+        block on a page of its own; build is called again only when the block
+        cannot be stamped
+        """
+        blocks = self._blocks.get(key)
+        if blocks is None:
+            pages = _capture(build())
+            blocks = []
+            if pages is not None:
+                name = self._name()
+                for index, page in enumerate(pages):
+                    if blocks:
+                        blocks.append(PageBreak())
+                    blocks.append(StaticBlock(f"{name}P{index}", *page))
+            self._blocks[key] = blocks
+        return list(blocks) or build()
+
+    def stamp(self, canvas, key, draw):
+        """Stamp what draw(canvas) draws, captured on its first use"""
+        operators = self._drawings.get(key)
+        if operators is None:
+            scratch = Canvas(BytesIO(), pagesize=letter)
+            draw(scratch)
+            if _has_own_resources(scratch):
+                draw(canvas)
+                return
+            operators = self._drawings[key] = (self._name(), Operators.from_canvas(scratch))
+        _use_form(canvas, *operators)
+
+
+def load_boilerplate(path):
+    """Replacement wording for the keys of report.BOILERPLATE from a JSON file"""
+    with open(path, encoding="utf-8") as fp:
+        try:
+            data = json.load(fp)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: {e}") from None
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: boilerplate is a JSON object")
+    for key, text in data.items():
+        if key not in BOILERPLATE:
+            raise ValueError(f"{path}: unknown boilerplate {key!r} (expected one of {', '.join(BOILERPLATE)})")
+        if not isinstance(text, str):
+            raise ValueError(f"{path}: {key} must be a string")
+    return data
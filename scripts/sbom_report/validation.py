@@ -0,0 +1,91 @@
+"""
+Inventory checks for the validate command
+Problems are grouped per check with a count and a few example components
+rather than listed one by one, so large inventories stay readable.
+"""
+
+from .licenses import UNKNOWN, normalize_license
+
+ERROR = "error"
+WARNING = "warning"
+EXAMPLES_PER_ISSUE = 5
+
+# check -> (level, message template)
+CHECKS = {
+    "empty": (ERROR, "the inventory has no components"),
+    "missing_version": (WARNING, "components without a version: {count}"),
+    "missing_license": (WARNING, "components without a declared license: {count}"),
+    "unrecognized_license": (WARNING, "components whose license is not a valid SPDX expression: {count}"),
+    "missing_purl": (WARNING, "components without a package URL: {count}"),
+    "duplicate": (WARNING, "components listed more than once: {count}"),
+}
+
+_NO_LICENSE = ("", "NOASSERTION", "NONE")
+
+
+class Issue:
+    __slots__ = ("check", "level", "count", "examples")
+
+    def __init__(self, check, level, count=0, examples=None):
+        self.check = check
+        self.level = level
+        self.count = count
+        self.examples = examples if examples is not None else []
+
+    @property
+    def message(self):
+        return CHECKS[self.check][1].format(count=self.count)
+
+    def as_dict(self):
+        return {"check": self.check, "level": self.level, "count": self.count,
+                "message": self.message, "examples": self.examples}
+
+
+def validate_store(store):
+    """Return the issues found in a ComponentStore, errors first"""
+    issues = {}
+
+    def report(check, example):
+        issue = issues.get(check)
+        if issue is None:
+            issue = issues[check] = Issue(check, CHECKS[check][0])
+        issue.count += 1
+        if len(issue.examples) < EXAMPLES_PER_ISSUE:
+            issue.examples.append(example)
+
+    if not store.size:
+        issues["empty"] = Issue("empty", ERROR, 1)
+
+    values = store.strings.values
+    license_problems = {}
+    seen = set()
+    for row in range(store.size):
+        name, version = store.names[row], store.versions[row]
+        label = f"{name}@{version}" if version else name
+        if not version or version == "NOASSERTION":
+            report("missing_version", name)
+        license_code = store.license_codes[row]
+        problem = license_problems.get(license_code, False)
+        if problem is False:
+            problem = license_problems[license_code] = _license_problem(values[license_code])
+        if problem:
+            report(problem, label)
+        if not store.purls[row]:
+            report("missing_purl", label)
+        key = (name, version, store.scope_codes[row])
+        if key in seen:
+            report("duplicate", label)
+        else:
+            seen.add(key)
+
+    return sorted(issues.values(), key=lambda issue: (issue.level != ERROR, issue.check))
+
+
+def _license_problem(license):
+    if license.strip().upper() in _NO_LICENSE:
+        return "missing_license"
+    info = normalize_license(license)
+    # Strings that fail to parse are kept whole as a single opaque id
+    if info.category == UNKNOWN and info.expression == license.strip() and " " in info.expression:
+        return "unrecognized_license"
+    return None
@@ -0,0 +1,222 @@
+"""
+Watch mode: regenerate the report whenever its inputs change
+The inputs are polled for size and modification time changes, and a burst
+of writes is debounced into one rebuild. Lockfiles are re-ingested
+incrementally (lockfile.IncrementalLockfile); SBOM documents are reloaded.
+The report is laid out in the parts parallel.plan_parts cuts it into, and
+an inventory part is only laid out again when its rows or first page
+number changed. The front part and sections 3.3-8, which summarize the
+whole inventory, are redone every time, reusing the dependency graph
+analysis while no name, version or edge changed and stamping the fixed
+text of sections 5-8 from templates.ReportTemplates. The parts are joined
+with pypdf into a temporary file that replaces the output, so a viewer
+never sees a half-written report.
+"""
+
+import os
+import time
+from io import BytesIO
+
+from .ingest import INPUT_FORMATS, is_lockfile
+
+DEFAULT_INTERVAL = 0.2
+DEFAULT_DEBOUNCE = 0.3
+# Inventory pages per part: small parts make a one-package change cheap to lay out again
+WATCH_PART_PAGES = 10
+
+
+def _signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return signature
+
+
+def wait_for_change(paths, previous, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE):
+    """
+    Block until the files change and then stay unchanged for debounce seconds;
+    returns their new signature
+    """
+    while True:
+        time.sleep(interval)
+        current = _signature(paths)
+        if current == previous:
+            continue
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < debounce:
+            time.sleep(interval)
+            latest = _signature(paths)
+            if latest != current:
+                current, quiet_since = latest, time.monotonic()
+        return current
+
+
+class InventorySource:
+    """Loads the watched input, keeping lockfile state between loads"""
+
+    def __init__(self, path, package_json_path=None, input_format="auto"):
+        if input_format not in INPUT_FORMATS:
+            raise ValueError(f"Unknown input format: {input_format}")
+        self.path = path
+        self.lockfile = None
+        if input_format == "lockfile" or (input_format == "auto" and is_lockfile(path)):
+            from .lockfile import IncrementalLockfile
+            self.lockfile = IncrementalLockfile(path, package_json_path)
+
+    @property
+    def watched(self):
+        """Files whose changes trigger a rebuild"""
+        if self.lockfile is not None and self.lockfile.package_json_path:
+            return [self.path, self.lockfile.package_json_path]
+        return [self.path]
+
+    def load(self):
+        """(ComponentStore, changed entry count or None when the whole input was reloaded)"""
+        if self.lockfile is not None:
+            store, changed = self.lockfile.load()
+            return store, len(changed)
+        from .sbomdoc import load_sbom
+        return load_sbom(self.path), None
+
+
+class IncrementalReport:
+    """Lays out a report in parts and keeps the inventory parts for the next render"""
+
+    def __init__(self, project, profiler=None, templates=None):
+        from .profiling import NULL_PROFILER
+        from .report import create_custom_styles
+        from .templates import ReportTemplates
+
+        self.project = project
+        self.styles = create_custom_styles()
+        self.templates = templates or ReportTemplates()
+        self.profiler = profiler or NULL_PROFILER
+        # Part key -> (PdfReader, pages)
+        self._parts = {}
+        self._graph = None
+        self._graph_key = None
+
+    def set_project(self, project):
+        """Use new project metadata; the kept parts carry the old one in their footers"""
+        if project != self.project:
+            self.project = project
+            self._parts = {}
+
+    def _layout(self, context, names, start, end, first_page):
+        from pypdf import PdfReader
+
+        from .parallel import render_part
+
+        buffer = BytesIO()
+        pages = render_part(context, names, start, end, buffer, first_page)
+        buffer.seek(0)
+        return PdfReader(buffer), pages
+
+    def _analyze_graph(self, store):
+        """Graph analysis of store, reused while the graph and its labels are unchanged"""
+        from .graph import analyze_graph
+
+        key = hash((store.edge_sources.tobytes(), store.edge_targets.tobytes(),
+                    tuple(store.names), tuple(store.versions)))
+        if key != self._graph_key:
+            with self.profiler.phase("graph"):
+                self._graph = analyze_graph(store)
+            self._graph_key = key
+        return self._graph
+
+    def render(self, filename, store):
+        """Write the report to filename; returns (parts laid out, parts in total)"""
+        from pypdf import PdfWriter
+
+        from .parallel import FRONT_SECTIONS, plan_parts
+        from .report import INVENTORY_SECTIONS, StoryContext
+
+        profiler = self.profiler
+        context = StoryContext(store, self.project, self.styles, profiler, graph=self._analyze_graph(store),
+                               templates=self.templates)
+        with profiler.phase("story"):
+            parts = plan_parts(context, 1, part_pages=WATCH_PART_PAGES)
+        with profiler.phase("layout"):
+            front, front_pages = self._layout(context, FRONT_SECTIONS, 0, None, 1)
+            documents = [front]
+            kept = {}
+            laid_out = 1
+            first_page = front_pages + 1
+            for names, start, end, _ in parts:
+                if names[0] in INVENTORY_SECTIONS:
+                    rows = context.component_table(INVENTORY_SECTIONS[names[0]]).rows[start:end]
+                    key = (names, start, end, first_page, hash(tuple(map(tuple, rows))))
+                    part = self._parts.get(key)
+                    if part is None:
+                        part = self._layout(context, names, start, end, first_page)
+                        laid_out += 1
+                    kept[key] = part
+                else:
+                    part = self._layout(context, names, start, end, first_page)
+                    laid_out += 1
+                documents.append(part[0])
+                first_page += part[1]
+            self._parts = kept
+        profiler.count("pages", first_page - 1)
+
+        with profiler.phase("write"):
+            writer = PdfWriter()
+            for document in documents:
+                writer.append(document)
+            # Next to the output, so the rename stays on one file system
+            temporary = f"{filename}.{os.getpid()}.tmp"
+            try:
+                with open(temporary, "wb") as fp:
+                    writer.write(fp)
+                os.replace(temporary, filename)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        return laid_out, len(parts) + 1
+
+
+def watch(source, filename, project, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE, log=print,
+          iterations=None, templates=None):
+    """
+    Render the report, then render it again after every change of the inputs
+    until interrupted (or after iterations renders). A load that fails, for
+    example on a half-saved lockfile, is logged and the next change retried.
+    project is the metadata dict, or a callable returning it for each loaded
+    store, so a renamed product is picked up.
+    """
+    project_of = project if callable(project) else lambda store: project
+    report = IncrementalReport(None, templates=templates)
+    signature = _signature(source.watched)
+    log(f"Watching {', '.join(source.watched)} (Ctrl+C to stop)")
+    rendered = 0
+    last_store = None
+    while True:
+        started = time.perf_counter()
+        try:
+            store, changed = source.load()
+            # A save that changed no entry (nor package.json) keeps the same store
+            if store is last_store and changed == 0:
+                log("  no lockfile entry changed, report kept")
+            else:
+                report.set_project(project_of(store))
+                laid_out, total = report.render(filename, store)
+                if last_store is None:
+                    entries = "first render"
+                elif changed is None:
+                    entries = "input reloaded"
+                else:
+                    entries = f"{changed} lockfile entries changed"
+                log(f"✓ {filename} updated in {time.perf_counter() - started:.2f}s "
+                    f"({entries}, {laid_out} of {total} parts laid out)")
+                last_store = store
+        except (OSError, ValueError, KeyError) as e:
+            log(f"✗ Could not rebuild the report: {e}")
+        rendered += 1
+        if iterations is not None and rendered >= iterations:
+            return
+        signature = wait_for_change(source.watched, signature, interval, debounce)
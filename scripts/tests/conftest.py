@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The generator is run as scripts/generate-sbom-report.py, with sbom_report importable from scripts/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
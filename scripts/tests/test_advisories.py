@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from sbom_report.advisories import AdvisoryIndex, build_index, version_key
+
+
+@pytest.mark.parametrize("lower, higher", [
+    ("1.0.0", "1.0.0.1"),
+    ("1.0.0", "1.0.0.post1"),
+    ("1.0.0.post1", "1.0.1"),
+    ("1.0.0.1", "1.0.1"),
+    ("1.0.0-rc.1", "1.0.0"),
+    ("1.0rc1", "1.0"),
+    ("1.0.dev1", "1.0a1"),
+    ("1.0a1", "1.0b1"),
+    ("1.0b1", "1.0rc1"),
+    ("1.2.3", "1.10.0"),
+    ("0.9", "1"),
+    ("1.0.0-alpha", "1.0.0-alpha.1"),
+    ("1.0.0-alpha.1", "1.0.0-beta"),
+    ("1.0.0-beta.2", "1.0.0-beta.11"),
+])
+def test_version_key_orders(lower, higher):
+    assert version_key(lower) < version_key(higher)
+
+
+@pytest.mark.parametrize("left, right", [
+    ("1.0", "1.0.0"),
+    ("v1", "1.0.0"),
+    ("1.0.0+build.5", "1.0.0"),
+    ("2.0.0.RELEASE", "2.0.0"),
+])
+def test_version_key_equal(left, right):
+    assert version_key(left) == version_key(right)
+
+
+def test_match_respects_fixed_version(tmp_path):
+    dump = tmp_path / "osv.ndjson"
+    advisory = {
+        "id": "GHSA-test", "summary": "test",
+        "affected": [{"package": {"ecosystem": "PyPI", "name": "demo"},
+                      "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "0"}, {"fixed": "1.0.0"}]}]}],
+    }
+    dump.write_text(json.dumps(advisory) + "\n", encoding="utf-8")
+    index = tmp_path / "advisories.db"
+    build_index(str(dump), str(index))
+    dependencies = {"production": [
+        {"name": name, "version": version, "ecosystem": "pypi"}
+        for name, version in (("demo", "0.9.1"), ("demo", "1.0.0.1"), ("demo", "1.0.0.post1"), ("demo", "1.0.0"))
+    ]}
+    with AdvisoryIndex(str(index)) as advisories:
+        findings = advisories.match(dependencies)
+    assert [finding.version for finding in findings] == ["0.9.1"]
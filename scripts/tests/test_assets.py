@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+from sbom_report.assets import asset_key, canonical_key, fuzzy_groups, normalize_assets, normalize_column
+
+
+@pytest.mark.parametrize("value, key", [
+    ("ACME CLOUD", "acme cloud"),
+    ("HealthData-Inc", "healthdata"),
+    ("Foo Bar GmbH", "foo bar"),
+    ("Inc", "inc"),
+    ("Müller & Söhne, Ltd.", "müller söhne"),
+])
+def test_canonical_key(value, key):
+    assert canonical_key(value) == key
+
+
+def test_asset_key():
+    assert asset_key("App_1") == asset_key("app-1") == asset_key(" APP  1 ") == "app-1"
+
+
+def test_fuzzy_groups_keep_numbered_names_apart():
+    keys = ["acme cloud services", "acme cloud service", "server 01", "server 02", "payments"]
+    roots = fuzzy_groups(keys)
+    assert roots[0] == roots[1]
+    assert len({roots[2], roots[3], roots[4], roots[0]}) == 4
+
+
+def test_normalize_column_picks_most_used_spelling():
+    counts = {"Acme Cloud": 1, "ACME CLOUD": 3, "Acme Cloud Inc": 1, "Other": 2, "": 1}
+    mapping = normalize_column(counts)
+    assert mapping == {
+        "Acme Cloud": ("ACME CLOUD", 1),
+        "ACME CLOUD": ("ACME CLOUD", 3),
+        "Acme Cloud Inc": ("ACME CLOUD", 1),
+        "Other": ("Other", 2),
+        "": ("", 1),
+    }
+
+
+def test_normalize_assets():
+    assets = [
+        {"asset_id": "App-1", "asset_name": "Billing", "vendor_name": "HealthData Inc"},
+        {"asset_id": "app_1", "asset_name": "Billing v2", "vendor_name": "Other"},
+        {"asset_id": "web-2", "asset_name": "Portal", "vendor_name": "HealthData-Inc"},
+        {"asset_id": "web-3", "asset_name": "Portal", "vendor_name": "HEALTHDATA INC"},
+        {"asset_id": "db-4", "asset_name": "Ledger", "vendor_name": "HealthData-Inc"},
+    ]
+
+    rows, merge_map = normalize_assets(assets)
+
+    assert [row["asset_id"] for row in rows] == ["App-1", "web-2", "web-3", "db-4"]
+    assert {row["vendor_name"] for row in rows} == {"HealthData-Inc"}
+    assert list(merge_map.merges()) == [
+        ("asset_id", "app_1", "App-1", 1),
+        ("vendor_name", "HealthData Inc", "HealthData-Inc", 1),
+        ("vendor_name", "HEALTHDATA INC", "HealthData-Inc", 1),
+    ]
+    assert len(merge_map) == 3
+    fp = io.StringIO()
+    merge_map.write_csv(fp)
+    assert fp.getvalue().splitlines()[:2] == ["column,original,canonical,rows", "asset_id,app_1,App-1,1"]
@@ -0,0 +1,53 @@
+import json
+
+from sbom_report.assets import normalize_assets
+from sbom_report.batch import ReportPaths, index_sbom_files, log_merged_asset_ids
+
+
+def write_json(path, document):
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def test_index_sbom_files_skips_non_sbom_json(tmp_path):
+    write_json(tmp_path / "web-1.json", {"bomFormat": "CycloneDX", "specVersion": "1.5", "components": []})
+    write_json(tmp_path / "api-2.spdx.json", {"spdxVersion": "SPDX-2.3", "packages": []})
+    write_json(tmp_path / "sbom-db-3-v1.json", {"spdxVersion": "SPDX-2.3", "packages": []})
+    write_json(tmp_path / "sbom-db-3-v2.json", {"spdxVersion": "SPDX-2.3", "packages": []})
+    write_json(tmp_path / "batch-summary.json", {"total": 3, "reports": []})
+    write_json(tmp_path / "package.json", {"name": "app", "dependencies": {}})
+    write_json(tmp_path / "package-lock.json", {"lockfileVersion": 3, "packages": {}})
+    write_json(tmp_path / "settings.json", {"theme": "dark"})
+    (tmp_path / "notes.txt").write_text("not json", encoding="utf-8")
+
+    files = index_sbom_files(str(tmp_path))
+
+    assert sorted(files) == ["api-2", "db-3", "web-1"]
+    assert files["db-3"].endswith("sbom-db-3-v2.json")
+
+
+def test_report_paths_suffix_colliding_asset_ids(tmp_path):
+    report_path = ReportPaths(str(tmp_path))
+    first = report_path("app/1")
+    second = report_path("app 1")
+    third = report_path("APP_1")
+    other = report_path("web-2")
+
+    assert first == str(tmp_path / "SBOM_Report_app_1.pdf")
+    assert len({first, second, third}) == 3
+    assert {second.lower(), third.lower()}.isdisjoint({first.lower()})
+    assert second.startswith(str(tmp_path / "SBOM_Report_app_1_"))
+    assert other == str(tmp_path / "SBOM_Report_web-2.pdf")
+
+
+def test_log_merged_asset_ids():
+    assets = [{"asset_id": asset_id} for asset_id in ("App-1", "app_1", "App-1", "web-2")]
+    rows, merge_map = normalize_assets(assets)
+    lines = []
+
+    merged = log_merged_asset_ids(merge_map, lines.append)
+
+    assert [row["asset_id"] for row in rows] == ["App-1", "web-2"]
+    assert merged == [{"asset_id": "App-1", "kept": "App-1", "rows": 1},
+                      {"asset_id": "app_1", "kept": "App-1", "rows": 1}]
+    assert lines == ["  Asset id 'App-1' repeated: 1 row dropped",
+                     "  Asset id 'app_1' merged into 'App-1': 1 row dropped"]
@@ -0,0 +1,78 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from sbom_report.cli import EXIT_OK, load_project, main
+from sbom_report.history import HistoryStore
+from sbom_report.model import ComponentStore
+
+DEFAULT_PROJECT = {
+    "name": "Built-in", "version": "1.0.0", "vendor": "Vendor", "description": "Test project", "license": "MIT",
+    "report_date": "2026-01-01 00:00:00", "report_version": "1.0", "stack_summary": "Python",
+    "technology_stack": "Python", "build_tool": "pip", "package_manager": "pip",
+}
+
+
+def project_args(project=None, name=None, project_version=None):
+    return SimpleNamespace(project=project, name=name, project_version=project_version)
+
+
+def test_load_project_prefers_the_inventory_product(tmp_path):
+    store = ComponentStore()
+    store.project = {"name": "shop", "version": "2.0"}
+
+    assert load_project(project_args(), DEFAULT_PROJECT) == DEFAULT_PROJECT
+    assert load_project(project_args(), DEFAULT_PROJECT, store) == dict(DEFAULT_PROJECT, name="shop", version="2.0")
+    assert load_project(project_args(name="given"), DEFAULT_PROJECT, store)["name"] == "given"
+
+    path = tmp_path / "project.json"
+    path.write_text(json.dumps({"version": "9.9"}), encoding="utf-8")
+    project = load_project(project_args(project=str(path)), DEFAULT_PROJECT, store)
+    assert (project["name"], project["version"]) == ("shop", "9.9")
+
+
+def test_load_project_keeps_defaults_for_missing_fields():
+    store = ComponentStore()
+    store.project = {"name": "shop", "version": ""}
+    assert load_project(project_args(), DEFAULT_PROJECT, store)["version"] == "1.0.0"
+
+
+def write_cyclonedx(path, product, components):
+    path.write_text(json.dumps({
+        "bomFormat": "CycloneDX", "specVersion": "1.5",
+        "metadata": {"component": {"name": product, "version": "1.0.0", "bom-ref": product}},
+        "components": [{"bom-ref": name, "name": name, "version": "1.0.0", "licenses": [{"license": {"id": "MIT"}}]}
+                       for name in components],
+        "dependencies": [{"ref": product, "dependsOn": list(components)}],
+    }), encoding="utf-8")
+
+
+def test_render_history_keys_snapshots_by_product(tmp_path):
+    pytest.importorskip("reportlab")
+    history = str(tmp_path / "history.db")
+    for product, components in (("shop", ["a", "b"]), ("billing", ["c"])):
+        sbom = tmp_path / f"{product}.cdx.json"
+        write_cyclonedx(sbom, product, components)
+        argv = ["render", str(sbom), "-o", str(tmp_path / f"{product}.pdf"), "--history", history]
+        assert main(argv, DEFAULT_PROJECT, {}) == EXIT_OK
+
+    with HistoryStore(history) as store:
+        projects = {row[0]: row for row in store.projects()}
+    assert sorted(projects) == ["billing", "shop"]
+
+
+def test_diff_report_honors_name_and_escapes_markup(tmp_path):
+    pytest.importorskip("reportlab")
+    pypdf = pytest.importorskip("pypdf")
+    old, new = tmp_path / "old.cdx.json", tmp_path / "new & <v2>.cdx.json"
+    write_cyclonedx(old, "shop", ["a"])
+    write_cyclonedx(new, "shop", ["a", "b"])
+    output = tmp_path / "diff.pdf"
+
+    for name, expected in ((None, "shop"), ("x & <y>", "x & <y>")):
+        argv = ["diff", str(old), str(new), "-o", str(output)] + (["--name", name] if name else [])
+        assert main(argv, DEFAULT_PROJECT, {}) == EXIT_OK
+        text = pypdf.PdfReader(str(output)).pages[0].extract_text()
+        assert f"\n{expected}\n" in text
+        assert "Compared: new & <v2>.cdx.json" in text
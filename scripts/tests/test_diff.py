@@ -0,0 +1,59 @@
+from sbom_report.diff import CHANGE_KINDS, Change, collect_changes
+from sbom_report.model import ComponentStore
+
+
+def store_of(*components):
+    store = ComponentStore()
+    for name, version, license, purl in components:
+        store.add(name, version, license, "Direct", "Production", "npm" if not purl else "", purl)
+    return store
+
+
+def test_collect_changes():
+    old = store_of(
+        ("left-pad", "1.0.0", "MIT", ""),
+        ("lodash", "4.17.20", "MIT", ""),
+        ("React", "17.0.2", "MIT", ""),
+        ("old-only", "1.0.0", "ISC", ""),
+        ("multi", "1.0.0", "MIT", ""),
+        ("multi", "2.0.0", "MIT", ""),
+        ("Django", "4.2", "BSD-3-Clause", "pkg:pypi/django@4.2"),
+        ("stays", "1.0.0", "MIT", ""),
+    )
+    new = store_of(
+        ("left-pad", "1.0.0", "WTFPL", ""),
+        ("lodash", "4.17.9", "MIT", ""),
+        ("react", "18.2.0", "Apache-2.0", ""),
+        ("new-only", "0.1.0", "MIT", ""),
+        ("multi", "2.0.0", "MIT", ""),
+        ("multi", "3.0.0", "MIT", ""),
+        ("multi", "4.0.0-rc.1", "MIT", ""),
+        ("django", "4.2.1", "BSD-3-Clause", "pkg:pypi/Django@4.2.1"),
+        ("stays", "1.0.0", "MIT", ""),
+    )
+
+    changes = collect_changes(old, new)
+
+    assert list(changes) == list(CHANGE_KINDS)
+    assert changes["added"] == [
+        Change("added", "new-only", "npm", "", "0.1.0", "", "MIT"),
+        Change("added", "multi", "npm", "", "3.0.0", "", "MIT"),
+    ]
+    assert changes["removed"] == [Change("removed", "old-only", "npm", "1.0.0", "", "ISC", "")]
+    assert changes["upgraded"] == [
+        Change("upgraded", "react", "npm", "17.0.2", "18.2.0", "MIT", "Apache-2.0"),
+        Change("upgraded", "multi", "npm", "1.0.0", "4.0.0-rc.1", "MIT", "MIT"),
+        Change("upgraded", "django", "pypi", "4.2", "4.2.1", "BSD-3-Clause", "BSD-3-Clause"),
+    ]
+    # 4.17.9 is older than 4.17.20 numerically, not by string order
+    assert changes["downgraded"] == [Change("downgraded", "lodash", "npm", "4.17.20", "4.17.9", "MIT", "MIT")]
+    assert changes["license_changed"] == [
+        Change("license_changed", "left-pad", "npm", "1.0.0", "1.0.0", "MIT", "WTFPL"),
+        Change("license_changed", "react", "npm", "17.0.2", "18.2.0", "MIT", "Apache-2.0"),
+    ]
+
+
+def test_identical_stores_have_no_changes():
+    components = [("a", "1.0.0", "MIT", ""), ("b", "2.0.0", "ISC", "pkg:npm/b@2.0.0")]
+    changes = collect_changes(store_of(*components), store_of(*components))
+    assert all(not items for items in changes.values())
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+
+import pytest
+
+from sbom_report.exporters import EXPORTERS
+from sbom_report.model import ComponentStore
+from sbom_report.sbomdoc import TYPE_APPLICATION, read_sbom
+from sbom_report.stats import compute_stats
+
+PROJECT = {"name": "shop", "version": "3.1.0", "vendor": "Vendor", "license": "MIT"}
+
+
+def lockfile_store():
+    """A store without an application row, as the lockfile loader builds it"""
+    store = ComponentStore()
+    a = store.add("a", "1.0.0", "MIT", "Direct", "Production", "npm", "pkg:npm/a@1.0.0")
+    b = store.add("@scope/b", "2.0.0", "Apache-2.0 OR MIT", "Transitive", "Production", "npm",
+                  "pkg:npm/%40scope/b@2.0.0")
+    c = store.add("c", "0.1.0", "ISC", "Direct", "Development", "npm", "pkg:npm/c@0.1.0")
+    store.add_edge(a, b)
+    store.add_edge(c, b)
+    return store
+
+
+def sbom_store():
+    """A store whose SBOM describes its product with an application row"""
+    return read_sbom(io.StringIO(json.dumps({
+        "bomFormat": "CycloneDX", "specVersion": "1.5",
+        "metadata": {"component": {"name": "shop", "version": "3.1.0", "bom-ref": "shop"}},
+        "components": [
+            {"bom-ref": "a", "name": "a", "version": "1.0.0", "purl": "pkg:npm/a@1.0.0",
+             "licenses": [{"license": {"id": "MIT"}}]},
+            {"bom-ref": "b", "name": "b", "version": "2.0.0", "purl": "pkg:npm/b@2.0.0",
+             "licenses": [{"license": {"id": "BSD-3-Clause"}}], "scope": "excluded"},
+        ],
+        "dependencies": [{"ref": "shop", "dependsOn": ["a", "b"]}, {"ref": "a", "dependsOn": ["b"]}],
+    })))
+
+
+def export(store, export_format):
+    fp = io.StringIO()
+    EXPORTERS[export_format][0](fp, store, PROJECT)
+    return fp.getvalue()
+
+
+def components(store):
+    """(name, version, license, scope, purl) of every component but the product itself"""
+    return sorted((c.name, c.version, c.license, c.scope, c.purl) for c in store.iter_components()
+                  if c.type != TYPE_APPLICATION)
+
+
+def dependency_edges(store):
+    application = store.strings.lookup(TYPE_APPLICATION)
+    return sorted((store.names[s], store.names[t]) for s, t in zip(store.edge_sources, store.edge_targets)
+                  if store.type_codes[s] != application)
+
+
+@pytest.mark.parametrize("make_store", [lockfile_store, sbom_store])
+@pytest.mark.parametrize("export_format", ["cyclonedx", "spdx"])
+def test_round_trip_keeps_component_count(make_store, export_format):
+    store = make_store()
+    loaded = read_sbom(io.StringIO(export(store, export_format)))
+
+    assert compute_stats(loaded).total == compute_stats(store).total
+    assert components(loaded) == components(store)
+    assert dependency_edges(loaded) == dependency_edges(store)
+    assert loaded.project["name"] == "shop"
+
+
+def test_chained_round_trip_is_stable():
+    store = lockfile_store()
+    for export_format in ("spdx", "cyclonedx", "spdx", "cyclonedx"):
+        store = read_sbom(io.StringIO(export(store, export_format)))
+        assert compute_stats(store).total == 3
+    assert components(store) == components(lockfile_store())
+
+
+def test_flat_formats_write_every_row():
+    store = lockfile_store()
+    rows = list(csv.DictReader(io.StringIO(export(store, "csv"))))
+    lines = export(store, "ndjson").splitlines()
+    assert len(rows) == len(lines) == len(json.loads(export(store, "json"))["components"]) == 3
+    assert rows[1]["name"] == json.loads(lines[1])["name"] == "@scope/b"
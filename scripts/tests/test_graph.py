@@ -0,0 +1,55 @@
+from sbom_report.graph import UNREACHED, analyze_graph
+from sbom_report.model import ComponentStore
+
+
+def graph_store(types, edges):
+    """Rows named after their index; edges as (source, target) index pairs"""
+    store = ComponentStore()
+    for row, type in enumerate(types):
+        store.add(f"p{row}", "1.0.0", "MIT", type, "Production")
+    for source, target in edges:
+        store.add_edge(source, target)
+    return store
+
+
+def test_cycles_depth_and_reach():
+    # app -> 1, 2; 1 -> 3 -> 4 -> 3 (cycle); 2 -> 4; 4 -> 5; 5 -> 5 (self edge); 6 unreached
+    store = graph_store(
+        ["Application", "Direct", "Direct", "Transitive", "Transitive", "Transitive", "Transitive"],
+        [(0, 1), (0, 2), (1, 3), (3, 4), (4, 3), (2, 4), (4, 5), (5, 5), (1, 3)],
+    )
+
+    analysis = analyze_graph(store)
+
+    assert analysis.roots == [1, 2]
+    assert analysis.graph.edge_count == 8
+    assert analysis.cycles == 2
+    assert analysis.rows_in_cycles == 3
+    assert list(analysis.depth) == [UNREACHED, 1, 1, 2, 2, 3, UNREACHED]
+    assert analysis.max_depth == 3
+    assert analysis.reachable_count == 5
+    assert list(analysis.reachable(1)) == [1, 3, 4, 5]
+    assert list(analysis.reachable(2)) == [2, 3, 4, 5]
+    assert [(s.name, s.size, s.exclusive) for s in analysis.heaviest()] == [("p1", 4, 1), ("p2", 4, 1)]
+
+
+def test_fan_in_counts_distinct_edges():
+    store = graph_store(
+        ["Direct", "Direct", "Direct", "Transitive", "Transitive"],
+        [(0, 3), (1, 3), (2, 3), (0, 4), (1, 4), (0, 3)],
+    )
+
+    analysis = analyze_graph(store)
+
+    assert analysis.top_fan_in() == [("p3", "1.0.0", 3), ("p4", "1.0.0", 2)]
+    assert analysis.top_fan_in(1) == [("p3", "1.0.0", 3)]
+    assert analysis.cycles == 0
+
+
+def test_roots_without_types_are_rows_nothing_depends_on():
+    store = graph_store(["Library"] * 4, [(0, 1), (1, 2), (3, 2)])
+
+    analysis = analyze_graph(store)
+
+    assert analysis.roots == [0, 3]
+    assert [(s.name, s.size, s.exclusive) for s in analysis.heaviest()] == [("p0", 3, 2), ("p3", 2, 1)]
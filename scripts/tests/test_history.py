@@ -0,0 +1,51 @@
+from sbom_report.history import HistoryStore, period_bounds
+from sbom_report.model import ComponentStore
+
+
+def make_store(count, license="MIT"):
+    store = ComponentStore()
+    for index in range(count):
+        store.add(f"pkg-{index}", "1.0.0", license, "library", "production", "npm")
+    return store
+
+
+def test_projects_reports_latest_snapshot_components(tmp_path):
+    with HistoryStore(str(tmp_path / "history.db")) as history:
+        # Recorded out of order: the latest snapshot is neither the first nor the last row
+        history.record("app", make_store(3), taken_at="2026-01-02T00:00:00Z")
+        history.record("app", make_store(5), taken_at="2026-01-03T00:00:00Z")
+        history.record("app", make_store(1), taken_at="2026-01-01T00:00:00Z")
+        history.record("lib", make_store(2), taken_at="2026-01-01T12:00:00Z")
+        projects = {project.name: project for project in history.projects()}
+
+    assert projects["app"].snapshots == 3
+    assert projects["app"].first == "2026-01-01T00:00:00Z"
+    assert projects["app"].last == "2026-01-03T00:00:00Z"
+    assert projects["app"].components == 5
+    assert projects["lib"].components == 2
+
+
+def test_record_returns_churn_against_previous_snapshot(tmp_path):
+    with HistoryStore(str(tmp_path / "history.db")) as history:
+        first = history.record("app", make_store(2), taken_at="2026-01-01T00:00:00Z")
+        second = history.record("app", make_store(4), taken_at="2026-01-02T00:00:00Z")
+    assert not any(first.values())
+    assert second["added"] == 2
+
+
+def test_trend_sums_last_snapshot_per_day(tmp_path):
+    with HistoryStore(str(tmp_path / "history.db")) as history:
+        history.record("app", make_store(2), taken_at="2026-01-01T08:00:00Z")
+        history.record("app", make_store(3), taken_at="2026-01-01T18:00:00Z")
+        history.record("lib", make_store(4, "Apache-2.0"), taken_at="2026-01-01T09:00:00Z")
+        rows = history.trend(period="day")
+        mix = history.license_mix()
+
+    assert [(row.period, row.projects, row.components) for row in rows] == [("2026-01-01", 2, 7)]
+    assert dict(mix) == {"Apache-2.0": 4, "MIT": 3}
+
+
+def test_period_bounds():
+    assert period_bounds("day", "2026-03-04") == ("2026-03-04T00:00:00Z", "2026-03-04T23:59:59Z")
+    assert period_bounds("month", "2026-02-10") == ("2026-02-01T00:00:00Z", "2026-02-28T23:59:59Z")
+    assert period_bounds("week", "2026-01-01") == ("2026-01-01T00:00:00Z", "2026-01-04T23:59:59Z")
@@ -0,0 +1,91 @@
+import io
+import json
+
+import pytest
+
+from sbom_report.jsonstream import JsonStream
+from sbom_report.sbomdoc import read_sbom
+
+DOCUMENT = {
+    "name": "café \"quoted\" \\ 😀",
+    "numbers": [0, -1, 2.5, 1e3, True, False, None],
+    "nested": {"empty": {}, "list": [], "deep": [[{"a": "]}"}]]},
+    "packages": {"node_modules/a": {"version": "1.0.0"}, "node_modules/b": {"version": "2.0.0"}},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 65536])
+def test_iter_items_match_json_load(chunk_size):
+    stream = JsonStream(io.StringIO(json.dumps(DOCUMENT, indent=1)), chunk_size=chunk_size)
+    assert dict(stream.iter_items()) == DOCUMENT
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_unread_values_are_skipped(chunk_size):
+    stream = JsonStream(io.StringIO(json.dumps(DOCUMENT)), chunk_size=chunk_size)
+    seen = {}
+    for key in stream.iter_object():
+        if key == "packages":
+            seen = dict(stream.iter_items())
+    assert seen == DOCUMENT["packages"]
+
+
+def test_iter_elements():
+    stream = JsonStream(io.StringIO('[1, "two", {"three": [3]}, []]'), chunk_size=2)
+    assert list(stream.iter_elements()) == [1, "two", {"three": [3]}, []]
+
+
+def test_malformed_object():
+    stream = JsonStream(io.StringIO('{"a": 1 "b": 2}'))
+    with pytest.raises(ValueError):
+        list(stream.iter_items())
+
+
+def test_read_spdx():
+    document = {
+        "spdxVersion": "SPDX-2.3", "SPDXID": "SPDXRef-DOCUMENT", "name": "app",
+        "packages": [
+            {"SPDXID": "SPDXRef-app", "name": "app", "versionInfo": "1.0.0", "licenseConcluded": "MIT"},
+            {"SPDXID": "SPDXRef-a", "name": "a", "versionInfo": "2.0.0", "licenseDeclared": "ISC",
+             "externalRefs": [{"referenceType": "purl", "referenceLocator": "pkg:npm/a@2.0.0"}]},
+            {"SPDXID": "SPDXRef-b", "name": "b", "versionInfo": "3.0.0", "licenseConcluded": "NOASSERTION"},
+        ],
+        "relationships": [
+            {"spdxElementId": "SPDXRef-DOCUMENT", "relationshipType": "DESCRIBES", "relatedSpdxElement": "SPDXRef-app"},
+            {"spdxElementId": "SPDXRef-app", "relationshipType": "DEPENDS_ON", "relatedSpdxElement": "SPDXRef-a"},
+            {"spdxElementId": "SPDXRef-b", "relationshipType": "DEV_DEPENDENCY_OF", "relatedSpdxElement": "SPDXRef-a"},
+        ],
+    }
+    store = read_sbom(io.StringIO(json.dumps(document)))
+
+    assert [(c.name, c.license, c.type, c.scope, c.ecosystem) for c in store.iter_components()] == [
+        ("app", "MIT", "Application", "Production", ""),
+        ("a", "ISC", "Direct", "Production", "npm"),
+        ("b", "NOASSERTION", "Transitive", "Development", ""),
+    ]
+    assert store.project == {"name": "app", "version": "1.0.0"}
+
+
+def test_read_cyclonedx():
+    document = {
+        "bomFormat": "CycloneDX", "specVersion": "1.5",
+        "metadata": {"component": {"name": "app", "version": "1.0.0", "bom-ref": "app"}},
+        "components": [
+            {"bom-ref": "a", "name": "core", "group": "@scope", "version": "1.0.0",
+             "purl": "pkg:npm/%40scope/core@1.0.0", "licenses": [{"license": {"id": "MIT"}}, {"expression": "A OR B"}]},
+            {"bom-ref": "b", "name": "b", "version": "2.0.0", "scope": "excluded"},
+        ],
+        "dependencies": [{"ref": "app", "dependsOn": ["a"]}, {"ref": "a", "dependsOn": ["b"]}],
+    }
+    store = read_sbom(io.StringIO(json.dumps(document)))
+
+    assert [(c.name, c.license, c.type, c.scope) for c in store.iter_components()] == [
+        ("@scope/core", "MIT AND (A OR B)", "Direct", "Production"),
+        ("b", "NOASSERTION", "Transitive", "Development"),
+    ]
+    assert store.project == {"name": "app", "version": "1.0.0"}
+
+
+def test_read_unknown_document():
+    with pytest.raises(ValueError, match="not an SPDX or CycloneDX"):
+        read_sbom(io.StringIO('{"hello": "world"}'), "x.json")
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from sbom_report.lockfile import IncrementalLockfile, load_lockfile_dependencies
+
+
+def lockfile(packages, version=3):
+    return {"name": "app", "version": "1.0.0", "lockfileVersion": version, "requires": True,
+            "packages": dict({"": {"name": "app", "version": "1.0.0", "license": "MIT",
+                                   "dependencies": {"a": "^1.0.0"}, "devDependencies": {"d": "^1.0.0"}}},
+                             **packages)}
+
+
+PACKAGES = {
+    "node_modules/a": {"version": "1.0.0", "license": "MIT", "dependencies": {"b": "^2.0.0"}},
+    "node_modules/b": {"version": "2.0.0", "license": {"type": "ISC"}},
+    "node_modules/a/node_modules/b": {"version": "1.0.0", "licenses": [{"type": "MIT"}, {"type": "Apache-2.0"}]},
+    "node_modules/d": {"version": "1.0.0", "license": "BSD-3-Clause", "dev": True,
+                       "peerDependencies": {"missing": "*"}},
+    "packages/local": {"version": "0.1.0"},
+    "node_modules/local": {"resolved": "packages/local", "link": True},
+}
+
+
+def write(path, document):
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+def components(store):
+    return sorted((c.name, c.version, c.license, c.type, c.scope) for c in store.iter_components())
+
+
+def edges(store):
+    return sorted((store.names[s], store.versions[s], store.names[t], store.versions[t])
+                  for s, t in zip(store.edge_sources, store.edge_targets))
+
+
+def test_load_lockfile_dependencies(tmp_path):
+    path = tmp_path / "package-lock.json"
+    write(path, lockfile(PACKAGES))
+
+    store = load_lockfile_dependencies(str(path))
+
+    assert components(store) == [
+        ("a", "1.0.0", "MIT", "Direct", "Production"),
+        ("b", "1.0.0", "MIT OR Apache-2.0", "Transitive", "Production"),
+        ("b", "2.0.0", "ISC", "Transitive", "Production"),
+        ("d", "1.0.0", "BSD-3-Clause", "Direct", "Development"),
+    ]
+    # a resolves b from its own node_modules, not the hoisted copy
+    assert edges(store) == [("a", "1.0.0", "b", "1.0.0")]
+
+
+@pytest.mark.parametrize("document, message", [
+    (lockfile({}, version=1), "lockfileVersion 1"),
+    ({"lockfileVersion": 3}, "no 'packages' map"),
+])
+def test_unsupported_lockfiles(tmp_path, document, message):
+    path = tmp_path / "package-lock.json"
+    write(path, document)
+    with pytest.raises(ValueError, match=message):
+        load_lockfile_dependencies(str(path))
+    with pytest.raises(ValueError, match=message):
+        IncrementalLockfile(str(path)).load()
+
+
+def test_incremental_lockfile_matches_full_load(tmp_path):
+    path = tmp_path / "package-lock.json"
+    write(path, lockfile(PACKAGES))
+    loader = IncrementalLockfile(str(path))
+
+    store, changed = loader.load()
+    assert changed == {path for path in PACKAGES if path.startswith("node_modules/") and path != "node_modules/local"}
+    assert components(store) == components(load_lockfile_dependencies(str(path)))
+
+    store, changed = loader.load()
+    assert changed == set()
+
+    updated = dict(PACKAGES)
+    updated["node_modules/b"] = dict(PACKAGES["node_modules/b"], version="2.1.0")
+    del updated["node_modules/a/node_modules/b"]
+    write(path, lockfile(updated))
+    store, changed = loader.load()
+
+    assert changed == {"node_modules/b", "node_modules/a/node_modules/b"}
+    assert components(store) == components(load_lockfile_dependencies(str(path)))
+    assert edges(store) == [("a", "1.0.0", "b", "2.1.0")]
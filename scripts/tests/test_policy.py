@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+from sbom_report.cli import EXIT_OK, EXIT_POLICY_DENY, main
+from sbom_report.model import ComponentStore
+from sbom_report.policy import ALLOW, DENY, REVIEW, LicensePolicy, PolicyError
+
+POLICY = {
+    "default": "review",
+    "allow": ["category:Permissive", "category:public-domain", "LGPL-*",
+              "GPL-2.0-only WITH Classpath-exception-2.0"],
+    "review": ["category:weak copyleft"],
+    "deny": ["GPL-*", "AGPL-*"],
+}
+
+
+def verdict(policy, expression):
+    return policy.evaluate_expression(expression)[0]
+
+
+@pytest.mark.parametrize("expression, expected, ids", [
+    ("MIT OR GPL-3.0-only", ALLOW, ("MIT",)),
+    ("MIT AND GPL-3.0-only", DENY, ("GPL-3.0-only",)),
+    ("MPL-2.0 OR GPL-3.0-only", REVIEW, ("MPL-2.0",)),
+    ("(MIT AND MPL-2.0) OR AGPL-3.0-only", REVIEW, ("MPL-2.0",)),
+    ("MIT AND Apache-2.0", ALLOW, ("Apache-2.0", "MIT")),
+])
+def test_or_takes_most_permissive_and_and_strictest(expression, expected, ids):
+    policy = LicensePolicy.from_dict(POLICY)
+    result_verdict, result_ids = policy.evaluate_expression(expression)
+    assert (result_verdict, tuple(sorted(result_ids))) == (expected, ids)
+
+
+def test_with_falls_back_to_the_base_id():
+    policy = LicensePolicy.from_dict(POLICY)
+    assert policy.evaluate_expression("GPL-2.0-only WITH Classpath-exception-2.0") == \
+        (ALLOW, ("GPL-2.0-only WITH Classpath-exception-2.0",))
+    assert policy.evaluate_expression("MPL-2.0 WITH Autoconf-exception-2.0") == (REVIEW, ("MPL-2.0",))
+    assert policy.evaluate_expression("Apache-2.0 WITH LLVM-exception") == (ALLOW, ("Apache-2.0",))
+    # A glob can name the combined id as well
+    assert verdict(policy, "GPL-3.0-only WITH GCC-exception-3.1") == DENY
+
+
+def test_pattern_under_two_verdicts_takes_the_stricter():
+    policy = LicensePolicy.from_dict({"default": "allow", "allow": ["MIT", "BSD-*"], "review": ["BSD-*"],
+                                      "deny": ["mit"]})
+    assert verdict(policy, "MIT") == DENY
+    assert verdict(policy, "BSD-3-Clause") == REVIEW
+
+
+def test_exact_id_wins_over_glob_and_glob_over_category():
+    policy = LicensePolicy.from_dict({"allow": ["GPL-2.0-only"], "deny": ["GPL-*", "category:Permissive"],
+                                      "review": ["MI*"]})
+    assert verdict(policy, "GPL-2.0-only") == ALLOW
+    assert verdict(policy, "GPL-3.0-only") == DENY
+    assert verdict(policy, "MIT") == REVIEW
+    assert verdict(policy, "ISC") == DENY
+
+
+@pytest.mark.parametrize("pattern", ["category:permissive", "category:PERMISSIVE", "category:Public_Domain",
+                                     "category: strong-copyleft "])
+def test_category_names_ignore_case(pattern):
+    LicensePolicy.from_dict({"allow": [pattern]})
+
+
+@pytest.mark.parametrize("data", [{"allow": ["category:Copyleftish"]}, {"allow": "MIT"},
+                                  {"deny": ["MIT OR GPL-3.0-only"]}, {"default": "maybe"}, []])
+def test_invalid_policies(data):
+    with pytest.raises(PolicyError):
+        LicensePolicy.from_dict(data)
+
+
+def test_evaluate_waives_packages_and_skips_the_application():
+    store = ComponentStore()
+    store.add("app", "1.0.0", "GPL-3.0-only", "Application", "Production")
+    store.add("gpl-lib", "1.0.0", "GPL-3.0-only", "Direct", "Production")
+    store.add("waived", "2.0.0", "GPL-3.0-only", "Direct", "Production")
+    store.add("pinned", "1.0.0", "AGPL-3.0-only", "Direct", "Production")
+    store.add("pinned", "1.1.0", "AGPL-3.0-only", "Transitive", "Production")
+    store.add("mit-lib", "1.0.0", "MIT", "Direct", "Production")
+    policy = LicensePolicy.from_dict(dict(POLICY, waivers=["waived", "pinned@1.0.0"]))
+
+    result = policy.evaluate(store)
+
+    assert result.counts == {ALLOW: 3, DENY: 2}
+    assert result.waived == 2
+    assert [(v.name, v.version) for v in result.violations] == [("gpl-lib", "1.0.0"), ("pinned", "1.1.0")]
+    assert result.verdict == DENY and result.denied
+
+
+DEFAULT_PROJECT = {
+    "name": "Built-in", "version": "1.0.0", "vendor": "Vendor", "description": "Test project", "license": "MIT",
+    "report_date": "2026-01-01 00:00:00", "report_version": "1.0", "stack_summary": "Python",
+    "technology_stack": "Python", "build_tool": "pip", "package_manager": "pip",
+}
+
+
+@pytest.fixture
+def policy_run(tmp_path):
+    sbom = tmp_path / "app.cdx.json"
+    sbom.write_text(json.dumps({
+        "bomFormat": "CycloneDX", "specVersion": "1.5",
+        "components": [{"bom-ref": "a", "name": "a", "version": "1.0.0", "licenses": [{"license": {"id": "MIT"}}]},
+                       {"bom-ref": "b", "name": "b", "version": "1.0.0", "licenses": [{"license": {"id": "MPL-2.0"}}]}],
+    }), encoding="utf-8")
+
+    def run(command, policy, *options):
+        path = tmp_path / "policy.json"
+        path.write_text(json.dumps(policy), encoding="utf-8")
+        argv = [command, str(sbom), "--policy", str(path), *options]
+        if command == "render":
+            argv += ["-o", str(tmp_path / "report.pdf")]
+        else:
+            argv += ["-o", str(tmp_path / "verdicts.txt")]
+        return main(argv, DEFAULT_PROJECT, {})
+
+    return run
+
+
+def test_policy_exit_codes(policy_run):
+    assert policy_run("policy", POLICY) == EXIT_OK
+    assert policy_run("policy", POLICY, "--strict") == EXIT_POLICY_DENY
+    assert policy_run("policy", dict(POLICY, deny=["MIT"])) == EXIT_POLICY_DENY
+    assert policy_run("policy", dict(POLICY, waivers=["b"]), "--strict") == EXIT_OK
+
+
+def test_render_exits_3_on_deny(policy_run):
+    pytest.importorskip("reportlab")
+    assert policy_run("render", POLICY) == EXIT_OK
+    assert policy_run("render", dict(POLICY, deny=["MPL-2.0"])) == EXIT_POLICY_DENY
@@ -0,0 +1,28 @@
+from sbom_report.model import ComponentStore
+from sbom_report.portfolio import PortfolioAggregate, map_store
+from sbom_report.sbomdoc import TYPE_APPLICATION
+
+
+def make_store(application_license="Apache-2.0"):
+    store = ComponentStore()
+    store.add("payments-api", "2.0.0", application_license, TYPE_APPLICATION, "Production", "npm")
+    store.add("lodash", "4.17.21", "MIT", "Direct", "Production", "npm")
+    store.add("jest", "29.0.0", "MIT", "Direct", "Development", "npm")
+    return store
+
+
+def test_map_store_leaves_the_application_row_out_of_every_count():
+    partial = map_store("asset-1", make_store())
+    assert partial.components == 2 == len(partial.packages)
+    assert partial.by_scope == {"Production": 1, "Development": 1}
+    assert partial.license_ids == {"MIT": 2}
+    assert sum(partial.by_category.values()) == 2
+
+
+def test_aggregate_components_match_package_spread():
+    aggregate = PortfolioAggregate()
+    aggregate.merge(map_store("asset-1", make_store()))
+    aggregate.merge(map_store("asset-2", make_store("GPL-3.0-only")))
+    assert aggregate.components == 4
+    assert sum(assets for _, _, assets, _, _ in aggregate.top_packages()) == 4
+    assert [license_id for license_id, *_ in aggregate.license_exposure()] == ["MIT"]
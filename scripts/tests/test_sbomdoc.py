@@ -0,0 +1,38 @@
+import io
+import json
+
+from sbom_report.cache import report_key
+from sbom_report.sbomdoc import parse_purl, purl_type, read_sbom
+
+
+def test_parse_purl():
+    assert parse_purl("pkg:npm/%40babel/core@7.0.0") == ("npm", "@babel/core", "7.0.0")
+    assert parse_purl("pkg:maven/org.slf4j/slf4j-api@2.0.9?type=jar") == ("maven", "org.slf4j:slf4j-api", "2.0.9")
+    assert parse_purl("not-a-purl") == ("", "", "")
+    assert purl_type("pkg:PyPI/requests@2.0") == "pypi"
+
+
+def test_null_fields_load_as_empty_strings():
+    cyclonedx = {
+        "bomFormat": "CycloneDX", "specVersion": "1.5",
+        "metadata": {"component": {"name": "shop", "version": None, "bom-ref": "shop"}},
+        "components": [
+            {"bom-ref": "a", "name": "a", "version": None, "purl": None, "group": None,
+             "licenses": [{"expression": None}]},
+            {"bom-ref": None, "name": None, "version": "1.0.0"},
+        ],
+        "dependencies": [{"ref": "shop", "dependsOn": ["a", None]}, {"ref": None, "dependsOn": None}],
+    }
+    spdx = {
+        "spdxVersion": "SPDX-2.3", "SPDXID": "SPDXRef-DOCUMENT", "name": None,
+        "packages": [{"SPDXID": "SPDXRef-a", "name": None, "versionInfo": None,
+                      "externalRefs": [{"referenceType": "purl", "referenceLocator": None}]}],
+        "relationships": [{"spdxElementId": None, "relationshipType": "DEPENDS_ON", "relatedSpdxElement": "SPDXRef-a"}],
+    }
+    for document in (cyclonedx, spdx):
+        store = read_sbom(io.StringIO(json.dumps(document)))
+        for component in store.iter_components():
+            assert all(isinstance(value, str) for value in (component.name, component.version, component.purl,
+                                                            component.ref, component.license))
+        # The cache key joins every field, so a None anywhere would raise here
+        report_key(store, {"name": "x"})
@@ -0,0 +1,52 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from sbom_report import service
+from sbom_report.service import ReportService, RequestError, render_payload
+
+BASE_PROJECT = {"name": "Built-in", "vendor": "Vendor", "report_version": "1.0"}
+
+
+def _render_or_die(payload_path, *args):
+    """render_payload, except that a payload named crash.json kills the worker"""
+    if payload_path.endswith("crash.json"):
+        os._exit(1)
+    return render_payload(payload_path, *args)
+
+
+def test_broken_pool_is_replaced(tmp_path, monkeypatch):
+    pytest.importorskip("reportlab")
+    payload = tmp_path / "shop.cdx.json"
+    payload.write_text(json.dumps({
+        "bomFormat": "CycloneDX", "specVersion": "1.5",
+        "metadata": {"component": {"name": "shop", "version": "1.0.0"}},
+        "components": [{"bom-ref": "a", "name": "a", "version": "1.0.0"}],
+    }), encoding="utf-8")
+    output = str(tmp_path / "shop.pdf")
+    log = []
+    monkeypatch.setattr(service, "render_payload", _render_or_die)
+
+    async def scenario():
+        report_service = ReportService(BASE_PROJECT, workers=1, log=log.append)
+        await report_service.start()
+        try:
+            project = dict(report_service.base_project, report_date="2026-01-01 00:00:00")
+            broken = report_service.pool
+            with pytest.raises(RequestError) as error:
+                await report_service._run(str(tmp_path / "crash.json"), "auto", project, {}, output)
+            assert error.value.status == 503
+            assert report_service.pool is not broken
+
+            await report_service._run(str(payload), "auto", project, {}, output)
+            return report_service.health()
+        finally:
+            report_service.close()
+
+    health = asyncio.run(scenario())
+
+    assert (health["rendered"], health["failed"], health["in_flight"]) == (1, 1, 0)
+    assert os.path.getsize(output) > 0
+    assert any("new workers ready" in line for line in log)
@@ -0,0 +1,44 @@
+import io
+import json
+
+from sbom_report.portfolio import map_store
+from sbom_report.sbomdoc import read_sbom
+from sbom_report.stats import compute_stats
+
+CYCLONEDX = {
+    "bomFormat": "CycloneDX", "specVersion": "1.5",
+    "metadata": {"component": {"name": "shop", "version": "1.0.0", "bom-ref": "shop",
+                               "licenses": [{"license": {"id": "Apache-2.0"}}]}},
+    "components": [
+        {"bom-ref": "shop", "name": "shop", "version": "1.0.0", "type": "application",
+         "licenses": [{"license": {"id": "Apache-2.0"}}]},
+        {"bom-ref": "a", "name": "a", "version": "1.0.0", "purl": "pkg:npm/a@1.0.0",
+         "licenses": [{"license": {"id": "MIT"}}]},
+        {"bom-ref": "b", "name": "b", "version": "2.0.0", "purl": "pkg:npm/b@2.0.0",
+         "licenses": [{"license": {"id": "GPL-3.0-only"}}]},
+    ],
+    "dependencies": [{"ref": "shop", "dependsOn": ["a"]}, {"ref": "a", "dependsOn": ["b"]}],
+}
+
+
+def test_application_row_is_not_counted():
+    store = read_sbom(io.StringIO(json.dumps(CYCLONEDX)))
+    assert store.size == 3
+
+    stats = compute_stats(store)
+
+    assert stats.total == 2
+    assert stats.by_type == {"Direct": 1, "Transitive": 1}
+    assert stats.by_license_id == {"MIT": 1, "GPL-3.0-only": 1}
+    assert stats.by_ecosystem == {"npm": 2}
+    assert "Apache-2.0" not in stats.license_examples
+
+
+def test_summary_and_portfolio_agree():
+    store = read_sbom(io.StringIO(json.dumps(CYCLONEDX)))
+    stats = compute_stats(store)
+    partial = map_store("shop", store)
+
+    assert partial.components == stats.total == 2
+    assert partial.by_scope == stats.by_scope
+    assert partial.license_ids == stats.by_license_id